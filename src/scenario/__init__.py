@@ -426,6 +426,15 @@ __doc__ += """
 """
 from .stats import ExecTotalStats  # noqa: E402  ## Module level import not at top of file
 
+__doc__ += """
+.. py:attribute:: ResourceUsage
+
+    Alias of :class:`.stats.ResourceUsage`.
+
+    Describes the resource usage of a terminated sub-process: CPU times, max RSS, context switches and I/O blocks.
+"""
+from .stats import ResourceUsage  # noqa: E402  ## Module level import not at top of file
+
 __doc__ += """
 .. py:attribute:: stack
 
@@ -450,6 +459,15 @@ __doc__ += """
 # noinspection PyPep8Naming
 from .scenarioreport import SCENARIO_REPORT as report  # noqa: E402  ## Module level import not at top of file
 
+__doc__ += """
+.. py:attribute:: ScenarioReportSummary
+
+    Alias of :class:`.scenarioreport.ScenarioReportSummary`.
+
+    Scenario execution summary, as read from a JSON report in summary mode.
+"""
+from .scenarioreport import ScenarioReportSummary  # noqa: E402  ## Module level import not at top of file
+
 __doc__ += """
 .. py:attribute:: campaign_report
 
@@ -494,6 +512,22 @@ from .subprocess import SubProcess  # noqa: E402  ## Module level import not at
 if typing.TYPE_CHECKING:
     from .subprocess import VarSubProcessType
 
+__doc__ += """
+.. py:attribute:: SubProcessBatch
+
+    Alias of :class:`.subprocessbatch.SubProcessBatch`.
+
+    Executes a batch of sub-processes with a concurrency limit.
+
+
+.. py:attribute:: VarSubProcessBatchType
+
+    Alias of :class:`.subprocessbatch.VarSubProcessBatchType`.
+"""
+from .subprocessbatch import SubProcessBatch  # noqa: E402  ## Module level import not at top of file
+if typing.TYPE_CHECKING:
+    from .subprocessbatch import VarSubProcessBatchType
+
 __doc__ += """
 .. py:attribute:: CodeLocation
 
@@ -22,6 +22,8 @@ import typing
 
 # `ActionResultDefinition` used in method signatures.
 from .actionresultdefinition import ActionResultDefinition
+# `ExecMetrics` used in method signatures.
+from .stats import ExecMetrics
 
 
 class ActionResultExecution:
@@ -44,6 +46,10 @@ class ActionResultExecution:
         self.definition = definition  # type: ActionResultDefinition
         #: Time statistics.
         self.time = TimeStats()  # type: TimeStats
+        #: Execution metrics, when enabled.
+        #:
+        #: See :meth:`.scenarioconfig.ScenarioConfig.stepmetrics()`.
+        self.metrics = None  # type: typing.Optional[ExecMetrics]
         #: Evidence items.
         self.evidence = []  # type: typing.List[str]
         #: Sub-scenario executions.
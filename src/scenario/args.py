@@ -213,6 +213,13 @@ class Args(Logger, CommonConfigArgs, CommonLoggingArgs):
                 return False
 
         # Load configurations:
+        # - 0) load the configuration snapshot, if any,
+        if self.config_snapshot:
+            try:
+                CONFIG_DB.loadsnapshot(self.config_snapshot)
+            except Exception as _err:
+                MAIN_LOGGER.error(str(_err))
+                return False
         # - 1) load the single configuration values so that they are taken in account immediately,
         for _key in self.config_values:  # type: str
             try:
@@ -30,8 +30,8 @@ from .executionstatus import ExecutionStatus
 from .path import Path
 # `ScenarioExecution` used in method signatures.
 from .scenarioexecution import ScenarioExecution
-# `ExecTotalStats` and `TimeStats` used in method signatures.
-from .stats import ExecTotalStats, TimeStats
+# `ExecTotalStats`, `ResourceUsage` and `TimeStats` used in method signatures.
+from .stats import ExecTotalStats, ResourceUsage, TimeStats
 # `TestError` used in method signatures.
 from .testerrors import TestError
 
@@ -172,8 +172,7 @@ class TestSuiteExecution:
         """
         _stats = ExecTotalStats()  # type: ExecTotalStats
         for _test_case_execution in self.test_case_executions:  # type: TestCaseExecution
-            if _test_case_execution.scenario_execution:
-                _stats.add(_test_case_execution.scenario_execution.step_stats)
+            _stats.add(_test_case_execution.steps)
         return _stats
 
     @property
@@ -183,8 +182,7 @@ class TestSuiteExecution:
         """
         _stats = ExecTotalStats()  # type: ExecTotalStats
         for _test_case_execution in self.test_case_executions:  # type: TestCaseExecution
-            if _test_case_execution.scenario_execution:
-                _stats.add(_test_case_execution.scenario_execution.action_stats)
+            _stats.add(_test_case_execution.actions)
         return _stats
 
     @property
@@ -194,8 +192,7 @@ class TestSuiteExecution:
         """
         _stats = ExecTotalStats()  # type: ExecTotalStats
         for _test_case_execution in self.test_case_executions:  # type: TestCaseExecution
-            if _test_case_execution.scenario_execution:
-                _stats.add(_test_case_execution.scenario_execution.result_stats)
+            _stats.add(_test_case_execution.results)
         return _stats
 
     @property
@@ -206,11 +203,11 @@ class TestSuiteExecution:
         _stats = CampaignStats()  # type: CampaignStats
         _stats.total = len(self.test_case_executions)
         for _test_case_execution in self.test_case_executions:  # type: TestCaseExecution
-            if not _test_case_execution.scenario_execution:
+            if not (_test_case_execution.scenario_execution or _test_case_execution.json.summary):
                 _stats.errors += 1
-            elif _test_case_execution.scenario_execution.errors:
+            elif _test_case_execution.errors:
                 _stats.failures += 1
-            elif _test_case_execution.scenario_execution.warnings:
+            elif _test_case_execution.warnings:
                 _stats.warnings += 1
         return _stats
 
@@ -240,6 +237,8 @@ class TestCaseExecution:
         self.script_path = Path(script_path)  # type: Path
         #: Time statistics.
         self.time = TimeStats()  # type: TimeStats
+        #: Resource usage of the test case sub-process, when available.
+        self.rusage = None  # type: typing.Optional[ResourceUsage]
         #: Test case log output.
         self.log = LogFileReader()  # type: LogFileReader
         #: Test case JSON output.
@@ -269,6 +268,8 @@ class TestCaseExecution:
         """
         if self.scenario_execution:
             return self.scenario_execution.definition.name
+        elif self.json.summary:
+            return self.json.summary.name
         else:
             # Use the script pretty path by default (base info to constitute the scenario name actually).
             return self.script_path.prettypath
@@ -280,6 +281,8 @@ class TestCaseExecution:
         """
         if self.scenario_execution:
             return self.scenario_execution.status
+        elif self.json.summary:
+            return self.json.summary.status
         else:
             # FAIL by default.
             return ExecutionStatus.FAIL
@@ -291,6 +294,8 @@ class TestCaseExecution:
         """
         if self.scenario_execution:
             return self.scenario_execution.errors
+        elif self.json.summary:
+            return self.json.summary.errors
         return []
 
     @property
@@ -300,6 +305,8 @@ class TestCaseExecution:
         """
         if self.scenario_execution:
             return self.scenario_execution.warnings
+        elif self.json.summary:
+            return self.json.summary.warnings
         return []
 
     @property
@@ -309,6 +316,8 @@ class TestCaseExecution:
         """
         if self.scenario_execution:
             return self.scenario_execution.step_stats
+        elif self.json.summary:
+            return self.json.summary.step_stats
         return ExecTotalStats()
 
     @property
@@ -318,6 +327,8 @@ class TestCaseExecution:
         """
         if self.scenario_execution:
             return self.scenario_execution.action_stats
+        elif self.json.summary:
+            return self.json.summary.action_stats
         return ExecTotalStats()
 
     @property
@@ -327,6 +338,8 @@ class TestCaseExecution:
         """
         if self.scenario_execution:
             return self.scenario_execution.result_stats
+        elif self.json.summary:
+            return self.json.summary.result_stats
         return ExecTotalStats()
 
 
@@ -377,17 +390,39 @@ class LogFileReader:
         #: Test case log file content.
         self.content = None  # type: typing.Optional[bytes]
 
+    def locate(self):  # type: (...) -> bool
+        """
+        Checks whether the log file exists, possibly in its compressed form.
+
+        Fixes :attr:`path` with the compressed file path when only the compressed log file exists
+        (see :const:`.scenarioconfig.ScenarioConfig.Key.LOG_FILE_COMPRESS`).
+
+        :return: ``True`` when the log file exists, ``False`` otherwise.
+        """
+        from .compression import Compression
+
+        if self.path is None:
+            return False
+        _path = Compression.locate(self.path)  # type: typing.Optional[Path]
+        if _path is None:
+            return False
+        self.path = _path
+        return True
+
     def read(self):  # type: (...) -> bool
         """
         Read the log file.
 
+        Compressed log files are detected automatically, and decompressed on the fly.
+
         :return: ``True`` when the log file could be read successfully, ``False`` otherwise.
         """
+        from .compression import Compression
         from .loggermain import MAIN_LOGGER
 
         try:
             if self.path:
-                self.content = self.path.read_bytes()
+                self.content = Compression.readbytes(self.path)
                 return True
             else:
                 MAIN_LOGGER.error("No log path to read")
@@ -403,27 +438,59 @@ class JsonReportReader:
 
     def __init__(self):  # type: (...) -> None
         """
-        Initializes :attr:`path` and :attr:`content` attributes with ``None``.
+        Initializes :attr:`path`, :attr:`content` and :attr:`summary` attributes with ``None``.
         """
         from .scenariodefinition import ScenarioDefinition
+        from .scenarioreport import ScenarioReportSummary
         from .path import Path
 
         #: Test case JSON file path.
         self.path = None  # type: typing.Optional[Path]
         #: Scenario execution data read from the test case JSON file.
         self.content = None  # type: typing.Optional[ScenarioDefinition]
+        #: Scenario execution summary read from the test case JSON file, when read in summary mode.
+        self.summary = None  # type: typing.Optional[ScenarioReportSummary]
 
-    def read(self):  # type: (...) -> bool
+    def locate(self):  # type: (...) -> bool
+        """
+        Checks whether the JSON report exists, possibly in its compressed form.
+
+        Fixes :attr:`path` with the compressed file path when only the compressed JSON report exists
+        (see :const:`.scenarioconfig.ScenarioConfig.Key.REPORT_COMPRESSION`).
+
+        :return: ``True`` when the JSON report exists, ``False`` otherwise.
+        """
+        from .compression import Compression
+
+        if self.path is None:
+            return False
+        _path = Compression.locate(self.path)  # type: typing.Optional[Path]
+        if _path is None:
+            return False
+        self.path = _path
+        return True
+
+    def read(
+            self,
+            summary=False,  # type: bool
+    ):  # type: (...) -> bool
         """
         Read the JSON report.
 
+        :param summary:
+            ``True`` to read a summary of the JSON report only, into :attr:`summary`.
+            See :meth:`.scenarioreport.ScenarioReport.readjsonsummary()`.
         :return: ``True`` when the JSON report file could be read and parsed successfully, ``False`` otherwise.
         """
         from .loggermain import MAIN_LOGGER
         from .scenarioreport import SCENARIO_REPORT
 
-        if self.path:
-            self.content = SCENARIO_REPORT.readjsonreport(self.path)
-        else:
+        if not self.path:
             MAIN_LOGGER.error("No JSON path to read")
-        return self.content is not None
+            return False
+        if summary:
+            self.summary = SCENARIO_REPORT.readjsonsummary(self.path)
+            return self.summary is not None
+        else:
+            self.content = SCENARIO_REPORT.readjsonreport(self.path)
+            return self.content is not None
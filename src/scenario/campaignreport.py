@@ -34,6 +34,9 @@ if typing.TYPE_CHECKING:
     # `Path` used in method signatures.
     # Type declared for type checking only.
     from .path import AnyPathType
+    # `JSONDict` used in method signatures.
+    # Type declared for type checking only.
+    from .typing import JSONDict
 
 
 class CampaignReport(Logger):
@@ -56,6 +59,10 @@ class CampaignReport(Logger):
 
         #: JUnit report path being written or read.
         self._junit_path = Path()  # type: Path
+        #: ``True`` when reading the JSON reports of test cases in summary mode.
+        #:
+        #: See :meth:`readjunitreport()`.
+        self._summary = False  # type: bool
 
     def writejunitreport(
             self,
@@ -68,8 +75,13 @@ class CampaignReport(Logger):
         :param campaign_execution: Campaign execution to generate the report for.
         :param junit_path: Path to write the JUnit report into.
         :return: ``True`` for success, ``False`` otherwise.
+
+        When :meth:`.scenarioconfig.ScenarioConfig.reportcompression()` is set,
+        the JUnit report file is eventually compressed, and renamed with the compression suffix.
         """
+        from .compression import Compression
         from .loggermain import MAIN_LOGGER
+        from .scenarioconfig import SCENARIO_CONFIG
 
         try:
             self.resetindentation()
@@ -84,6 +96,12 @@ class CampaignReport(Logger):
             # Generate the JUnit XML outfile.
             _xml_doc.write(junit_path)
 
+            # Compress the JUnit XML outfile when required.
+            _compression = SCENARIO_CONFIG.reportcompression()  # type: typing.Optional[Compression]
+            if _compression is not None:
+                self.debug("Compressing JUnit report '%s' with %s", junit_path, _compression)
+                _compression.compressfile(junit_path)
+
             return True
         except Exception as _err:
             MAIN_LOGGER.error(f"Could not write JUnit report '{junit_path}': {_err}")
@@ -95,27 +113,39 @@ class CampaignReport(Logger):
     def readjunitreport(
             self,
             junit_path,  # type: AnyPathType
+            summary=False,  # type: bool
     ):  # type: (...) -> typing.Optional[CampaignExecution]
         """
         Reads the JUnit report.
 
-        :param junit_path: Path of the JUnit file to read.
+        :param junit_path:
+            Path of the JUnit file to read.
+            When it does not exist, its compressed form is searched for.
+            Compressed files are detected automatically, and decompressed on the fly.
+        :param summary:
+            ``True`` to read the JSON reports of test cases in summary mode only
+            (see :meth:`.scenarioreport.ScenarioReport.readjsonsummary()`),
+            and not to load test case log files,
+            which saves memory and time when aggregating numerous test cases.
+
+            Test case statuses, errors, warnings and statistics remain available,
+            but :attr:`.campaignexecution.TestCaseExecution.scenario_execution` is not set.
         :return:
             Campaign execution data read from the JUnit file.
             ``None`` when the file could not be read, or its content could not be parsed successfully.
+
+        The JUnit file is read incrementally (see :meth:`iterjunitreport()`).
         """
         from .loggermain import MAIN_LOGGER
 
         try:
             self.resetindentation()
-            self.debug("Reading campaign results from JUnit report '%s'", junit_path)
-
-            # Read and parse the JUnit XML file.
-            _xml_doc = Xml.Document.read(junit_path)  # type: Xml.Document
 
-            # Analyze the JSON content.
-            self._junit_path = Path(junit_path)
-            _campaign_execution = self._xml2campaign(_xml_doc)  # type: CampaignExecution
+            _campaign_execution = None  # type: typing.Optional[CampaignExecution]
+            for _execution in self.iterjunitreport(junit_path, summary=summary):  # type: typing.Union[CampaignExecution, TestSuiteExecution, TestCaseExecution]
+                if isinstance(_execution, CampaignExecution):
+                    _campaign_execution = _execution
+            assert _campaign_execution, "No <testsuites/> node"
 
             return _campaign_execution
         except Exception as _err:
@@ -125,6 +155,76 @@ class CampaignReport(Logger):
         finally:
             self.resetindentation()
 
+    def iterjunitreport(
+            self,
+            junit_path,  # type: AnyPathType
+            summary=False,  # type: bool
+    ):  # type: (...) -> typing.Iterator[typing.Union[CampaignExecution, TestSuiteExecution, TestCaseExecution]]
+        """
+        Reads the JUnit report incrementally.
+
+        :param junit_path: Path of the JUnit file to read. See :meth:`readjunitreport()`.
+        :param summary: Summary mode. See :meth:`readjunitreport()`.
+        :return:
+            Iterator of execution objects, in the order of the JUnit file:
+
+            - the campaign execution first, with its attributes,
+            - each test suite execution, as it starts, with its attributes,
+            - each test case execution, once read, after it has been appended to its test suite execution.
+        :raise Exception: When the file could not be read, or its content could not be parsed successfully.
+
+        The JUnit XML file is not loaded as a whole,
+        and the ``<system-out/>`` content of test cases is skipped (test case logs are read from the log files),
+        which bounds the memory used by the XML data.
+        """
+        from .compression import Compression
+
+        self.debug("Reading campaign results from JUnit report '%s'", junit_path)
+
+        # Find out the JUnit XML file, possibly compressed.
+        self._junit_path = Compression.locate(junit_path) or Path(junit_path)
+        self._summary = summary
+
+        # Read and analyze the JUnit XML file, node by node.
+        _campaign_execution = None  # type: typing.Optional[CampaignExecution]
+        _test_suite_execution = None  # type: typing.Optional[TestSuiteExecution]
+        for _event, _xml_node in Xml.iterparse(self._junit_path, expand=["testcase"], skip=["system-out"]):  # type: str, Xml.Node
+            if _campaign_execution is None:
+                assert _xml_node.tag_name == "testsuites", "Root node should be a <testsuites/> node"
+
+            if _xml_node.tag_name == "testsuites":
+                if _event == "start":
+                    _campaign_execution = self._xml2campaign(_xml_node)
+                    yield _campaign_execution
+                else:
+                    assert _campaign_execution
+                    self._xmlcheckcampaignstats(_xml_node, _campaign_execution)
+
+            elif _xml_node.tag_name == "testsuite":
+                assert _campaign_execution
+                if _event == "start":
+                    self.debug("New testsuites/testsuite")
+                    self.pushindentation()
+                    _test_suite_execution = self._xml2testsuite(_campaign_execution, _xml_node)
+                    _campaign_execution.test_suite_executions.append(_test_suite_execution)
+                    yield _test_suite_execution
+                else:
+                    assert _test_suite_execution
+                    self._xmlchecktestsuitestats(_xml_node, _test_suite_execution)
+                    self.popindentation()
+                    _test_suite_execution = None
+
+            elif _xml_node.tag_name == "testcase":
+                assert _test_suite_execution, "<testcase/> node out of a <testsuite/> node"
+                self.debug("New testsuite/testcase")
+                try:
+                    self.pushindentation()
+                    _test_case_execution = self._xml2testcase(_test_suite_execution, _xml_node)  # type: TestCaseExecution
+                finally:
+                    self.popindentation()
+                _test_suite_execution.test_case_executions.append(_test_case_execution)
+                yield _test_case_execution
+
     def _campaign2xml(
             self,
             xml_doc,  # type: Xml.Document
@@ -187,53 +287,53 @@ class CampaignReport(Logger):
 
     def _xml2campaign(
             self,
-            xml_doc,  # type: Xml.Document
+            xml_test_suites,  # type: Xml.Node
     ):  # type: (...) -> CampaignExecution
         """
         Campaign execution reading from JUnit report.
 
-        :param xml_doc: JUnit XML document to read from.
-        :return: Campaign execution data.
+        :param xml_test_suites: JUnit ``<testsuites/>`` node to read from, without its children.
+        :return: Campaign execution data, without test suites.
         """
         _campaign_execution = CampaignExecution(outdir=self._junit_path.parent)  # type: CampaignExecution
 
-        _xml_test_suites = xml_doc.root  # type: Xml.Node
-        assert _xml_test_suites.tag_name == "testsuites", "Root node should be a <testsuites/> node"
-
-        if _xml_test_suites.hasattr("disabled"):
-            _campaign_execution.counts.disabled = int(_xml_test_suites.getattr("disabled"))
+        if xml_test_suites.hasattr("disabled"):
+            _campaign_execution.counts.disabled = int(xml_test_suites.getattr("disabled"))
             self.debug("testsuites/@disabled = %d", _campaign_execution.counts.disabled)
-        if _xml_test_suites.hasattr("errors"):
-            _campaign_execution.counts.errors = int(_xml_test_suites.getattr("errors"))
+        if xml_test_suites.hasattr("errors"):
+            _campaign_execution.counts.errors = int(xml_test_suites.getattr("errors"))
             self.debug("testsuites/@errors = %d", _campaign_execution.counts.errors)
-        if _xml_test_suites.hasattr("failures"):
-            _campaign_execution.counts.failures = int(_xml_test_suites.getattr("failures"))
+        if xml_test_suites.hasattr("failures"):
+            _campaign_execution.counts.failures = int(xml_test_suites.getattr("failures"))
             self.debug("testsuites/@failures = %d", _campaign_execution.counts.failures)
-        if _xml_test_suites.hasattr("tests"):
-            _campaign_execution.counts.total = int(_xml_test_suites.getattr("tests"))
+        if xml_test_suites.hasattr("tests"):
+            _campaign_execution.counts.total = int(xml_test_suites.getattr("tests"))
             self.debug("testsuites/@tests = %d", _campaign_execution.counts.total)
-        if _xml_test_suites.hasattr("time"):
-            _campaign_execution.time.elapsed = float(_xml_test_suites.getattr("time"))
+        if xml_test_suites.hasattr("time"):
+            _campaign_execution.time.elapsed = float(xml_test_suites.getattr("time"))
             self.debug("testsuites/@time = %f", _campaign_execution.time.elapsed)
 
-        for _xml_test_suite in _xml_test_suites.getchildren("testsuite"):  # type: Xml.Node
-            self.debug("New testsuites/testsuite")
-            try:
-                self.pushindentation()
-                _campaign_execution.test_suite_executions.append(self._xml2testsuite(_campaign_execution, _xml_test_suite))
-            finally:
-                self.popindentation()
-
-        # Eventually check the `scenario` statistics, which are properties of :class:`.campaignexecution.CampaignExecution`.
-        self._xmlcheckstats(_xml_test_suites, "steps-executed", _campaign_execution.test_suite_executions)
-        self._xmlcheckstats(_xml_test_suites, "steps-total", _campaign_execution.test_suite_executions)
-        self._xmlcheckstats(_xml_test_suites, "actions-total", _campaign_execution.test_suite_executions)
-        self._xmlcheckstats(_xml_test_suites, "actions-executed", _campaign_execution.test_suite_executions)
-        self._xmlcheckstats(_xml_test_suites, "results-total", _campaign_execution.test_suite_executions)
-        self._xmlcheckstats(_xml_test_suites, "results-executed", _campaign_execution.test_suite_executions)
-
         return _campaign_execution
 
+    def _xmlcheckcampaignstats(
+            self,
+            xml_test_suites,  # type: Xml.Node
+            campaign_execution,  # type: CampaignExecution
+    ):  # type: (...) -> None
+        """
+        Checks the `scenario` statistics of a campaign read from JUnit report,
+        which are properties of :class:`.campaignexecution.CampaignExecution`.
+
+        :param xml_test_suites: JUnit ``<testsuites/>`` node read.
+        :param campaign_execution: Campaign execution data read, with its test suites.
+        """
+        self._xmlcheckstats(xml_test_suites, "steps-executed", campaign_execution.test_suite_executions)
+        self._xmlcheckstats(xml_test_suites, "steps-total", campaign_execution.test_suite_executions)
+        self._xmlcheckstats(xml_test_suites, "actions-total", campaign_execution.test_suite_executions)
+        self._xmlcheckstats(xml_test_suites, "actions-executed", campaign_execution.test_suite_executions)
+        self._xmlcheckstats(xml_test_suites, "results-total", campaign_execution.test_suite_executions)
+        self._xmlcheckstats(xml_test_suites, "results-executed", campaign_execution.test_suite_executions)
+
     def _testsuite2xml(
             self,
             xml_doc,  # type: Xml.Document
@@ -329,8 +429,8 @@ class CampaignReport(Logger):
         Test suite reading from JUnit report.
 
         :param campaign_execution: Owner campaign execution instance.
-        :param xml_test_suite: JUnit XML to read from.
-        :return: Test suite execution data.
+        :param xml_test_suite: JUnit ``<testsuite/>`` node to read from, without its children.
+        :return: Test suite execution data, without test cases.
         """
         from .datetimeutils import f2strtime, fromiso8601, toiso8601
         from .debugutils import callback
@@ -367,24 +467,27 @@ class CampaignReport(Logger):
                 _test_suite_execution.time.end = _test_suite_execution.time.start + _test_suite_execution.time.elapsed
                 self.debug("testsuite/@timestamp + elapsed => end = %s", callback(f2strtime, _test_suite_execution.time.end))
 
-        for _xml_test_case in xml_test_suite.getchildren("testcase"):  # type: Xml.Node
-            self.debug("New testsuite/testcase")
-            try:
-                self.pushindentation()
-                _test_suite_execution.test_case_executions.append(self._xml2testcase(_test_suite_execution, _xml_test_case))
-            finally:
-                self.popindentation()
-
-        # Eventually check the `scenario` statistics, which are properties of :class:`.campaignexecution.TestSuite`.
-        self._xmlcheckstats(xml_test_suite, "steps-executed", _test_suite_execution.test_case_executions)
-        self._xmlcheckstats(xml_test_suite, "steps-total", _test_suite_execution.test_case_executions)
-        self._xmlcheckstats(xml_test_suite, "actions-total", _test_suite_execution.test_case_executions)
-        self._xmlcheckstats(xml_test_suite, "actions-executed", _test_suite_execution.test_case_executions)
-        self._xmlcheckstats(xml_test_suite, "results-total", _test_suite_execution.test_case_executions)
-        self._xmlcheckstats(xml_test_suite, "results-executed", _test_suite_execution.test_case_executions)
-
         return _test_suite_execution
 
+    def _xmlchecktestsuitestats(
+            self,
+            xml_test_suite,  # type: Xml.Node
+            test_suite_execution,  # type: TestSuiteExecution
+    ):  # type: (...) -> None
+        """
+        Checks the `scenario` statistics of a test suite read from JUnit report,
+        which are properties of :class:`.campaignexecution.TestSuiteExecution`.
+
+        :param xml_test_suite: JUnit ``<testsuite/>`` node read.
+        :param test_suite_execution: Test suite execution data read, with its test cases.
+        """
+        self._xmlcheckstats(xml_test_suite, "steps-executed", test_suite_execution.test_case_executions)
+        self._xmlcheckstats(xml_test_suite, "steps-total", test_suite_execution.test_case_executions)
+        self._xmlcheckstats(xml_test_suite, "actions-total", test_suite_execution.test_case_executions)
+        self._xmlcheckstats(xml_test_suite, "actions-executed", test_suite_execution.test_case_executions)
+        self._xmlcheckstats(xml_test_suite, "results-total", test_suite_execution.test_case_executions)
+        self._xmlcheckstats(xml_test_suite, "results-executed", test_suite_execution.test_case_executions)
+
     def _testcase2xml(
             self,
             xml_doc,  # type: Xml.Document
@@ -430,6 +533,19 @@ class CampaignReport(Logger):
         _xml_test_case.setattr("results-executed", str(test_case_execution.results.executed))
         _xml_test_case.setattr("results-total", str(test_case_execution.results.total))
 
+        # testcase/properties:
+        # Non JUnit standard at the test case level (only testsuite/properties is described in [CUBIC]),
+        # but commonly supported by JUnit report consumers.
+        # Resource usage of the test case sub-process, when available.
+        if test_case_execution.rusage is not None:
+            _xml_properties = _xml_test_case.appendchild(xml_doc.createnode("properties"))  # type: Xml.Node
+            _rusage_json = test_case_execution.rusage.tojson()  # type: JSONDict
+            for _rusage_field in _rusage_json:  # type: str
+                # testcase/properties/property[@name='rusage.*']:
+                _xml_property = _xml_properties.appendchild(xml_doc.createnode("property"))  # type: Xml.Node
+                _xml_property.setattr("name", f"rusage.{_rusage_field}")
+                _xml_property.setattr("value", str(_rusage_json[_rusage_field]))
+
         # Set references to the log and JSON outfiles.
         # Non JUnit standard...
         # Syntax inspired from HTML '<link rel="stylesheet" type="text/css" href=""/>' items.
@@ -508,6 +624,7 @@ class CampaignReport(Logger):
         from .executionstatus import ExecutionStatus
         from .knownissues import KnownIssue
         from .locations import CodeLocation
+        from .stats import ResourceUsage
         from .testerrors import ExceptionError, TestError
 
         # Note: The testcase/@name attribute is filled with the pretty path.
@@ -522,25 +639,42 @@ class CampaignReport(Logger):
             _test_case_execution.time.elapsed = float(xml_test_case.getattr("time"))
             self.debug("testcase/@time = %f", _test_case_execution.time.elapsed)
 
+        for _xml_properties in xml_test_case.getchildren("properties"):  # type: Xml.Node
+            _rusage_json = {}  # type: JSONDict
+            for _xml_property in _xml_properties.getchildren("property"):  # type: Xml.Node
+                if _xml_property.getattr("name").startswith("rusage."):
+                    _value = _xml_property.getattr("value")  # type: str
+                    _rusage_json[_xml_property.getattr("name")[len("rusage."):]] = float(_value) if ("." in _value) else int(_value)
+            if _rusage_json:
+                _test_case_execution.rusage = ResourceUsage.fromjson(_rusage_json)
+                self.debug("testcase/properties/property[@name='rusage.*'] = %s", _test_case_execution.rusage)
+
         for _xml_link in xml_test_case.getchildren("link"):
             if _xml_link.getattr("rel") == "log":
                 _test_case_execution.log.path = self._xmlattr2path(_xml_link, "href")
                 self.debug("testcase/link[@rel='log']/@href = '%s'", _test_case_execution.log.path)
-                # Read the log file by the way.
-                _test_case_execution.log.read()
+                # Read the log file by the way (possibly compressed), unless reading in summary mode.
+                _test_case_execution.log.locate()
+                if not self._summary:
+                    _test_case_execution.log.read()
             if _xml_link.getattr("rel") == "report":
                 _test_case_execution.json.path = self._xmlattr2path(_xml_link, "href")
                 self.debug("testcase/link[@rel='report']/@href = '%s'", _test_case_execution.json.path)
-                # Read the JSON report by the way.
-                _test_case_execution.json.read()
+                # Read the JSON report by the way (possibly compressed).
+                _test_case_execution.json.locate()
+                _test_case_execution.json.read(summary=self._summary)
 
         # Failures have already been filled by reading the JSON report above.
         # Let's reset them, and build them again (at the scenario level only), this time from the JUnit report information.
+        _errors = None  # type: typing.Optional[typing.List[TestError]]
         if _test_case_execution.scenario_execution:
-            _test_case_execution.scenario_execution.errors = []
+            _errors = _test_case_execution.scenario_execution.errors = []
+        elif _test_case_execution.json.summary:
+            _errors = _test_case_execution.json.summary.errors = []
+        if _errors is not None:
             for _xml_failure in xml_test_case.getchildren("failure"):  # type: Xml.Node
                 self.debug("New testcase/failure")
-                if _xml_failure.hasattr("message") and _test_case_execution.scenario_execution:
+                if _xml_failure.hasattr("message"):
                     _error = TestError(_xml_failure.getattr("message"))  # type: TestError
                     self.debug("testcase/failure/@message = %r", _error.message)
                     if _xml_failure.hasattr("type"):
@@ -558,7 +692,7 @@ class CampaignReport(Logger):
                         if _last_line.count(":") >= 3:
                             _error.location = CodeLocation.fromlongstring(":".join(_last_line.split(":")[:3]))
                             self.debug("testcase/failure/@location = '%s'", _error.location.tolongstring())
-                    _test_case_execution.scenario_execution.errors.append(_error)
+                    _errors.append(_error)
         if xml_test_case.hasattr("status"):
             self.debug("testcase/@status = %r", xml_test_case.getattr("status"))
             if _test_case_execution.errors and (xml_test_case.getattr("status") != str(ExecutionStatus.FAIL)):
@@ -566,14 +700,15 @@ class CampaignReport(Logger):
             if (not _test_case_execution.errors) and (xml_test_case.getattr("status") == str(ExecutionStatus.FAIL)):
                 self.warning(f"Mismatching status {xml_test_case.getattr('status')!r} while no error")
 
-        if _test_case_execution.scenario_execution:
+        _scenario_stats = _test_case_execution.scenario_execution or _test_case_execution.json.summary  # type: typing.Any
+        if _scenario_stats:
             # Check the `scenario` statistics, which are properties of :class:`.campaignexecution.TestCase`.
-            self._xmlcheckstats(xml_test_case, "steps-executed", [_test_case_execution.scenario_execution])
-            self._xmlcheckstats(xml_test_case, "steps-total", [_test_case_execution.scenario_execution])
-            self._xmlcheckstats(xml_test_case, "actions-total", [_test_case_execution.scenario_execution])
-            self._xmlcheckstats(xml_test_case, "actions-executed", [_test_case_execution.scenario_execution])
-            self._xmlcheckstats(xml_test_case, "results-total", [_test_case_execution.scenario_execution])
-            self._xmlcheckstats(xml_test_case, "results-executed", [_test_case_execution.scenario_execution])
+            self._xmlcheckstats(xml_test_case, "steps-executed", [_scenario_stats])
+            self._xmlcheckstats(xml_test_case, "steps-total", [_scenario_stats])
+            self._xmlcheckstats(xml_test_case, "actions-total", [_scenario_stats])
+            self._xmlcheckstats(xml_test_case, "actions-executed", [_scenario_stats])
+            self._xmlcheckstats(xml_test_case, "results-total", [_scenario_stats])
+            self._xmlcheckstats(xml_test_case, "results-executed", [_scenario_stats])
 
         return _test_case_execution
 
@@ -648,6 +783,7 @@ class CampaignReport(Logger):
         Displays warnings when the statistics mismatch.
         """
         from .scenarioexecution import ScenarioExecution
+        from .scenarioreport import ScenarioReportSummary
 
         assert attr_name.count("-") == 1
         _stat_type, _exec_total = attr_name.split("-")  # type: str, str
@@ -657,7 +793,7 @@ class CampaignReport(Logger):
             _object_type = ""  # type: str
             for _object in objects:
                 _object_type = type(_object).__name__ + " "
-                if isinstance(_object, ScenarioExecution):
+                if isinstance(_object, (ScenarioExecution, ScenarioReportSummary)):
                     _sum += getattr(getattr(_object, _stat_type[:-1] + "_stats"), _exec_total)
                 elif isinstance(_object, (TestSuiteExecution, TestCaseExecution)):
                     _sum += getattr(getattr(_object, _stat_type), _exec_total)
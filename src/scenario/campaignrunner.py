@@ -19,8 +19,11 @@ Campaign execution management.
 """
 
 import logging
+import os
 import re
+import shutil
 import sys
+import tempfile
 import time
 import typing
 
@@ -30,11 +33,16 @@ from .campaignexecution import CampaignExecution, TestCaseExecution, TestSuiteEx
 from .errcodes import ErrorCode
 # `Logger` used for inheritance.
 from .logger import Logger
+# `TRACER` used for method decoration.
+from .tracing import TRACER
 
 if typing.TYPE_CHECKING:
     # `AnyPathType` used in method signatures.
     # Type declared for type checking only.
     from .path import AnyPathType
+    # `Path` used in method signatures.
+    # Type declared for type checking only.
+    from .path import Path
 
 
 class CampaignRunner(Logger):
@@ -59,6 +67,15 @@ class CampaignRunner(Logger):
 
         Logger.__init__(self, log_class=DebugClass.CAMPAIGN_RUNNER)
 
+        #: Configuration snapshot file handed over to scenario subprocesses.
+        #:
+        #: ``None`` when no snapshot could be saved: configuration files and values are passed on the command line in that case.
+        self._config_snapshot_path = None  # type: typing.Optional[Path]
+        #: Temporary configuration cache directory shared by scenario subprocesses, when no configuration snapshot could be saved.
+        #:
+        #: ``None`` when a configuration snapshot has been saved, or when the configuration cache directory is already set.
+        self._config_cache_dir = None  # type: typing.Optional[Path]
+
     def main(self):  # type: (...) -> ErrorCode
         """
         Campaign runner main function, as a member method.
@@ -92,8 +109,9 @@ class CampaignRunner(Logger):
                 _outdir = CampaignArgs.getinstance().outdir
             _outdir.mkdir(parents=True, exist_ok=True)
 
-            # Start log features.
+            # Start log and tracing features.
             LOGGING_SERVICE.start()
+            TRACER.start()
 
             _campaign_execution = CampaignExecution(_outdir)  # type: CampaignExecution
             HANDLERS.callhandlers(ScenarioEvent.BEFORE_CAMPAIGN, ScenarioEventData.Campaign(campaign_execution=_campaign_execution))
@@ -101,10 +119,15 @@ class CampaignRunner(Logger):
             CAMPAIGN_LOGGING.begincampaign(_campaign_execution)
             _campaign_execution.time.setstarttime()
 
-            for _test_suite_path in CampaignArgs.getinstance().test_suite_paths:  # type: Path
-                _res = self._exectestsuitefile(_campaign_execution, _test_suite_path)  # type: ErrorCode
-                if _res != ErrorCode.SUCCESS:
-                    return _res
+            self._saveconfigsnapshot()
+            try:
+                with TRACER.span("CampaignRunner.main(): campaign"):
+                    for _test_suite_path in CampaignArgs.getinstance().test_suite_paths:  # type: Path
+                        _res = self._exectestsuitefile(_campaign_execution, _test_suite_path)  # type: ErrorCode
+                        if _res != ErrorCode.SUCCESS:
+                            return _res
+            finally:
+                self._removeconfigsnapshot()
 
             _campaign_execution.time.setendtime()
             CAMPAIGN_REPORT.writejunitreport(_campaign_execution, _campaign_execution.junit_path)
@@ -115,7 +138,8 @@ class CampaignRunner(Logger):
             # Display final results.
             SCENARIO_RESULTS.display()
 
-            # Terminate log features.
+            # Terminate tracing and log features.
+            TRACER.stop()
             LOGGING_SERVICE.stop()
 
             return ErrorCode.SUCCESS
@@ -123,6 +147,49 @@ class CampaignRunner(Logger):
         except Exception as _err:
             ExceptionError(_err).logerror(MAIN_LOGGER, logging.ERROR)
             return ErrorCode.INTERNAL_ERROR
+        finally:
+            TRACER.stop()
+
+    def _saveconfigsnapshot(self):  # type: (...) -> None
+        """
+        Freezes the campaign configuration into a temporary snapshot file, for scenario subprocesses.
+
+        Sets :attr:`_config_snapshot_path` on success.
+        Otherwise, sets :attr:`_config_cache_dir` with a temporary directory, if no configuration cache directory is already set.
+        """
+        from .configdb import CONFIG_DB
+        from .path import Path
+        from .scenarioconfig import SCENARIO_CONFIG
+
+        _fd, _path = tempfile.mkstemp(prefix="scenario-config-", suffix=".pickle")  # type: int, str
+        os.close(_fd)
+        try:
+            CONFIG_DB.savesnapshot(_path)
+            self._config_snapshot_path = Path(_path)
+            self.debug("Configuration snapshot saved in '%s'", self._config_snapshot_path)
+        except Exception as _err:
+            # Configuration data that cannot be pickled for instance.
+            self.debug("Could not save a configuration snapshot: %s", _err)
+            self.debug("=> configuration files and values will be passed on the command line")
+            os.remove(_path)
+
+            # Make scenario subprocesses share a configuration cache, if not already set.
+            if SCENARIO_CONFIG.configcachedir() is None:
+                self._config_cache_dir = Path(tempfile.mkdtemp(prefix="scenario-config-cache-"))
+                self.debug("Configuration cache directory: '%s'", self._config_cache_dir)
+
+    def _removeconfigsnapshot(self):  # type: (...) -> None
+        """
+        Removes the temporary configuration snapshot file, or the temporary configuration cache directory, if any.
+        """
+        if self._config_snapshot_path is not None:
+            self.debug("Removing configuration snapshot '%s'", self._config_snapshot_path)
+            self._config_snapshot_path.unlink()
+            self._config_snapshot_path = None
+        if self._config_cache_dir is not None:
+            self.debug("Removing configuration cache directory '%s'", self._config_cache_dir)
+            shutil.rmtree(self._config_cache_dir, ignore_errors=True)
+            self._config_cache_dir = None
 
     def _exectestsuitefile(
             self,
@@ -142,6 +209,7 @@ class CampaignRunner(Logger):
 
         return _res
 
+    @TRACER.traced("CampaignRunner._exectestsuite()")
     def _exectestsuite(
             self,
             test_suite_execution,  # type: TestSuiteExecution
@@ -157,6 +225,9 @@ class CampaignRunner(Logger):
         from .path import Path
         from .scenarioevents import ScenarioEvent, ScenarioEventData
 
+        if TRACER.enabled:
+            TRACER.annotate(test_suite=test_suite_execution.test_suite_file.path)
+
         HANDLERS.callhandlers(ScenarioEvent.BEFORE_TEST_SUITE, ScenarioEventData.TestSuite(test_suite_execution=test_suite_execution))
 
         CAMPAIGN_LOGGING.begintestsuite(test_suite_execution)
@@ -181,6 +252,7 @@ class CampaignRunner(Logger):
 
         return ErrorCode.worst(_error_codes)
 
+    @TRACER.traced("CampaignRunner._exectestcase()")
     def _exectestcase(
             self,
             test_case_execution,  # type: TestCaseExecution
@@ -196,7 +268,6 @@ class CampaignRunner(Logger):
         from .configdb import CONFIG_DB
         from .confignode import ConfigNode
         from .datetimeutils import f2strduration, ISO8601_REGEX
-        from .debugloggers import ExecTimesLogger
         from .handlers import HANDLERS
         from .path import Path
         from .scenarioconfig import SCENARIO_CONFIG
@@ -207,13 +278,12 @@ class CampaignRunner(Logger):
         from .subprocess import SubProcess
         from .testerrors import TestError
 
-        _exec_times_logger = ExecTimesLogger("CampaignRunner._exectestcase()")  # type: ExecTimesLogger
+        if TRACER.enabled:
+            TRACER.annotate(test_case=test_case_execution.script_path)
 
         HANDLERS.callhandlers(ScenarioEvent.BEFORE_TEST_CASE, ScenarioEventData.TestCase(test_case_execution=test_case_execution))
-        _exec_times_logger.tick("After *before-test-case* handlers")
 
         CAMPAIGN_LOGGING.begintestcase(test_case_execution)
-        _exec_times_logger.tick("Starting test case")
         test_case_execution.time.setstarttime()
 
         # Prepare output paths.
@@ -233,17 +303,30 @@ class CampaignRunner(Logger):
 
         # Prepare the command line.
         _subprocess = SubProcess(sys.executable, SCENARIO_CONFIG.runnerscriptpath())  # type: SubProcess
-        # Report configuration files and single configuration values from campaign to scenario execution.
-        for _config_path in CampaignArgs.getinstance().config_paths:  # type: Path
-            _subprocess.addargs("--config-file", _config_path)
-        for _config_name in CampaignArgs.getinstance().config_values:  # type: str
-            _subprocess.addargs("--config-value", _config_name, CampaignArgs.getinstance().config_values[_config_name])
+        # Hand the campaign configuration over to scenario execution with a single snapshot file.
+        if self._config_snapshot_path is not None:
+            _subprocess.addargs("--config-snapshot", self._config_snapshot_path)
+        else:
+            # Report configuration files and single configuration values from campaign to scenario execution otherwise.
+            for _config_path in CampaignArgs.getinstance().config_paths:  # type: Path
+                _subprocess.addargs("--config-file", _config_path)
+            for _config_name in CampaignArgs.getinstance().config_values:  # type: str
+                _subprocess.addargs("--config-value", _config_name, CampaignArgs.getinstance().config_values[_config_name])
+            # Make scenario subprocesses share a temporary configuration cache, if any.
+            if self._config_cache_dir is not None:
+                _subprocess.addargs("--config-value", str(SCENARIO_CONFIG.Key.CONFIG_CACHE_DIR), self._config_cache_dir)
         # Report common execution options from campaign to scenario execution.
         CampaignArgs.reportexecargs(CampaignArgs.getinstance(), _subprocess)
         # --json-report option.
         _subprocess.addargs("--json-report", test_case_execution.json.path)
         # Log outfile specification.
         _subprocess.addargs("--config-value", str(SCENARIO_CONFIG.Key.LOG_FILE), test_case_execution.log.path)
+        # Execution times outfile specification, if tracing is enabled with an outfile.
+        if TRACER.outpath is not None:
+            _subprocess.addargs("--config-value", str(SCENARIO_CONFIG.Key.EXEC_TIMES_FILE), _mkoutpath(".exec-times.txt"))
+        # Timeline outfile specification, if tracing is enabled with a timeline outfile.
+        if TRACER.trace_events_outpath is not None:
+            _subprocess.addargs("--config-value", str(SCENARIO_CONFIG.Key.TRACE_EVENTS_FILE), _mkoutpath(".trace.json"))
         # No log console specification.
         _subprocess.addargs("--config-value", str(SCENARIO_CONFIG.Key.LOG_CONSOLE), "0")
         # Log date/time option propagation.
@@ -267,10 +350,14 @@ class CampaignRunner(Logger):
             _fallback_errors.execution.errors.append(TestError(error_message))
 
         # Execute the scenario.
-        _exec_times_logger.tick("Executing the sub-process")
-        _subprocess.setlogger(self).run(timeout=SCENARIO_CONFIG.scenariotimeout())
-        _exec_times_logger.tick("After sub-process execution")
+        with TRACER.span("CampaignRunner._exectestcase(): sub-process execution"):
+            _subprocess.setlogger(self).run(timeout=SCENARIO_CONFIG.scenariotimeout())
         self.debug("%s returned %r", _subprocess, _subprocess.returncode)
+        test_case_execution.rusage = _subprocess.rusage
+
+        # Merge the scenario timeline with the campaign's, if any.
+        if (TRACER.trace_events_outpath is not None) and _mkoutpath(".trace.json").is_file():
+            TRACER.addtraceeventsfile(_mkoutpath(".trace.json"))
 
         # Analyze scenario return code.
         if _subprocess.returncode is None:
@@ -281,27 +368,30 @@ class CampaignRunner(Logger):
             except ValueError as _err:
                 _returncode_desc = str(_err)  # Type already declared above.
             _fallbackerror(f"'{test_case_execution.script_path}' failed with error code {_subprocess.returncode!r} ({_returncode_desc})")
-        _exec_times_logger.tick("After post-analyses")
 
-        # Read the log outfile.
-        if test_case_execution.log.path.is_file():
+        # Read the log outfile (possibly compressed).
+        if test_case_execution.log.locate():
             # Don't bother with errors, keep going on.
             self.debug("Reading '%s'", test_case_execution.log.path)
-            test_case_execution.log.read()
+            with TRACER.span("CampaignRunner._exectestcase(): log file reading"):
+                test_case_execution.log.read()
         else:
             self.debug("No such file '%s'", test_case_execution.log.path)
-        _exec_times_logger.tick("After reading the log file")
 
-        # Read the JSON outfile.
-        if test_case_execution.json.path.is_file():
+        # Read the JSON outfile (possibly compressed).
+        if test_case_execution.json.locate():
             # Don't bother with errors, keep going on.
             self.debug("Reading '%s'", test_case_execution.json.path)
-            test_case_execution.json.read()
+            with TRACER.span("CampaignRunner._exectestcase(): JSON report reading"):
+                test_case_execution.json.read()
         else:
             self.debug("No such file '%s'", test_case_execution.json.path)
-        _exec_times_logger.tick("After reading the JSON file")
 
         # Fix the scenario definition and execution instances, if not successfully read from the JSON report above.
+        if test_case_execution.scenario_execution and (_subprocess.returncode is None):
+            # Incomplete JSON report of a scenario that did not return in time: save the timeout error as well.
+            assert _fallback_errors.execution
+            test_case_execution.scenario_execution.errors.extend(_fallback_errors.execution.errors)
         if not test_case_execution.scenario_execution:
             test_case_execution.json.content = _fallback_errors
 
@@ -332,7 +422,6 @@ class CampaignRunner(Logger):
 
             # Terminate the fake scenario execution.
             _fallback_errors.execution.time.setendtime()
-            _exec_times_logger.tick("After execution error management")
         # From now, the scenario execution instance necessarily exists.
         assert test_case_execution.scenario_execution
 
@@ -341,17 +430,14 @@ class CampaignRunner(Logger):
             for _error in test_case_execution.scenario_execution.errors:  # type: TestError
                 HANDLERS.callhandlers(ScenarioEvent.ERROR, _error)
         HANDLERS.callhandlers(ScenarioEvent.AFTER_TEST_CASE, ScenarioEventData.TestCase(test_case_execution=test_case_execution))
-        _exec_times_logger.tick("After *after-test-case* handlers")
 
         # Terminate the test case instance.
-        _exec_times_logger.tick("Ending test case")
         test_case_execution.time.setendtime()
         CAMPAIGN_LOGGING.endtestcase(test_case_execution)
 
         # Feed the :attr:`.scenarioresults.SCENARIO_RESULTS` instance.
         SCENARIO_RESULTS.add(test_case_execution.scenario_execution)
 
-        _exec_times_logger.finish()
         return ErrorCode.SUCCESS
 
 
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compressed file management.
+"""
+
+import bz2
+import gzip
+import lzma
+import shutil
+import typing
+
+# `StrEnum` used for inheritance.
+from .enumutils import StrEnum
+
+if typing.TYPE_CHECKING:
+    # `AnyPathType` and `Path` used in method signatures.
+    # Type declared for type checking only.
+    from .path import AnyPathType, Path
+
+
+class Compression(StrEnum):
+    """
+    Compression codecs, available with the Python standard library.
+    """
+
+    #: gzip compression, with the '.gz' suffix.
+    GZIP = "gzip"
+    #: bzip2 compression, with the '.bz2' suffix.
+    BZIP2 = "bz2"
+    #: xz compression, with the '.xz' suffix.
+    XZ = "xz"
+
+    @property
+    def suffix(self):  # type: (...) -> str
+        """
+        File suffix for the compression codec.
+        """
+        return {
+            Compression.GZIP: ".gz",
+            Compression.BZIP2: ".bz2",
+            Compression.XZ: ".xz",
+        }[self]
+
+    @property
+    def magic(self):  # type: (...) -> bytes
+        """
+        Magic number that compressed files start with.
+        """
+        return {
+            Compression.GZIP: b"\x1f\x8b",
+            Compression.BZIP2: b"BZh",
+            Compression.XZ: b"\xfd7zXZ\x00",
+        }[self]
+
+    def open(
+            self,
+            path,  # type: AnyPathType
+            mode,  # type: str
+    ):  # type: (...) -> typing.BinaryIO
+        """
+        Opens a compressed file.
+
+        :param path: Path of the compressed file.
+        :param mode: ``"rb"`` or ``"wb"``.
+        :return: Binary stream that decompresses / compresses data on the fly.
+        """
+        if self == Compression.GZIP:
+            return typing.cast(typing.BinaryIO, gzip.open(str(path), mode))
+        elif self == Compression.BZIP2:
+            return typing.cast(typing.BinaryIO, bz2.open(str(path), mode))
+        else:
+            return typing.cast(typing.BinaryIO, lzma.open(str(path), mode))
+
+    def compressfile(
+            self,
+            path,  # type: AnyPathType
+    ):  # type: (...) -> Path
+        """
+        Compresses a file in place.
+
+        :param path: Path of the file to compress. Removed once compressed.
+        :return: Path of the compressed file, i.e. the input path with the compression suffix.
+        """
+        from .path import Path
+
+        _compressed_path = Path(str(path) + self.suffix)  # type: Path
+        with Path(path).open("rb") as _in, self.open(_compressed_path, "wb") as _out:
+            shutil.copyfileobj(_in, _out)
+        Path(path).unlink()
+        return _compressed_path
+
+    @staticmethod
+    def parse(
+            value,  # type: typing.Optional[str]
+    ):  # type: (...) -> typing.Optional[Compression]
+        """
+        Parses a compression codec name.
+
+        :param value: Compression codec name. ``None`` or empty for no compression.
+        :return: Compression codec. ``None`` for no compression.
+        :raise ValueError: When the name does not match any compression codec.
+        """
+        if not value:
+            return None
+        return Compression(value.strip().lower())
+
+    @staticmethod
+    def detect(
+            path,  # type: AnyPathType
+    ):  # type: (...) -> typing.Optional[Compression]
+        """
+        Detects whether a file is compressed, from its first bytes.
+
+        :param path: Path of the file to check.
+        :return: Compression codec detected. ``None`` when the file is not compressed.
+        """
+        from .path import Path
+
+        with Path(path).open("rb") as _file:
+            _head = _file.read(8)  # type: bytes
+        for _compression in Compression:  # type: Compression
+            if _head.startswith(_compression.magic):
+                return _compression
+        return None
+
+    @staticmethod
+    def locate(
+            path,  # type: AnyPathType
+    ):  # type: (...) -> typing.Optional[Path]
+        """
+        Finds out a file, possibly in its compressed form.
+
+        :param path: Path of the file, without compression suffix.
+        :return: Path of the file, or of its compressed form when only the latter exists. ``None`` when no file could be found.
+        """
+        from .path import Path
+
+        if Path(path).is_file():
+            return Path(path)
+        for _compression in Compression:  # type: Compression
+            _compressed_path = Path(str(path) + _compression.suffix)  # type: Path
+            if _compressed_path.is_file():
+                return _compressed_path
+        return None
+
+    @staticmethod
+    def openread(
+            path,  # type: AnyPathType
+    ):  # type: (...) -> typing.BinaryIO
+        """
+        Opens a file for reading, decompressing it on the fly when compressed.
+
+        :param path: Path of the file to read, possibly compressed.
+        :return: Binary stream of the decompressed content.
+        """
+        from .path import Path
+
+        _compression = Compression.detect(path)  # type: typing.Optional[Compression]
+        if _compression is not None:
+            return _compression.open(path, "rb")
+        _file = Path(path).open("rb")  # type: typing.BinaryIO
+        return _file
+
+    @staticmethod
+    def readbytes(
+            path,  # type: AnyPathType
+    ):  # type: (...) -> bytes
+        """
+        Reads a file, decompressing it on the fly when compressed.
+
+        :param path: Path of the file to read, possibly compressed.
+        :return: Decompressed content.
+        """
+        with Compression.openread(path) as _file:
+            return _file.read()
@@ -52,3 +52,12 @@ class CommonConfigArgs:
             help="Single configuration value. "
                  "This option may be called several times.",
         )
+
+        #: Configuration snapshot file, as saved by campaigns for their scenario subprocesses.
+        self.config_snapshot = None  # type: typing.Optional[Path]
+        self.addarg("Configuration snapshot", "config_snapshot", Path).define(
+            "--config-snapshot", metavar="SNAPSHOT_PATH",
+            action="store", type=str, default=None,
+            help="Configuration snapshot file path, loaded before configuration files and values. "
+                 "Saved by campaigns for their scenario subprocesses.",
+        )
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parsed configuration file cache.
+"""
+
+import hashlib
+import os
+import pickle
+import typing
+
+if typing.TYPE_CHECKING:
+    # `AnyPathType` used in method signatures.
+    # Type declared for type checking only.
+    from .path import AnyPathType
+
+
+class ConfigCache:
+    """
+    Parsed configuration file cache.
+
+    Saves the data read from configuration files in a fast-loading binary form,
+    in the directory given by the :attr:`.scenarioconfig.ScenarioConfig.Key.CONFIG_CACHE_DIR` configuration.
+
+    Cache entries are identified by the path, modification time and size of the configuration files,
+    so that modified files are read again.
+    """
+
+    @staticmethod
+    def read(
+            path,  # type: AnyPathType
+            format,  # type: str  # noqa  ## Shadows built-in name 'format'
+    ):  # type: (...) -> typing.Any
+        """
+        Reads configuration data from the cache.
+
+        :param path: Path of the configuration file.
+        :param format: Configuration file format.
+        :return: Configuration data cached, ``None`` when the cache is disabled, or the file is not cached yet.
+        """
+        from .configdb import CONFIG_DB
+
+        _cache_path = ConfigCache._cachepath(path, format)  # type: typing.Optional[AnyPathType]
+        if (_cache_path is None) or (not os.path.isfile(_cache_path)):
+            return None
+
+        try:
+            with open(_cache_path, "rb") as _cache_file:  # type: typing.BinaryIO
+                _data = pickle.load(_cache_file)  # type: typing.Any
+            CONFIG_DB.debug("'%s' read from cache '%s'", path, _cache_path)
+            return _data
+        except Exception as _err:
+            # Just ignore a corrupted cache file: the configuration file will be read again.
+            CONFIG_DB.debug("Could not read '%s' from cache '%s': %s", path, _cache_path, _err)
+            return None
+
+    @staticmethod
+    def write(
+            path,  # type: AnyPathType
+            format,  # type: str  # noqa  ## Shadows built-in name 'format'
+            data,  # type: typing.Any
+    ):  # type: (...) -> None
+        """
+        Saves configuration data in the cache, if enabled.
+
+        :param path: Path of the configuration file.
+        :param format: Configuration file format.
+        :param data: Configuration data read from the file.
+        """
+        from .configdb import CONFIG_DB
+
+        _cache_path = ConfigCache._cachepath(path, format)  # type: typing.Optional[AnyPathType]
+        if _cache_path is None:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(_cache_path), exist_ok=True)
+            # Write to a temporary file, then rename it, so that concurrent processes never read partial cache files.
+            _tmp_path = f"{_cache_path}.{os.getpid()}.tmp"  # type: str
+            with open(_tmp_path, "wb") as _cache_file:  # type: typing.BinaryIO
+                pickle.dump(data, _cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(_tmp_path, _cache_path)
+            CONFIG_DB.debug("'%s' saved in cache '%s'", path, _cache_path)
+        except Exception as _err:
+            # The cache is an optimization only: do not fail because of it.
+            CONFIG_DB.debug("Could not save '%s' in cache '%s': %s", path, _cache_path, _err)
+
+    @staticmethod
+    def _cachepath(
+            path,  # type: AnyPathType
+            format,  # type: str  # noqa  ## Shadows built-in name 'format'
+    ):  # type: (...) -> typing.Optional[AnyPathType]
+        """
+        Computes the cache file path for a configuration file.
+
+        :param path: Path of the configuration file.
+        :param format: Configuration file format.
+        :return: Cache file path, ``None`` when the cache is disabled.
+        """
+        from .scenarioconfig import SCENARIO_CONFIG
+
+        _cache_dir = SCENARIO_CONFIG.configcachedir()  # type: typing.Optional[AnyPathType]
+        if _cache_dir is None:
+            return None
+
+        _abspath = os.path.abspath(path)  # type: str
+        _stat = os.stat(_abspath)  # type: os.stat_result
+        _hash = hashlib.sha1(f"{format}:{_abspath}:{_stat.st_mtime_ns}:{_stat.st_size}".encode("utf-8")).hexdigest()  # type: str
+        return os.path.join(_cache_dir, f"{os.path.basename(_abspath)}.{_hash}.pickle")
@@ -21,6 +21,7 @@ Configuration database management.
 import builtins
 import logging
 import os
+import pickle
 import typing
 
 # `Logger` used for inheritance.
@@ -70,12 +71,20 @@ class ConfigDatabase(Logger):
 
         #: Configuration tree.
         self._root = ConfigNode(parent=None, key="")  # type: ConfigNode
+        #: Configuration node index: key => configuration node.
+        #:
+        #: Filled on successful lookups, and cleared each time a node is added to or removed from the configuration tree.
+        #: Missing keys are not indexed, so that the index remains bounded by the size of the configuration tree.
+        self._index = {}  # type: typing.Dict[str, ConfigNode]
+        #: Change subscriptions: key => callbacks.
+        self._subscriptions = {}  # type: typing.Dict[str, typing.List[typing.Callable[[str], None]]]
 
     def loadfile(
             self,
             path,  # type: AnyPathType
             format=None,  # type: ConfigDatabase.FileFormat  # noqa  ## Shadows built-in name 'format'
             root="",  # type: KeyType
+            lazy=False,  # type: bool
     ):  # type: (...) -> None
         """
         Loads a configuration file.
@@ -88,7 +97,15 @@ class ConfigDatabase(Logger):
             Determined automatically from the file extension when not specified.
         :param root:
             Root key to load the file from.
+        :param lazy:
+            ``True`` to map the file lazily: sub-trees are parsed only when they are reached.
+
+            JSON files only (see :meth:`.configjson.ConfigJson.mapfile()`).
+
+        When the :attr:`.scenarioconfig.ScenarioConfig.Key.CONFIG_CACHE_DIR` configuration is set,
+        the data read is cached (see :class:`.configcache.ConfigCache`).
         """
+        from .configcache import ConfigCache
         from .configini import ConfigIni
         from .configjson import ConfigJson
         from .configyaml import ConfigYaml
@@ -105,14 +122,27 @@ class ConfigDatabase(Logger):
             else:
                 raise ValueError(f"{path}: Unknown configuration file suffix")
 
-        if format == ConfigDatabase.FileFormat.INI:
-            ConfigIni.loadfile(path, root=root)
-        elif format == ConfigDatabase.FileFormat.JSON:
-            ConfigJson.loadfile(path, root=root)
-        elif format == ConfigDatabase.FileFormat.YAML:
-            ConfigYaml.loadfile(path, root=root)
-        else:
-            raise NotImplementedError(f"Unknown file format {format}")
+        if lazy:
+            if format != ConfigDatabase.FileFormat.JSON:
+                raise ValueError(f"{path}: Lazy loading not supported for {format} files")
+            ConfigJson.mapfile(path, root)
+            return
+
+        # Try to read the configuration data from the cache first.
+        _data = ConfigCache.read(path, str(format))  # type: typing.Any
+        if _data is None:
+            if format == ConfigDatabase.FileFormat.INI:
+                _data = ConfigIni.readfile(path)
+            elif format == ConfigDatabase.FileFormat.JSON:
+                _data = ConfigJson.readfile(path)
+            elif format == ConfigDatabase.FileFormat.YAML:
+                _data = ConfigYaml.readfile(path)
+            else:
+                raise NotImplementedError(f"Unknown file format {format}")
+            ConfigCache.write(path, str(format), _data)
+
+        # Push the data to the configuration database.
+        self.set(root, _data, origin=path)
 
     def savefile(
             self,
@@ -157,6 +187,48 @@ class ConfigDatabase(Logger):
         else:
             raise NotImplementedError(f"Unknown file format {format}")
 
+    def savesnapshot(
+            self,
+            path,  # type: AnyPathType
+            root="",  # type: KeyType
+    ):  # type: (...) -> None
+        """
+        Freezes configuration data into a snapshot file.
+
+        :param path: Path of the snapshot file to save.
+        :param root: Root key to save data from.
+
+        Origins are saved in their string form.
+        """
+        from .path import Path
+
+        self.debug("Saving configuration snapshot '%s'", path)
+
+        _node = self.getnode(root)  # type: typing.Optional[ConfigNode]
+        with Path(path).open("wb") as _file:  # type: typing.BinaryIO
+            pickle.dump(_node.tosnapshot() if _node else ([], None), _file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loadsnapshot(
+            self,
+            path,  # type: AnyPathType
+            root="",  # type: KeyType
+    ):  # type: (...) -> None
+        """
+        Loads a snapshot file, as saved by :meth:`savesnapshot()`.
+
+        :param path: Path of the snapshot file to load.
+        :param root: Root key to load the snapshot from.
+        """
+        from .path import Path
+
+        self.debug("Loading configuration snapshot '%s'", path)
+
+        with Path(path).open("rb") as _file:  # type: typing.BinaryIO
+            self._root.restoresnapshot(pickle.load(_file), subkey=root)
+
+        if self.isdebugenabled():
+            self.show(logging.DEBUG)
+
     def set(
             self,
             key,  # type: KeyType
@@ -185,7 +257,9 @@ class ConfigDatabase(Logger):
 
         self._root.set(subkey=key, data=data, origin=origin)
 
-        self.show(logging.DEBUG)
+        # Avoid walking the whole tree when debugging is disabled.
+        if self.isdebugenabled():
+            self.show(logging.DEBUG)
 
     def remove(
             self,
@@ -196,14 +270,16 @@ class ConfigDatabase(Logger):
 
         :param key: Configuration key to remove.
         """
-        self.debug("ConfigDatabase.remove(key=%r)", key)
+        if self.isdebugenabled():
+            self.debug("ConfigDatabase.remove(key=%r)", key)
 
         # Search for the configuration node from the key, and call `remove()` on it when found.
-        _node = self._root.get(subkey=key)  # type: typing.Optional[ConfigNode]
+        _node = self._lookup(key)  # type: typing.Optional[ConfigNode]
         if _node is not None:
             _node.remove()
 
-        self.show(logging.DEBUG)
+        if self.isdebugenabled():
+            self.show(logging.DEBUG)
 
     def show(
             self,
@@ -236,7 +312,7 @@ class ConfigDatabase(Logger):
         :param key: Searched configuration key.
         :return: Configuration node when the configuration could be found, or ``None`` otherwise.
         """
-        return self._root.get(key)
+        return self._lookup(key)
 
     @typing.overload
     def get(self, key):  # type: (KeyType) -> typing.Optional[typing.Any]
@@ -277,11 +353,12 @@ class ConfigDatabase(Logger):
             type = builtins.type(default)  # noqa  ## Shadows built-in name 'type'
 
         # Search for the configuration node from the key, and return its data when found.
-        _node = self._root.get(key)  # type: typing.Optional[ConfigNode]
+        _node = self._lookup(key)  # type: typing.Optional[ConfigNode]
         if _node is not None:
-            if (type is not None) and (_node.data is not None):
+            _data = _node.data  # type: typing.Any
+            if (type is not None) and (_data is not None):
                 return _node.cast(type=type)
-            return _node.data
+            return _data
 
         # Return the default value when set.
         if default is not None:
@@ -290,6 +367,106 @@ class ConfigDatabase(Logger):
         # Default to `None` otherwise.
         return None
 
+    def subscribe(
+            self,
+            key,  # type: KeyType
+            callback,  # type: typing.Callable[[str], None]
+    ):  # type: (...) -> None
+        """
+        Subscribes to configuration changes.
+
+        :param key:
+            Configuration key to watch.
+        :param callback:
+            Function called with the key of the node that changed,
+            each time the configuration changes at ``key``, at one of its ancestor keys, or at one of its sub-keys.
+        """
+        from .enumutils import enum2str
+
+        self._subscriptions.setdefault(enum2str(key), []).append(callback)
+
+    def unsubscribe(
+            self,
+            key,  # type: KeyType
+            callback,  # type: typing.Callable[[str], None]
+    ):  # type: (...) -> None
+        """
+        Cancels a subscription made with :meth:`subscribe()`.
+
+        :param key: Configuration key watched.
+        :param callback: Function subscribed.
+        """
+        from .enumutils import enum2str
+
+        key = enum2str(key)
+        if callback in self._subscriptions.get(key, []):
+            self._subscriptions[key].remove(callback)
+            if not self._subscriptions[key]:
+                del self._subscriptions[key]
+
+    def notifychange(
+            self,
+            key,  # type: str
+    ):  # type: (...) -> None
+        """
+        Notifies the subscribers related to a configuration change.
+
+        :param key: Key of the configuration node that changed.
+
+        Called by :class:`.confignode.ConfigNode` each time the data of a node is set, or a node is removed.
+        """
+        for _subscribed_key in list(self._subscriptions.keys()):  # type: str
+            if ConfigDatabase._relatedkeys(_subscribed_key, key):
+                for _callback in self._subscriptions.get(_subscribed_key, []).copy():  # type: typing.Callable[[str], None]
+                    _callback(key)
+
+    @staticmethod
+    def _relatedkeys(
+            key1,  # type: str
+            key2,  # type: str
+    ):  # type: (...) -> bool
+        """
+        Tells whether two configuration keys are the same, or whether one is an ancestor of the other.
+
+        :param key1: First configuration key.
+        :param key2: Second configuration key.
+        :return: ``True`` when the keys are related, ``False`` otherwise.
+        """
+        if len(key1) > len(key2):
+            key1, key2 = key2, key1
+        if not key2.startswith(key1):
+            return False
+        return (not key1) or (len(key1) == len(key2)) or (key2[len(key1)] in ".[")
+
+    def invalidateindex(self):  # type: (...) -> None
+        """
+        Clears the configuration node index.
+
+        Called by :class:`.confignode.ConfigNode` each time a node is added to or removed from the configuration tree.
+        """
+        self._index.clear()
+
+    def _lookup(
+            self,
+            key,  # type: KeyType
+    ):  # type: (...) -> typing.Optional[ConfigNode]
+        """
+        Retrieves the configuration node for the given key, from the index when possible.
+
+        :param key: Searched configuration key.
+        :return: Configuration node when the configuration could be found, or ``None`` otherwise.
+        """
+        from .enumutils import enum2str
+
+        key = enum2str(key)
+        try:
+            return self._index[key]
+        except KeyError:
+            _node = self._root.get(key)  # type: typing.Optional[ConfigNode]
+            if _node is not None:
+                self._index[key] = _node
+            return _node
+
 
 __doc__ += """
 .. py:attribute:: CONFIG_DB
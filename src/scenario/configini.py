@@ -48,9 +48,24 @@ class ConfigIni:
         :param root: Root key to load the INI file from.
         """
         from .configdb import CONFIG_DB
+
+        # Push the data to the configuration database.
+        CONFIG_DB.set(root, ConfigIni.readfile(path), origin=path)
+
+    @staticmethod
+    def readfile(
+            path,  # type: AnyPathType
+    ):  # type: (...) -> typing.Any
+        """
+        Reads an INI configuration file.
+
+        :param path: Path of the INI file to read.
+        :return: Configuration data read.
+        """
+        from .configdb import CONFIG_DB
         from .textfile import guessencoding
 
-        CONFIG_DB.debug("Loading INI file '%s'", path)
+        CONFIG_DB.debug("Reading INI file '%s'", path)
 
         _config_parser = configparser.ConfigParser()  # type: configparser.ConfigParser
         # Override the optionxform member in ordre to make the ConfigParser case sensitive.
@@ -70,10 +85,8 @@ class ConfigIni:
                 _data[_section][_option] = _config_parser.get(_section, _option)
                 CONFIG_DB.debug(f"    Option '{_option}' = {_data[_section][_option]!r}")
 
-        # Push the dictionary to the configuration database.
-        CONFIG_DB.set(root, _data, origin=path)
-
         CONFIG_DB.debug("INI file '%s' successfully read", path)
+        return _data
 
     @staticmethod
     def savefile(
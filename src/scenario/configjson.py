@@ -19,8 +19,14 @@ JSON configuration file management.
 """
 
 import json
+import mmap
+import os
+import re
 import typing
 
+# `LazyConfigData` used for inheritance.
+from .confignode import LazyConfigData
+
 if typing.TYPE_CHECKING:
     # `KeyType` used in method signatures.
     # Type declared for type checking only.
@@ -29,6 +35,12 @@ if typing.TYPE_CHECKING:
     # Type declared for type checking only.
     from .path import AnyPathType
 
+    #: JSON offset index: container type (``"{"`` or ``"["``), and children items as (field name, start offset, end offset, sub-index) tuples.
+    #:
+    #: Field names are ``None`` for list items.
+    #: Sub-indexes are ``None`` for small or deeply nested children, which are parsed in one shot when reached.
+    JsonIndexType = typing.Tuple[str, typing.List[typing.Tuple[typing.Optional[str], int, int, typing.Any]]]
+
 
 class ConfigJson:
     """
@@ -47,20 +59,51 @@ class ConfigJson:
         :param root: Root key to load the JSON file from.
         """
         from .configdb import CONFIG_DB
+
+        # Push the data to the configuration database.
+        CONFIG_DB.set(root, ConfigJson.readfile(path), origin=path)
+
+    @staticmethod
+    def mapfile(
+            path,  # type: AnyPathType
+            root="",  # type: KeyType
+    ):  # type: (...) -> None
+        """
+        Maps a JSON configuration file lazily.
+
+        Sub-trees are parsed and converted into configuration nodes only when they are reached.
+
+        :param path: Path of the JSON file to map. Should be UTF-8 encoded.
+        :param root: Root key to map the JSON file from.
+        """
+        from .configdb import CONFIG_DB
+
+        # Push the lazy data to the configuration database.
+        CONFIG_DB.set(root, LazyJsonData.fromfile(path), origin=path)
+
+    @staticmethod
+    def readfile(
+            path,  # type: AnyPathType
+    ):  # type: (...) -> typing.Any
+        """
+        Reads a JSON configuration file.
+
+        :param path: Path of the JSON file to read.
+        :return: Configuration data read.
+        """
+        from .configdb import CONFIG_DB
         from .path import Path
         from .textfile import guessencoding
 
-        CONFIG_DB.debug("Loading JSON file '%s'", path)
+        CONFIG_DB.debug("Reading JSON file '%s'", path)
 
         # Read the JSON file.
         with Path(path).open("r", encoding=guessencoding(path)) as _file:  # type: typing.TextIO
             _data = json.load(_file)  # type: typing.Any
             _file.close()
 
-        # Push the data to the configuration database.
-        CONFIG_DB.set(root, _data, origin=path)
-
         CONFIG_DB.debug("JSON file '%s' successfully read", path)
+        return _data
 
     @staticmethod
     def savefile(
@@ -84,3 +127,199 @@ class ConfigJson:
             _file.close()
 
         CONFIG_DB.debug("JSON file '%s' successfully saved", path)
+
+
+class LazyJsonData(LazyConfigData):
+    """
+    JSON data parsed on demand.
+
+    Refers to a span of a memory-mapped JSON file, with the offset index of its children items when available.
+
+    Offsets are only relevant for the file content they have been computed from:
+    a :class:`ValueError` is raised when expanding data from a file modified since it was mapped.
+    """
+
+    #: Maximum depth of the offset index.
+    INDEX_MAX_DEPTH = 4  # type: int
+    #: Minimum size, in bytes, of the JSON containers indexed.
+    #:
+    #: Smaller containers are parsed in one shot when reached.
+    INDEX_MIN_SIZE = 4096  # type: int
+
+    #: JSON tokens relevant to the offset index: strings, brackets, colons and commas.
+    _TOKEN_REGEX = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{}:,]')  # type: typing.Pattern[bytes]
+    #: Non-whitespace character.
+    _NON_SPACE_REGEX = re.compile(rb"\S")  # type: typing.Pattern[bytes]
+
+    #: Memory-mapped files: absolute path => (file stamp, memory buffer).
+    _buffers = {}  # type: typing.Dict[str, typing.Tuple[typing.Tuple[int, int], typing.Union[mmap.mmap, bytes]]]
+    #: Offset indexes already computed in the current process: (absolute path, file stamp) => offset index.
+    _indexes = {}  # type: typing.Dict[typing.Tuple[str, typing.Tuple[int, int]], typing.Optional[JsonIndexType]]
+
+    def __init__(
+            self,
+            path,  # type: str
+            stamp,  # type: typing.Tuple[int, int]
+            start,  # type: int
+            end,  # type: int
+            index,  # type: typing.Optional[JsonIndexType]
+    ):  # type: (...) -> None
+        """
+        :param path: Absolute path of the JSON file.
+        :param stamp: Modification time (in nanoseconds) and size of the JSON file the offsets have been computed for.
+        :param start: Start offset of the JSON data in the file.
+        :param end: End offset of the JSON data in the file.
+        :param index: Offset index of the children items, if any.
+        """
+        #: Absolute path of the JSON file.
+        self.path = path  # type: str
+        #: Modification time (in nanoseconds) and size of the JSON file the offsets have been computed for.
+        self.stamp = stamp  # type: typing.Tuple[int, int]
+        #: Start offset of the JSON data in the file.
+        self.start = start  # type: int
+        #: End offset of the JSON data in the file.
+        self.end = end  # type: int
+        #: Offset index of the children items, if any.
+        self.index = index  # type: typing.Optional[JsonIndexType]
+
+    def __repr__(self):  # type: (...) -> str
+        """
+        Canonical string representation.
+        """
+        return f"<LazyJsonData '{self.path}'[{self.start}:{self.end}]>"
+
+    @staticmethod
+    def fromfile(
+            path,  # type: AnyPathType
+    ):  # type: (...) -> LazyJsonData
+        """
+        Maps a whole JSON file.
+
+        The offset index is computed once, then cached in memory,
+        and in the :attr:`.scenarioconfig.ScenarioConfig.Key.CONFIG_CACHE_DIR` directory when configured.
+
+        :param path: Path of the JSON file.
+        :return: Lazy data for the whole file.
+        """
+        from .configcache import ConfigCache
+        from .configdb import CONFIG_DB
+
+        _path = os.path.abspath(path)  # type: str
+        _buffer = LazyJsonData._getbuffer(_path)  # type: typing.Union[mmap.mmap, bytes]
+        _stamp = LazyJsonData._buffers[_path][0]  # type: typing.Tuple[int, int]
+
+        if (_path, _stamp) in LazyJsonData._indexes:
+            _index = LazyJsonData._indexes[(_path, _stamp)]  # type: typing.Optional[JsonIndexType]
+        else:
+            # Note: Cached as a 1-tuple, so that `None` indexes can be told from cache misses.
+            _cached = ConfigCache.read(_path, "JSON-INDEX")  # type: typing.Optional[typing.Tuple[typing.Optional[JsonIndexType]]]
+            if _cached is not None:
+                _index = _cached[0]
+            else:
+                CONFIG_DB.debug("Indexing JSON file '%s'", path)
+                _index = LazyJsonData._buildindex(_buffer)
+                CONFIG_DB.debug("JSON file '%s' successfully indexed", path)
+                ConfigCache.write(_path, "JSON-INDEX", (_index, ))
+            LazyJsonData._indexes[(_path, _stamp)] = _index
+
+        # Skip the UTF-8 BOM if any.
+        _start = 3 if _buffer[:3] == b"\xef\xbb\xbf" else 0  # type: int
+        return LazyJsonData(_path, _stamp, _start, len(_buffer), _index)
+
+    def expand(self):  # type: (...) -> typing.Any
+        """
+        :meth:`.confignode.LazyConfigData.expand()` implementation.
+
+        Parses the JSON span when it is not indexed, returns lazy data for each child item otherwise.
+
+        :raise ValueError: When the JSON file has been modified since it was mapped.
+        """
+        from .configdb import CONFIG_DB
+
+        _buffer = LazyJsonData._getbuffer(self.path)  # type: typing.Union[mmap.mmap, bytes]
+        if LazyJsonData._buffers[self.path][0] != self.stamp:
+            raise ValueError(f"{self.path}: File modified since it was mapped, cannot load {self!r}")
+
+        if self.index is None:
+            CONFIG_DB.debug("Parsing %r", self)
+            return json.loads(_buffer[self.start:self.end])
+
+        _type, _children = self.index  # type: str, typing.List[typing.Tuple[typing.Optional[str], int, int, typing.Any]]
+        if _type == "{":
+            return {_name: LazyJsonData(self.path, self.stamp, _start, _end, _index) for _name, _start, _end, _index in _children}
+        else:
+            return [LazyJsonData(self.path, self.stamp, _start, _end, _index) for _name, _start, _end, _index in _children]
+
+    @staticmethod
+    def _getbuffer(
+            path,  # type: str
+    ):  # type: (...) -> typing.Union[mmap.mmap, bytes]
+        """
+        Retrieves the memory buffer of a JSON file, mapping the file if not already done.
+
+        :param path: Absolute path of the JSON file.
+        :return: Memory buffer.
+        """
+        _stat = os.stat(path)  # type: os.stat_result
+        _stamp = (_stat.st_mtime_ns, _stat.st_size)  # type: typing.Tuple[int, int]
+        if (path not in LazyJsonData._buffers) or (LazyJsonData._buffers[path][0] != _stamp):
+            with open(path, "rb") as _file:  # type: typing.BinaryIO
+                if _stat.st_size > 0:
+                    _buffer = mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ)  # type: typing.Union[mmap.mmap, bytes]
+                else:
+                    # Empty files cannot be memory-mapped.
+                    _buffer = b""
+            LazyJsonData._buffers[path] = (_stamp, _buffer)
+        return LazyJsonData._buffers[path][1]
+
+    @staticmethod
+    def _buildindex(
+            buffer,  # type: typing.Union[mmap.mmap, bytes]
+    ):  # type: (...) -> typing.Optional[JsonIndexType]
+        """
+        Computes the offset index of a JSON document, in a single pass on its tokens.
+
+        :param buffer: JSON document.
+        :return: Offset index of the top container, ``None`` if the document is neither a dictionary nor a list.
+        """
+        # Containers being parsed: [type, start offset, children, current field name, current item start offset, current item index].
+        _frames = []  # type: typing.List[typing.List[typing.Any]]
+        _top_index = None  # type: typing.Optional[JsonIndexType]
+
+        for _match in LazyJsonData._TOKEN_REGEX.finditer(buffer):  # type: typing.Match[bytes]
+            _token = _match.group()  # type: bytes
+            _pos = _match.start()  # type: int
+
+            if _token in (b"{", b"["):
+                _frames.append([_token.decode(), _pos, [], None, _pos + 1, None])
+            elif not _frames:
+                # Single value document.
+                continue
+            elif _token in (b",", b"}", b"]"):
+                _frame = _frames[-1]  # type: typing.List[typing.Any]
+                _depth = len(_frames)  # type: int
+                if _depth <= LazyJsonData.INDEX_MAX_DEPTH:
+                    # Record the item just ended, unless the container is empty.
+                    if (_frame[0] == "{") and (_frame[3] is not None):
+                        _frame[2].append((_frame[3], _frame[4], _pos, _frame[5]))
+                    elif (_frame[0] == "[") and LazyJsonData._NON_SPACE_REGEX.search(buffer, _frame[4], _pos):
+                        _frame[2].append((None, _frame[4], _pos, _frame[5]))
+                _frame[3], _frame[4], _frame[5] = None, _pos + 1, None
+
+                if _token != b",":
+                    _frames.pop()
+                    # Index the container if it is the top one, or if it is big enough.
+                    _index = None  # type: typing.Optional[JsonIndexType]
+                    if (not _frames) or ((_depth <= LazyJsonData.INDEX_MAX_DEPTH) and (_pos + 1 - _frame[1] >= LazyJsonData.INDEX_MIN_SIZE)):
+                        _index = (_frame[0], _frame[2])
+                    if _frames:
+                        _frames[-1][5] = _index
+                    else:
+                        _top_index = _index
+            elif _token == b":":
+                _frames[-1][4] = _pos + 1
+            elif (_frames[-1][0] == "{") and (_frames[-1][3] is None) and (len(_frames) <= LazyJsonData.INDEX_MAX_DEPTH):
+                # String in field name position.
+                _frames[-1][3] = json.loads(_token)
+
+        return _top_index
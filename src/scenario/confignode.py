@@ -18,6 +18,7 @@
 Configuration node management.
 """
 
+import abc
 import enum
 import os
 import re
@@ -29,6 +30,79 @@ if typing.TYPE_CHECKING:
     from .configtypes import KeyType, OriginType, T
 
 
+class LazyConfigData(abc.ABC):
+    """
+    Configuration data loaded on demand.
+
+    Stored as is in :class:`ConfigNode` instances, and expanded when the node data or sub-nodes are reached.
+    """
+
+    @abc.abstractmethod
+    def expand(self):  # type: (...) -> typing.Any
+        """
+        Loads the configuration data.
+
+        :return:
+            Configuration data: dictionary, list or single value.
+
+            Dictionary and list items may be :class:`LazyConfigData` instances in turn.
+        """
+
+
+class ConfigDataDict(dict):  # type: ignore  ## Missing type parameters for generic type "dict"
+    """
+    Read-only dictionary, as returned by :attr:`ConfigNode.data` for dictionary nodes.
+
+    Use :func:`copy.deepcopy()` to get a modifiable copy.
+    """
+
+    def _readonly(
+            self,
+            *args,  # type: typing.Any
+            **kwargs  # type: typing.Any
+    ):  # type: (...) -> typing.NoReturn
+        """
+        Modification methods replacement.
+        """
+        raise TypeError("Configuration data is read-only, use `copy.deepcopy()` to get a modifiable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):  # type: (...) -> typing.Any
+        """
+        Makes copies and pickled data plain dictionaries.
+        """
+        return dict, (dict(self), )
+
+
+class ConfigDataList(list):  # type: ignore  ## Missing type parameters for generic type "list"
+    """
+    Read-only list, as returned by :attr:`ConfigNode.data` for list nodes.
+
+    Use :func:`copy.deepcopy()` to get a modifiable copy.
+    """
+
+    def _readonly(
+            self,
+            *args,  # type: typing.Any
+            **kwargs  # type: typing.Any
+    ):  # type: (...) -> typing.NoReturn
+        """
+        Modification methods replacement.
+        """
+        raise TypeError("Configuration data is read-only, use `copy.deepcopy()` to get a modifiable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self):  # type: (...) -> typing.Any
+        """
+        Makes copies and pickled data plain lists.
+        """
+        return list, (list(self), )
+
+
 class ConfigNode:
     """
     Considering that configurations are organized in a tree structure,
@@ -38,24 +112,53 @@ class ConfigNode:
     - a final item,
     - a dictionary of :class:`ConfigNode`,
     - or a list of :class:`ConfigNode`.
+
+    Nodes are kept compact for large configuration trees:
+    no instance dictionary, configuration keys computed from the parent chain on demand,
+    and origin tuples shared between nodes.
     """
 
+    __slots__ = ("parent", "_name", "_data", "origins", "_data_view")
+
+    #: Shared origin tuples.
+    #:
+    #: Nodes loaded from the same file share the same origin tuple.
+    #:
+    #: Cleared when it reaches :attr:`_SHARED_ORIGINS_MAX` entries:
+    #: code locations set as origins may be numerous, and sharing origin tuples is an optimization only.
+    _shared_origins = {}  # type: typing.Dict[typing.Tuple[OriginType, ...], typing.Tuple[OriginType, ...]]
+
+    #: Maximum number of entries in the :attr:`_shared_origins` table.
+    _SHARED_ORIGINS_MAX = 4096  # type: int
+
+    #: Parsed sub-keys cache.
+    #:
+    #: Sub-key => (first part, remaining part, sub-key for display, list index flag).
+    #:
+    #: Cleared when it reaches :attr:`_PARSED_SUBKEYS_MAX` entries.
+    _parsed_subkeys = {}  # type: typing.Dict[str, typing.Tuple[str, str, str, bool]]
+
+    #: Maximum number of entries in the :attr:`_parsed_subkeys` cache.
+    _PARSED_SUBKEYS_MAX = 4096  # type: int
+
     def __init__(
             self,
             parent,  # type: typing.Optional[ConfigNode]
-            key,  # type: str
+            key,  # type: typing.Union[str, int]
     ):  # (...) -> None
         """
         :param parent: Parent node. ``None`` for the root node.
-        :param key: Key of the configuration node.
+        :param key: Configuration key for root nodes. Field name or list index of the node in its parent otherwise.
         """
         #: Parent node.
         #:
         #: ``None`` for the root node, as well as for removed nodes.
-        self.parent = parent
+        self.parent = parent  # type: typing.Optional[ConfigNode]
 
-        #: Configuration key.
-        self.key = key  # type: str
+        #: Field name or list index of the node in its parent.
+        #:
+        #: Full configuration key when the node has no parent.
+        self._name = key  # type: typing.Union[str, int]
 
         #: Configuration data.
         #:
@@ -67,7 +170,14 @@ class ConfigNode:
         self._data = None  # type: typing.Any
 
         #: Origins of the configuration value: either a string or the path of the configuration file it was defined in.
-        self.origins = []  # type: typing.List[OriginType]
+        #:
+        #: Shared tuple: use :meth:`_addorigin()` to add origins.
+        self.origins = ()  # type: typing.Tuple[OriginType, ...]
+
+        #: Cached read-only view of the node data, for dictionary and list nodes.
+        #:
+        #: ``None`` when not computed yet, or invalidated by a change in the node or its sub-nodes.
+        self._data_view = None  # type: typing.Optional[typing.Union[ConfigDataDict, ConfigDataList]]
 
     def __repr__(self):  # type: (...) -> str
         """
@@ -88,6 +198,56 @@ class ConfigNode:
         _repr += ">"
         return _repr
 
+    @property
+    def key(self):  # type: (...) -> str
+        """
+        Configuration key, computed from the parent chain.
+        """
+        _names = []  # type: typing.List[typing.Union[str, int]]
+        _node = self  # type: ConfigNode
+        while _node.parent is not None:
+            _names.append(_node._name)
+            _node = _node.parent
+        _key = str(_node._name)  # type: str
+        for _name in reversed(_names):  # type: typing.Union[str, int]
+            if isinstance(_name, int):
+                _key = f"{_key}[{_name}]"
+            elif _key:
+                _key = f"{_key}.{_name}"
+            else:
+                _key = _name
+        return _key
+
+    def _addorigin(
+            self,
+            origin,  # type: OriginType
+    ):  # type: (...) -> None
+        """
+        Adds an origin to the node, if not already set.
+
+        :param origin: Origin to add.
+        """
+        if origin not in self.origins:
+            self.origins = ConfigNode._shareorigins(self.origins + (origin, ))
+
+    @staticmethod
+    def _shareorigins(
+            origins,  # type: typing.Tuple[OriginType, ...]
+    ):  # type: (...) -> typing.Tuple[OriginType, ...]
+        """
+        Retrieves the shared origin tuple equal to the given one.
+
+        :param origins: Origin tuple.
+        :return: Shared origin tuple.
+        """
+        try:
+            return ConfigNode._shared_origins[origins]
+        except KeyError:
+            if len(ConfigNode._shared_origins) >= ConfigNode._SHARED_ORIGINS_MAX:
+                ConfigNode._shared_origins.clear()
+            ConfigNode._shared_origins[origins] = origins
+            return origins
+
     def set(
             self,
             data,  # type: typing.Any
@@ -120,7 +280,8 @@ class ConfigNode:
 
         # Default ``origin`` to code location.
         if origin is None:
-            origin = EXECUTION_LOCATIONS.fromcurrentstack(limit=1, fqn=True)[0].tolongstring()
+            # Capture the caller frame only, the fully qualified name is resolved when the origin is displayed.
+            origin = EXECUTION_LOCATIONS.fromcurrentframe(fqn=True)
 
         # When a sub-key is given, set the data on the sub-node described by the sub-key.
         if subkey:
@@ -133,16 +294,35 @@ class ConfigNode:
 
         # Store the data directly in this node otherwise.
         else:
+            if isinstance(self._data, LazyConfigData):
+                self._expand()
+
+            # Lazy data: stored as is in empty nodes, merged with existing data otherwise.
+            if isinstance(data, LazyConfigData):
+                if self._data is None:
+                    self._setdata(data)
+                else:
+                    self.set(data.expand(), origin=origin)
+
             # Dictionary data.
-            if isinstance(data, dict):
+            elif isinstance(data, dict):
                 # Instanciate / check this node manages a dictionary of sub-nodes.
                 if self._data is None:
                     self._setdata({})
                 if not isinstance(self._data, dict):
                     raise ValueError(self.errmsg(f"Bad dict data {saferepr(data)} for a non-dict configuration node", origin=origin))
-                # Use recursive calls with the ``subkey`` parameter set for each field of the input dictionary.
+                _built = False  # type: bool
                 for _field_name in data:  # type: str
-                    self.set(subkey=_field_name, data=data[_field_name], origin=origin)
+                    # Bulk-build new sub-nodes in one pass when possible.
+                    if (data[_field_name] is not None) and (_field_name not in self._data) and ConfigNode._isplainfieldname(_field_name):
+                        self._data[_field_name] = ConfigNode(parent=self, key=_field_name)
+                        self._data[_field_name]._build(data[_field_name], origin=origin)
+                        _built = True
+                    # Use recursive calls with the ``subkey`` parameter set otherwise.
+                    else:
+                        self.set(subkey=_field_name, data=data[_field_name], origin=origin)
+                if _built:
+                    self._onbuilt()
 
             # List data (or enum definitions).
             elif isinstance(data, (list, enum.EnumMeta)):
@@ -151,11 +331,12 @@ class ConfigNode:
                     self._setdata([])
                 if not isinstance(self._data, list):
                     raise ValueError(self.errmsg(f"Bad list data {saferepr(data)} for a non-list configuration node", origin=origin))
-                # Add sub-nodes for each item of the input list.
-                for _index in range(len(data)):  # type: int
-                    self._data.append(ConfigNode(parent=self, key=f"{self.key}[{len(self._data)}]"))
-                    # Apply `list()` on `data` so that enum definitions can be indexed.
-                    self._data[-1].set(list(data)[_index], origin=origin)
+                # Bulk-build sub-nodes for each item of the input list (or enum definition).
+                for _item in data:  # type: typing.Any
+                    if _item is not None:
+                        self._data.append(ConfigNode(parent=self, key=len(self._data)))
+                        self._data[-1]._build(_item, origin=origin)
+                self._onbuilt()
 
             # Final value.
             else:
@@ -168,11 +349,24 @@ class ConfigNode:
                 self._setdata(data)
 
             # Ensure origin is set.
-            if origin and (origin not in self.origins):
-                self.origins.append(origin)
+            if origin:
+                self._addorigin(origin)
 
         CONFIG_DB.popindentation()
 
+    def _expand(self):  # type: (...) -> None
+        """
+        Expands :class:`LazyConfigData` node data.
+
+        Sub-nodes are created with lazy data in turn, when applicable.
+        """
+        from .configdb import CONFIG_DB
+
+        _lazy_data = self._data  # type: LazyConfigData
+        CONFIG_DB.debug("%r: expanding", self)
+        self._data = None
+        self._build(_lazy_data.expand(), origin=self.origin or None)
+
     def _setdata(
             self,
             data,  # type: typing.Any
@@ -185,56 +379,245 @@ class ConfigNode:
         :param data: Node's data being set.
         """
         from .configdb import CONFIG_DB
-        from .scenarioconfig import ScenarioConfigKey, SCENARIO_CONFIG
 
+        self._data = ConfigNode._convertdata(data)
+        self._invalidateview()
+
+        # Debug the new data being stored.
+        CONFIG_DB.debug("%r: data = %r", self, data)
+
+        # Notify subscribers (`scenario` configuration caches among others).
+        CONFIG_DB.notifychange(self.key)
+
+    @staticmethod
+    def _convertdata(
+            data,  # type: typing.Any
+    ):  # type: (...) -> typing.Any
+        """
+        Applies automatic conversions on final data.
+
+        :param data: Data to convert.
+        :return: Data to store.
+        """
         # Apply automatic conversions:
+        # - basic types stored as is (fast path),
+        if type(data) in (str, int, float, bool):
+            return data
         # - path-likes to strings,
         if isinstance(data, os.PathLike):
-            self._data = os.fspath(data)
+            return os.fspath(data)
         # - `IntEnum` to integers,
-        elif isinstance(data, enum.IntEnum):
-            self._data = data.value
+        if isinstance(data, enum.IntEnum):
+            return data.value
         # - other enums to strings,
-        elif isinstance(data, enum.Enum):
-            self._data = str(data.value)
+        if isinstance(data, enum.Enum):
+            return str(data.value)
         # - store the data as is otherwise.
-        else:
-            self._data = data
+        return data
 
-        # Debug the new data being stored.
-        CONFIG_DB.debug("%r: data = %r", self, data)
+    def _build(
+            self,
+            data,  # type: typing.Any
+            origin,  # type: typing.Optional[OriginType]
+    ):  # type: (...) -> None
+        """
+        Builds the sub-tree of a newly created node in one pass.
 
-        # When the `scenario` TIMEZONE configuration is modified, invalidate the related cache value.
-        if self.key == ScenarioConfigKey.TIMEZONE:
-            SCENARIO_CONFIG.invalidatetimezonecache()
+        Avoids the per-node sub-key parsing, debug logging, index invalidation and change notifications of :meth:`set()`.
+        :meth:`_onbuilt()` should be called on the top node afterwards.
 
-    def remove(self):  # type: (...) -> None
+        ``None`` items and fields are skipped.
+
+        :param data: Configuration data: dictionary, list or single value.
+        :param origin: Origin info, shared by all the nodes built.
         """
-        Removes the node from its parent.
+        # Origin tuple shared by the new nodes.
+        _origins = ()  # type: typing.Tuple[OriginType, ...]
+        if origin:
+            _origins = ConfigNode._shareorigins((origin, ))
+
+        # Walk the input data iteratively: (node, data) pairs remaining to build.
+        _stack = [(self, data)]  # type: typing.List[typing.Tuple[ConfigNode, typing.Any]]
+        while _stack:
+            _node, _data = _stack.pop()  # type: ConfigNode, typing.Any
+            if not _node.origins:
+                _node.origins = _origins
+            elif origin:
+                _node._addorigin(origin)
+
+            if isinstance(_data, LazyConfigData):
+                _node._data = _data
+            elif isinstance(_data, dict):
+                _node._data = {}
+                for _field_name in _data:  # type: str
+                    if _data[_field_name] is None:
+                        continue
+                    if ConfigNode._isplainfieldname(_field_name):
+                        _node._data[_field_name] = ConfigNode(parent=_node, key=_field_name)
+                        _stack.append((_node._data[_field_name], _data[_field_name]))
+                    else:
+                        # Field names like 'a.b' or 'a[0]' describe sub-keys: let `_getsubnode()` parse them.
+                        _subnode = _node._getsubnode(_field_name, create_missing=True, origin=origin)  # type: typing.Optional[ConfigNode]
+                        assert _subnode, "Sub-node should have been created"
+                        _subnode.set(_data[_field_name], origin=origin)
+            elif isinstance(_data, (list, enum.EnumMeta)):
+                _node._data = []
+                for _item in _data:  # type: typing.Any
+                    if _item is not None:
+                        _node._data.append(ConfigNode(parent=_node, key=len(_node._data)))
+                        _stack.append((_node._data[-1], _item))
+            else:
+                _node._data = ConfigNode._convertdata(_data)
 
-        Note: Does nothing on the root node (no parent for the root node, by definition).
+    def _onbuilt(self):  # type: (...) -> None
+        """
+        Invalidates the database index and notifies subscribers once, after sub-nodes have been built with :meth:`_build()`.
         """
         from .configdb import CONFIG_DB
 
-        if self.parent:
-            # Remove the node from its parent.
-            _parent_data = getattr(self.parent, "_data")  # type: typing.Any
-            if isinstance(_parent_data, dict):
-                for _field_name in list(_parent_data.keys()):  # type: str
-                    if _parent_data[_field_name] == self:
-                        del _parent_data[_field_name]
-            if isinstance(_parent_data, list):
-                _parent_data.remove(self)
+        CONFIG_DB.debug("%r: sub-nodes built", self)
+        self._invalidateview()
+        CONFIG_DB.invalidateindex()
+        CONFIG_DB.notifychange(self.key)
+
+    def tosnapshot(self):  # type: (...) -> typing.Tuple[typing.List[str], typing.Any]
+        """
+        Freezes the node and its sub-nodes into a picklable snapshot.
+
+        :return: Origins of the node as strings, and node data: either a final value, or a dictionary or list of sub-node snapshots.
+        """
+        _origins = [str(_origin) for _origin in self.origins]  # type: typing.List[str]
+        # Note: Lazy data is saved as is, and remains lazy once restored.
+        if isinstance(self._data, dict):
+            return _origins, {_field_name: self._data[_field_name].tosnapshot() for _field_name in self._data}
+        if isinstance(self._data, list):
+            return _origins, [_item.tosnapshot() for _item in self._data]
+        return _origins, self._data
 
-            # Debug the configuration key removal.
-            CONFIG_DB.debug("%r: removed", self)
+    def restoresnapshot(
+            self,
+            snapshot,  # type: typing.Tuple[typing.List[str], typing.Any]
+            subkey=None,  # type: KeyType
+    ):  # type: (...) -> None
+        """
+        Merges a snapshot, as computed by :meth:`tosnapshot()`, into the node.
 
-            # Check whether the parent node should be removed as a consequence.
-            if _parent_data in ([], {}):
-                self.parent.remove()
+        :param snapshot: Node snapshot to merge.
+        :param subkey: Relative key from this node to merge the snapshot in.
+        """
+        if snapshot[1] is None:
+            return
+        _target_node = self._getsubnode(subkey or "", create_missing=True)  # type: typing.Optional[ConfigNode]
+        assert _target_node, "Sub-node should have been created"
+        _target_node._restore(snapshot)
+        _target_node._onbuilt()
+
+    def _restore(
+            self,
+            snapshot,  # type: typing.Tuple[typing.List[str], typing.Any]
+    ):  # type: (...) -> None
+        """
+        Recursive implementation of :meth:`restoresnapshot()`.
 
-            # Eventuelly clear the parent node reference.
-            self.parent = None
+        Sub-nodes are created directly, like :meth:`_build()` does.
+
+        :param snapshot: Node snapshot to merge.
+        """
+        _origins, _data = snapshot  # type: typing.List[str], typing.Any
+        # Existing nodes may be merged: invalidate their views.
+        self._data_view = None
+        if isinstance(self._data, LazyConfigData):
+            self._expand()
+        if isinstance(_data, LazyConfigData) and (self._data is not None):
+            # Expand lazy data to be merged with existing data, in a temporary node.
+            _tmp_node = ConfigNode(parent=None, key=self.key)  # type: ConfigNode
+            for _origin in _origins:  # type: str
+                _tmp_node._addorigin(_origin)
+            _tmp_node._data = _data
+            _tmp_node._expand()
+            _data = _tmp_node.tosnapshot()[1]
+        for _origin in _origins:  # type: str
+            self._addorigin(_origin)
+
+        if isinstance(_data, dict):
+            if self._data is None:
+                self._data = {}
+            if not isinstance(self._data, dict):
+                raise ValueError(self.errmsg("Bad dict snapshot for a non-dict configuration node"))
+            for _field_name in _data:  # type: str
+                if _field_name not in self._data:
+                    self._data[_field_name] = ConfigNode(parent=self, key=_field_name)
+                self._data[_field_name]._restore(_data[_field_name])
+        elif isinstance(_data, list):
+            if self._data is None:
+                self._data = []
+            if not isinstance(self._data, list):
+                raise ValueError(self.errmsg("Bad list snapshot for a non-list configuration node"))
+            for _item in _data:  # type: typing.Tuple[typing.List[str], typing.Any]
+                self._data.append(ConfigNode(parent=self, key=len(self._data)))
+                self._data[-1]._restore(_item)
+        else:
+            if isinstance(self._data, (dict, list)):
+                raise ValueError(self.errmsg(f"Bad final snapshot data {_data!r} for a dictionary or list node"))
+            self._data = _data
+
+    @staticmethod
+    def _isplainfieldname(
+            field_name,  # type: typing.Any
+    ):  # type: (...) -> bool
+        """
+        Tells whether a dictionary field name can be used as is as a direct sub-key.
+
+        :param field_name: Dictionary field name.
+        :return: ``False`` when the field name should be parsed as a sub-key path, or is not a string.
+        """
+        if (not isinstance(field_name, str)) or (not field_name):
+            return False
+        _first, _remaining, _display_subkey, _is_index = ConfigNode._parsesubkey(field_name)  # type: str, str, str, bool
+        return (_first == field_name) and (not _is_index)
+
+    def remove(self):  # type: (...) -> None
+        """
+        Removes the node from its parent.
+
+        Parent nodes left empty are removed as well, in the same operation.
+        The sub-tree of the node is detached as a whole.
+
+        Note: Does nothing on the root node (no parent for the root node, by definition).
+        """
+        from .configdb import CONFIG_DB
+
+        if self.parent is None:
+            return
+
+        # Find the top-most node to detach: parent nodes left empty are removed as well.
+        _top_node = self  # type: ConfigNode
+        _parent = self.parent  # type: ConfigNode
+        while (_parent.parent is not None) and (len(_parent._data) == 1):
+            _top_node = _parent
+            _parent = _parent.parent
+        _name = _top_node._name  # type: typing.Union[str, int]
+        _key = _top_node.key  # type: str
+
+        # Detach the nodes, keeping memory of their full configuration keys.
+        self._name = self.key
+        self.parent = None
+        _top_node._name = _key
+        _top_node.parent = None
+
+        # Remove the node from its parent, from its own field name or list index.
+        del _parent._data[_name]
+        if isinstance(_name, int):
+            # Renumber the next list items.
+            for _index in range(_name, len(_parent._data)):  # type: int
+                _parent._data[_index]._name = _index
+        _parent._invalidateview()
+
+        # Debug the configuration key removal.
+        if CONFIG_DB.isdebugenabled():
+            CONFIG_DB.debug("%r: removed", _top_node)
+        CONFIG_DB.invalidateindex()
+        CONFIG_DB.notifychange(_key)
 
     def show(
             self,
@@ -247,6 +630,9 @@ class ConfigNode:
         """
         from .configdb import CONFIG_DB
 
+        if isinstance(self._data, LazyConfigData):
+            self._expand()
+
         if isinstance(self._data, dict):
             if self.key:
                 CONFIG_DB.log(log_level, f"{self.key}:")
@@ -278,6 +664,8 @@ class ConfigNode:
         """
         from .configkey import ConfigKey
 
+        if isinstance(self._data, LazyConfigData):
+            self._expand()
         _subkeys = []  # type: typing.List[str]
         if isinstance(self._data, dict):
             for _direct_subkey in self._data:  # type: str
@@ -320,7 +708,6 @@ class ConfigNode:
         :return: Sub-node if found, ``None`` otherwise.
         """
         from .configdb import CONFIG_DB
-        from .configkey import ConfigKey
         from .debugutils import saferepr
         from .enumutils import enum2str
 
@@ -328,48 +715,39 @@ class ConfigNode:
             CONFIG_DB.debug("%r: _getsubnode(subkey=%r, create_missing=%r, origin=%r)", self, subkey, create_missing, origin)
 
         # Set origin info on the current node.
-        if origin and (origin not in self.origins):
-            self.origins.append(origin)
+        if origin:
+            self._addorigin(origin)
 
         # When the sub-key is empty, it means we have reached the sub-node we are looking for.
         subkey = enum2str(subkey)
         if not subkey:
             return self
 
+        if isinstance(self._data, LazyConfigData):
+            self._expand()
+
         # Parse the sub-key.
-        _sep_index = min([
-            subkey.find(".") if subkey.find(".") >= 0 else len(subkey),
-            subkey.find("[") if subkey.find("[") >= 0 else len(subkey),
-            subkey.find("]") if subkey.find("]") >= 0 else len(subkey),
-        ])  # type: int
-        _first = subkey[:_sep_index]  # type: str
-        _sep = subkey[_sep_index:_sep_index+1]  # type: str
-        _remaining = subkey[_sep_index+1:]  # type: str
-        if _sep == "]":
-            if _remaining.startswith("."):
-                _sep += "."
-                _remaining = _remaining[1:]
-            # Once the key has been parsed, restore the starting '[' for display purpose.
-            subkey = "[" + subkey
+        _first, _remaining, _display_subkey, _is_index = ConfigNode._parsesubkey(subkey)  # type: str, str, str, bool
 
         # Depending on the sub-key, let's search for a sub-node.
         _subnode = None  # type: typing.Optional[ConfigNode]
-        _errmsg_start = self.errmsg(f"Bad sub-key {subkey!r}: ", origin)  # type: str
 
         # List index selector.
-        if re.match(r"-?[0-9]+", _first):
+        if _is_index:
             if self._data is None:
                 self._setdata([])
             if not isinstance(self._data, list):
-                raise IndexError(_errmsg_start + f"Cannot index a non-list node with {_first!r}")
+                raise IndexError(self.errmsg(f"Bad sub-key {_display_subkey!r}: Cannot index a non-list node with {_first!r}", origin))
             _index = int(_first)  # type: int
             if create_missing and (_index == len(self._data)):
-                self._data.append(ConfigNode(parent=self, key=ConfigKey.join(self.key, f"[{_index}]")))
+                self._data.append(ConfigNode(parent=self, key=_index))
+                self._invalidateview()
+                CONFIG_DB.invalidateindex()
             try:
                 _subnode = self._data[_index]
             except IndexError:
                 if create_missing:
-                    raise IndexError(_errmsg_start + f"Cannot create list item from index {_first!r}")
+                    raise IndexError(self.errmsg(f"Bad sub-key {_display_subkey!r}: Cannot create list item from index {_first!r}", origin))
 
         # Dictionary field name selector.
         else:
@@ -379,17 +757,24 @@ class ConfigNode:
             if self._data is not None:
                 # Find the direct sub-node in the member dictionary.
                 if not isinstance(self._data, dict):
-                    raise IndexError(
-                        _errmsg_start + f"Cannot index a non-dictionary node with {_first!r}, data is {saferepr(self._data)} (origin: {self.origin})"
-                    )
+                    raise IndexError(self.errmsg(
+                        f"Bad sub-key {_display_subkey!r}: "
+                        f"Cannot index a non-dictionary node with {_first!r}, data is {saferepr(self._data)} (origin: {self.origin})",
+                        origin,
+                    ))
                 if _first in self._data:
                     _subnode = self._data[_first]
                 # Create it when missing and applicable.
                 elif create_missing:
-                    _subnode = self._data[_first] = ConfigNode(parent=self, key=ConfigKey.join(self.key, _first))
+                    _subnode = self._data[_first] = ConfigNode(parent=self, key=_first)
+                    self._invalidateview()
+                    CONFIG_DB.invalidateindex()
 
         # Walk through the sub-node.
         if _subnode:
+            # Indent debug logging when sub-nodes may be created only.
+            if not create_missing:
+                return _subnode._getsubnode(subkey=_remaining)
             try:
                 CONFIG_DB.pushindentation()
                 return _subnode._getsubnode(
@@ -401,30 +786,84 @@ class ConfigNode:
                 CONFIG_DB.popindentation()
         return None
 
+    @staticmethod
+    def _parsesubkey(
+            subkey,  # type: str
+    ):  # type: (...) -> typing.Tuple[str, str, str, bool]
+        """
+        Parses a sub-key, with a cache.
+
+        :param subkey: Non-empty sub-key to parse.
+        :return: First part, remaining part, sub-key for display, and whether the first part is a list index.
+        """
+        try:
+            return ConfigNode._parsed_subkeys[subkey]
+        except KeyError:
+            pass
+
+        _sep_index = min([
+            subkey.find(".") if subkey.find(".") >= 0 else len(subkey),
+            subkey.find("[") if subkey.find("[") >= 0 else len(subkey),
+            subkey.find("]") if subkey.find("]") >= 0 else len(subkey),
+        ])  # type: int
+        _first = subkey[:_sep_index]  # type: str
+        _sep = subkey[_sep_index:_sep_index+1]  # type: str
+        _remaining = subkey[_sep_index+1:]  # type: str
+        _display_subkey = subkey  # type: str
+        if _sep == "]":
+            if _remaining.startswith("."):
+                _remaining = _remaining[1:]
+            # Once the key has been parsed, restore the starting '[' for display purpose.
+            _display_subkey = "[" + subkey
+
+        _parsed_subkey = (_first, _remaining, _display_subkey, bool(re.match(r"-?[0-9]+", _first)))  # type: typing.Tuple[str, str, str, bool]
+        if len(ConfigNode._parsed_subkeys) >= ConfigNode._PARSED_SUBKEYS_MAX:
+            ConfigNode._parsed_subkeys.clear()
+        ConfigNode._parsed_subkeys[subkey] = _parsed_subkey
+        return _parsed_subkey
+
     @property
     def data(self):  # type: (...) -> typing.Any
         """
         Retrieves the node data as a JSON-like structure, or value as given.
 
         :return: JSON-like structure or value.
+
+        Dictionaries and lists are read-only views (see :class:`ConfigDataDict` and :class:`ConfigDataList`),
+        cached until the node or one of its sub-nodes changes.
         """
+        if isinstance(self._data, LazyConfigData):
+            self._expand()
+
         # JSON dictionary.
         if isinstance(self._data, dict):
-            _dict = {}  # type: typing.Dict[str, typing.Any]
-            for _direct_subkey in self._data:  # type: str
-                _dict[_direct_subkey] = self._data[_direct_subkey].data
-            return _dict
+            if self._data_view is None:
+                self._data_view = ConfigDataDict((_direct_subkey, self._data[_direct_subkey].data) for _direct_subkey in self._data)
+            return self._data_view
 
         # JSON list.
         if isinstance(self._data, list):
-            _list = []  # type: typing.List[typing.Any]
-            for _index in range(len(self._data)):  # type: int
-                _list.append(self._data[_index].data)
-            return _list
+            if self._data_view is None:
+                self._data_view = ConfigDataList(_item.data for _item in self._data)
+            return self._data_view
 
         # Final value.
         return self._data
 
+    def _invalidateview(self):  # type: (...) -> None
+        """
+        Invalidates the cached data views of this node and of its ancestors.
+
+        Ancestors are walked up to the first one without a cached view:
+        as parent views are computed from their sub-node views, ancestors of a node without a view have no view either.
+        """
+        _node = self  # type: typing.Optional[ConfigNode]
+        while _node is not None:
+            if (_node._data_view is None) and (_node is not self):
+                break
+            _node._data_view = None
+            _node = _node.parent
+
     def cast(
             self,
             type,  # type: typing.Type[T]  # noqa  ## Shadows built-in name 'type'
@@ -439,6 +878,9 @@ class ConfigNode:
         """
         from .reflex import qualname
 
+        if isinstance(self._data, LazyConfigData):
+            self._expand()
+
         # Dictionary.
         if type is dict:
             if not isinstance(self._data, dict):
@@ -22,8 +22,9 @@ import enum
 import typing
 
 if typing.TYPE_CHECKING:
-    # `AnyPathType` used in method signatures and type definitions.
+    # `AnyPathType` and `LazyCodeLocation` used in method signatures and type definitions.
     # Type declared for type checking only.
+    from .locations import LazyCodeLocation
     from .path import AnyPathType
 
 
@@ -35,4 +36,4 @@ if typing.TYPE_CHECKING:
     KeyType = typing.Union[str, enum.Enum]
 
     #: Origin type.
-    OriginType = typing.Union[str, AnyPathType]
+    OriginType = typing.Union[str, AnyPathType, LazyCodeLocation]
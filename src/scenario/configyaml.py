@@ -18,6 +18,7 @@
 YAML configuration file management.
 """
 
+import copy
 import typing
 
 if typing.TYPE_CHECKING:
@@ -46,10 +47,25 @@ class ConfigYaml:
         :param root: Root key to load the YAML file from.
         """
         from .configdb import CONFIG_DB
+
+        # Push the data to the configuration database.
+        CONFIG_DB.set(root, ConfigYaml.readfile(path), origin=path)
+
+    @staticmethod
+    def readfile(
+            path,  # type: AnyPathType
+    ):  # type: (...) -> typing.Any
+        """
+        Reads a YAML configuration file.
+
+        :param path: Path of the YAML file to read.
+        :return: Configuration data read.
+        """
+        from .configdb import CONFIG_DB
         from .path import Path
         from .textfile import guessencoding
 
-        CONFIG_DB.debug("Loading YAML file '%s'", path)
+        CONFIG_DB.debug("Reading YAML file '%s'", path)
 
         # Import `yaml`.
         try:
@@ -62,10 +78,8 @@ class ConfigYaml:
             _data = yaml.safe_load(_file)  # type: typing.Any
             _file.close()
 
-        # Push the data to the configuration database.
-        CONFIG_DB.set(root, _data, origin=path)
-
         CONFIG_DB.debug("YAML file '%s' successfully read", path)
+        return _data
 
     @staticmethod
     def savefile(
@@ -92,7 +106,8 @@ class ConfigYaml:
         # Save the YAML file. Use UTF-8 encoding.
         with Path(path).open("w", encoding="utf-8") as _file:  # type: typing.TextIO
             # Let `yaml.safe_load()` deal with encoding.
-            yaml.safe_dump(CONFIG_DB.get(root), _file)
+            # Deep-copy the read-only configuration data into plain dictionaries and lists for `yaml.safe_dump()`.
+            yaml.safe_dump(copy.deepcopy(CONFIG_DB.get(root)), _file)
             _file.close()
 
         CONFIG_DB.debug("YAML file '%s' successfully saved", path)
@@ -58,6 +58,19 @@ class DelayedStr(abc.ABC):
             self.__str = self._computestr()
         return self.__str
 
+    def iterstr(self):  # type: (...) -> typing.Iterator[str]
+        """
+        Iterates over the string computed by chunks.
+
+        Makes it possible for consumers that do not need the full string (long text logging for instance)
+        to stop the computation as soon as they have got enough.
+
+        :return: String chunks.
+
+        The default implementation yields the full string computed by :meth:`__str__()` at once.
+        """
+        yield str(self)
+
     @abc.abstractmethod
     def _computestr(self):  # type: (...) -> str
         """
@@ -226,6 +239,14 @@ class JsonDump(DelayedStr):
         #: :func:`json.dumps()`-like arguments.
         self.kwargs = kwargs  # type: typing.Dict[str, typing.Any]
 
+    def iterstr(self):  # type: (...) -> typing.Iterator[str]
+        """
+        Iterates over the JSON dump by chunks, as produced by :meth:`json.JSONEncoder.iterencode()`.
+        """
+        _kwargs = dict(self.kwargs)  # type: typing.Dict[str, typing.Any]
+        _cls = _kwargs.pop("cls", None) or json.JSONEncoder  # type: typing.Type[json.JSONEncoder]
+        yield from _cls(**_kwargs).iterencode(self.json_data)
+
     def _computestr(self):  # type: (...) -> str
         return json.dumps(self.json_data, **self.kwargs)
 
@@ -150,6 +150,7 @@ class Handlers(Logger):
         """
         from .enumutils import enum2str
         from .scenariostack import SCENARIO_STACK
+        from .tracing import TRACER
 
         event = enum2str(event)
 
@@ -163,7 +164,8 @@ class Handlers(Logger):
 
                 try:
                     self.debug("Calling *%s* handler %r", event, _handler.handler)
-                    _handler.handler(event, data)
+                    with TRACER.span("Handlers.callhandlers()", args={"event": event, "handler": _handler.handler} if TRACER.enabled else None):
+                        _handler.handler(event, data)
                 except Exception as _err:
                     self.warning(f"Handler exception: {_err}", exc_info=True)
 
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON serialization utils.
+"""
+
+import abc
+import json
+import typing
+
+
+class JsonSerializer(abc.ABC):
+    """
+    JSON serializer interface.
+
+    Abstracts the final library used for JSON serialization,
+    so that an accelerated library may be used when available.
+    """
+
+    #: Serializer name.
+    name = ""  # type: str
+
+    @abc.abstractmethod
+    def dumps(
+            self,
+            json_data,  # type: typing.Any
+            compact=False,  # type: bool
+    ):  # type: (...) -> bytes
+        """
+        Serializes JSON data.
+
+        :param json_data: JSON data to serialize.
+        :param compact:
+            ``True`` for a compact output, without indentation nor whitespaces.
+            ``False`` for an output indented with 2 spaces.
+        :return: UTF-8 encoded JSON document.
+        """
+
+    @abc.abstractmethod
+    def loads(
+            self,
+            json_doc,  # type: typing.Union[bytes, str]
+    ):  # type: (...) -> typing.Any
+        """
+        Parses a JSON document.
+
+        :param json_doc: JSON document to parse.
+        :return: JSON data.
+        """
+
+
+class StdJsonSerializer(JsonSerializer):
+    """
+    JSON serializer based on the :mod:`json` standard library.
+    """
+
+    name = "json"
+
+    def dumps(
+            self,
+            json_data,  # type: typing.Any
+            compact=False,  # type: bool
+    ):  # type: (...) -> bytes
+        """
+        :meth:`JsonSerializer.dumps()` implementation.
+        """
+        if compact:
+            return json.dumps(json_data, separators=(",", ":")).encode("utf-8")
+        return json.dumps(json_data, indent=2).encode("utf-8")
+
+    def loads(
+            self,
+            json_doc,  # type: typing.Union[bytes, str]
+    ):  # type: (...) -> typing.Any
+        """
+        :meth:`JsonSerializer.loads()` implementation.
+        """
+        return json.loads(json_doc)
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    JSON serializer based on the `orjson <https://github.com/ijl/orjson>`_ library.
+
+    Falls back to the :mod:`json` standard library for data that `orjson` cannot serialize
+    (integers above 64 bits, non-string dictionary keys, ...).
+    """
+
+    name = "orjson"
+
+    def __init__(self):  # type: (...) -> None
+        """
+        Imports the `orjson` library.
+
+        :raise ImportError: When `orjson` is not installed.
+        """
+        import orjson
+
+        #: `orjson` module reference.
+        self._orjson = orjson  # type: typing.Any
+        #: Standard serializer, for data that `orjson` cannot serialize.
+        self._std = StdJsonSerializer()  # type: StdJsonSerializer
+
+    def dumps(
+            self,
+            json_data,  # type: typing.Any
+            compact=False,  # type: bool
+    ):  # type: (...) -> bytes
+        """
+        :meth:`JsonSerializer.dumps()` implementation.
+        """
+        try:
+            _json_doc = self._orjson.dumps(json_data, option=(0 if compact else self._orjson.OPT_INDENT_2))  # type: bytes
+            return _json_doc
+        except TypeError:
+            # Note: `orjson.JSONEncodeError` is a subclass of `TypeError`.
+            return self._std.dumps(json_data, compact=compact)
+
+    def loads(
+            self,
+            json_doc,  # type: typing.Union[bytes, str]
+    ):  # type: (...) -> typing.Any
+        """
+        :meth:`JsonSerializer.loads()` implementation.
+        """
+        return self._orjson.loads(json_doc)
+
+
+class Json:
+    """
+    JSON serialization entry point.
+
+    Uses an accelerated library when available, the :mod:`json` standard library otherwise.
+    """
+
+    #: Serializer in use. Determined on first use.
+    _serializer = None  # type: typing.Optional[JsonSerializer]
+
+    @staticmethod
+    def getserializer():  # type: (...) -> JsonSerializer
+        """
+        :return: Serializer in use.
+        """
+        if Json._serializer is None:
+            try:
+                Json._serializer = OrjsonSerializer()
+            except ImportError:
+                Json._serializer = StdJsonSerializer()
+        return Json._serializer
+
+    @staticmethod
+    def setserializer(
+            serializer,  # type: typing.Optional[JsonSerializer]
+    ):  # type: (...) -> None
+        """
+        Sets the serializer to use.
+
+        :param serializer: Serializer to use. ``None`` to determine it automatically again.
+        """
+        Json._serializer = serializer
+
+    @staticmethod
+    def dumps(
+            json_data,  # type: typing.Any
+            compact=False,  # type: bool
+    ):  # type: (...) -> bytes
+        """
+        Serializes JSON data with the serializer in use.
+
+        See :meth:`JsonSerializer.dumps()`.
+        """
+        return Json.getserializer().dumps(json_data, compact=compact)
+
+    @staticmethod
+    def loads(
+            json_doc,  # type: typing.Union[bytes, str]
+    ):  # type: (...) -> typing.Any
+        """
+        Parses a JSON document with the serializer in use.
+
+        See :meth:`JsonSerializer.loads()`.
+        """
+        return Json.getserializer().loads(json_doc)
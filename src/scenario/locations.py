@@ -178,11 +178,107 @@ class CodeLocation:
         )
 
 
+class LazyCodeLocation:
+    """
+    Code location captured from a frame, which qualified name is resolved on demand only.
+
+    Cheap alternative to :class:`CodeLocation` for execution locations that are stored often, but displayed seldom.
+    """
+
+    def __init__(
+            self,
+            code,  # type: types.CodeType
+            line,  # type: int
+            fqn=False,  # type: bool
+    ):  # type: (...) -> None
+        """
+        Stores the code object and line number of the location.
+
+        :param code: Code object of the frame located.
+        :param line: Line number in the file.
+        :param fqn: ``True`` to ensure a fully qualified name when the location is resolved.
+        """
+        #: Code object of the frame located.
+        self.code = code  # type: types.CodeType
+        #: Line number in the file.
+        self.line = line  # type: int
+        #: ``True`` to ensure a fully qualified name when the location is resolved.
+        self.fqn = fqn  # type: bool
+        #: :class:`CodeLocation` instance, computed on the first call to :attr:`location`.
+        self._location = None  # type: typing.Optional[CodeLocation]
+
+    @property
+    def location(self):  # type: (...) -> CodeLocation
+        """
+        :class:`CodeLocation` equivalent.
+
+        Computed once, on the first access.
+        """
+        from .path import Path
+        from .reflex import checkfuncqualname
+
+        if self._location is None:
+            _file = Path(self.code.co_filename)  # type: Path
+            _qualname = self.code.co_name  # type: str
+            if self.fqn:
+                # `co_qualname` available from Python 3.11 only: walk the module otherwise.
+                _qualname = getattr(self.code, "co_qualname", "<module>")
+                if _qualname == "<module>":
+                    _qualname = checkfuncqualname(file=_file, line=self.line, func_name=self.code.co_name)
+            self._location = CodeLocation(file=_file, line=self.line, qualname=_qualname)
+        return self._location
+
+    def __eq__(
+            self,
+            other,  # type: typing.Any
+    ):  # type: (...) -> bool
+        """
+        Compares the :class:`LazyCodeLocation` instance with another object.
+
+        Two lazy locations compare without resolving their qualified names.
+
+        :param other: Candidate object.
+        :return: ``True`` if the objects are similar, ``False`` otherwise.
+        """
+        if isinstance(other, LazyCodeLocation):
+            return (other.code is self.code) and (other.line == self.line)
+        if isinstance(other, CodeLocation):
+            return other == self.location
+        return False
+
+    def __hash__(self):  # type: (...) -> int
+        """
+        Hash computed from the code object and line number.
+        """
+        return hash((self.code, self.line))
+
+    def __str__(self):  # type: (...) -> str
+        """
+        Long text representation, as :meth:`CodeLocation.tolongstring()` gives it.
+        """
+        return self.location.tolongstring()
+
+    def __repr__(self):  # type: (...) -> str
+        """
+        Canonical string representation, without resolving the qualified name.
+        """
+        return f"<{type(self).__name__} {self.code.co_filename}:{self.line}:{self.code.co_name}>"
+
+
 class ExecutionLocations(Logger):
     """
     Methods to build execution location stacks.
     """
 
+    #: Source paths skipped when computing locations, in addition to 'src/scenario' sources.
+    _SKIPPED_PATHS = (
+        # - Avoid unittest sources.
+        pathlib.Path("unittest") / "case.py",
+        # - Avoid PyCharm sources (visible in the execution stack when debugging).
+        pathlib.Path("pydevd.py"),
+        pathlib.Path("_pydev_execfile.py"),
+    )  # type: typing.Tuple[pathlib.Path, ...]
+
     def __init__(self):  # type: (...) -> None
         """
         Sets up logging for the :class:`ExecutionLocations` class.
@@ -191,6 +287,9 @@ class ExecutionLocations(Logger):
 
         Logger.__init__(self, log_class=DebugClass.EXECUTION_LOCATIONS)
 
+        #: Cache of file names skipped when computing locations.
+        self._skipped_files = {}  # type: typing.Dict[str, bool]
+
     def fromcurrentstack(
             self,
             limit=None,  # type: int
@@ -205,6 +304,50 @@ class ExecutionLocations(Logger):
         """
         return self._fromtbitems(traceback.extract_stack(), limit=limit, fqn=fqn)
 
+    def fromcurrentframe(
+            self,
+            fqn=False,  # type: bool
+    ):  # type: (...) -> typing.Optional[LazyCodeLocation]
+        """
+        Locates the nearest caller frame from the current call stack, without extracting the full stack.
+
+        :param fqn: ``True`` to ensure a fully qualified name when the location is resolved.
+        :return: :class:`LazyCodeLocation` instance, or ``None`` if no location could be found.
+        """
+        _frame = inspect.currentframe()  # type: typing.Optional[types.FrameType]
+        try:
+            while _frame is not None:
+                if not self._isskippedfile(_frame.f_code.co_filename):
+                    return LazyCodeLocation(_frame.f_code, _frame.f_lineno, fqn=fqn)
+                _frame = _frame.f_back
+            return None
+        finally:
+            # Break the reference cycle with the frame.
+            del _frame
+
+    def _isskippedfile(
+            self,
+            filename,  # type: str
+    ):  # type: (...) -> bool
+        """
+        Tells whether a source file should be skipped when computing locations.
+
+        :param filename: Source file name, as given by code objects.
+        :return: ``True`` when the file should be skipped.
+        """
+        try:
+            return self._skipped_files[filename]
+        except KeyError:
+            _path = pathlib.Path(filename).absolute()  # type: pathlib.Path
+            # - Avoid 'src/scenario' sources.
+            _skip = pathlib.Path(__file__).parent.absolute() in _path.parents  # type: bool
+            # - Avoid unittest, PyCharm sources, ...
+            for _skipped_path in self._SKIPPED_PATHS:  # type: pathlib.Path
+                if _path.as_posix().endswith(_skipped_path.as_posix()):
+                    _skip = True
+            self._skipped_files[filename] = _skip
+            return _skip
+
     def fromexception(
             self,
             exception,  # type: traceback.TracebackException
@@ -263,13 +406,8 @@ class ExecutionLocations(Logger):
             # - Avoid 'src/scenario' sources.
             if isinstance(_location.file, Path) and _location.file.is_relative_to(pathlib.Path(__file__).parent):
                 _keep = False
-            for _skipped_path in (
-                # - Avoid unittest sources.
-                pathlib.Path("unittest") / "case.py",
-                # - Avoid PyCharm sources (visible in the execution stack when debugging).
-                pathlib.Path("pydevd.py"),
-                pathlib.Path("_pydev_execfile.py"),
-            ):  # type: pathlib.Path
+            # - Avoid unittest, PyCharm sources, ...
+            for _skipped_path in self._SKIPPED_PATHS:  # type: pathlib.Path
                 if _location.file.as_posix().endswith(_skipped_path.as_posix()):
                     _keep = False
 
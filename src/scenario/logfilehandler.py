@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Size-capped, rotating and compressed log file handler.
+"""
+
+import collections
+import logging
+import os
+import typing
+
+if typing.TYPE_CHECKING:
+    # `AnyPathType` used in method signatures.
+    # Type declared for type checking only.
+    from .path import AnyPathType
+
+
+class LogFileHandler(logging.FileHandler):
+    """
+    File handler that caps the log file size, rotates it, and compresses it when closed.
+
+    When a maximum size is set:
+
+    - if a backup count is set, the log file is rotated as 'xxx.log.1', 'xxx.log.2', ... when the maximum size is reached,
+    - otherwise, the beginning of the log is written as is,
+      and the end of the log is retained in memory (see :attr:`tail_size`) until the handler is closed,
+      intermediate log lines being dropped.
+
+    When compression is enabled, log files are gzip-compressed with a '.gz' suffix once finished.
+    """
+
+    #: Suffix of compressed log files.
+    COMPRESSED_SUFFIX = ".gz"  # type: str
+
+    def __init__(
+            self,
+            path,  # type: AnyPathType
+            max_size=None,  # type: typing.Optional[int]
+            tail_size=None,  # type: typing.Optional[int]
+            backup_count=0,  # type: int
+            compress=False,  # type: bool
+    ):  # type: (...) -> None
+        """
+        :param path: Log file path.
+        :param max_size: Maximum log file size, in bytes. ``None`` or ``0`` for no limit.
+        :param tail_size: Size of the end of the log to retain, in bytes. Defaults to half of ``max_size``.
+        :param backup_count: Number of rotated files to keep. ``0`` for no rotation.
+        :param compress: ``True`` to gzip-compress finished log files.
+        """
+        logging.FileHandler.__init__(self, path, mode="w", encoding="utf-8")
+
+        #: Maximum log file size, in bytes.
+        self.max_size = max_size or None  # type: typing.Optional[int]
+        #: Size of the end of the log to retain, in bytes.
+        self.tail_size = 0  # type: int
+        if self.max_size:
+            self.tail_size = min(self.max_size, tail_size if tail_size is not None else (self.max_size // 2))
+        #: Number of rotated files to keep.
+        self.backup_count = backup_count  # type: int
+        #: Compression flag.
+        self.compress = compress  # type: bool
+
+        #: Number of bytes written in the current log file.
+        self._size = 0  # type: int
+        #: ``True`` once the beginning of the log is full, i.e. when the next log lines shall be retained for the end of the log.
+        self._head_full = False  # type: bool
+        #: Log lines retained for the end of the log, with their respective sizes.
+        self._tail = collections.deque()  # type: typing.Deque[typing.Tuple[str, int]]
+        #: Number of bytes retained in :attr:`_tail`.
+        self._tail_bytes = 0  # type: int
+        #: Number of log lines dropped between the beginning and the end of the log.
+        self._dropped_lines = 0  # type: int
+        #: Number of bytes dropped between the beginning and the end of the log.
+        self._dropped_bytes = 0  # type: int
+
+    def emit(
+            self,
+            record,  # type: logging.LogRecord
+    ):  # type: (...) -> None
+        """
+        :meth:`logging.FileHandler.emit()` override that applies size limitations.
+        """
+        try:
+            _line = self.format(record) + self.terminator  # type: str
+            _line_size = len(_line.encode(self.encoding or "utf-8"))  # type: int
+
+            if self._head_full:
+                self._retaintail(_line, _line_size)
+                return
+            if self.max_size and (self._size + _line_size > self.max_size - (0 if self.backup_count else self.tail_size)):
+                if self.backup_count:
+                    self._rollover()
+                else:
+                    # Once a line has been retained for the end of the log, the next ones shall not be written at the beginning.
+                    self._head_full = True
+                    self._retaintail(_line, _line_size)
+                    return
+
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(_line)
+            self.flush()
+            self._size += _line_size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):  # type: (...) -> None
+        """
+        :meth:`logging.FileHandler.close()` override that writes the end of the log, and compresses the log file when required.
+        """
+        self.acquire()
+        try:
+            if self._dropped_lines or self._tail:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self._dropped_lines:
+                    self.stream.write(f"[... {self._dropped_lines} line(s), {self._dropped_bytes} byte(s) skipped ...]{self.terminator}")
+                while self._tail:
+                    self.stream.write(self._tail.popleft()[0])
+                self._tail_bytes = 0
+                self._dropped_lines = 0
+                self._dropped_bytes = 0
+            self._head_full = False
+
+            logging.FileHandler.close(self)
+
+            if self.compress:
+                self._compressfile(self.baseFilename)
+        finally:
+            self.release()
+
+    def _retaintail(
+            self,
+            line,  # type: str
+            line_size,  # type: int
+    ):  # type: (...) -> None
+        """
+        Retains a log line for the end of the log, dropping older lines when the tail size is exceeded.
+
+        :param line: Formatted log line.
+        :param line_size: Size of the log line, in bytes.
+        """
+        self._tail.append((line, line_size))
+        self._tail_bytes += line_size
+        while self._tail and (self._tail_bytes > self.tail_size):
+            _dropped_size = self._tail.popleft()[1]  # type: int
+            self._tail_bytes -= _dropped_size
+            self._dropped_lines += 1
+            self._dropped_bytes += _dropped_size
+
+    def _rollover(self):  # type: (...) -> None
+        """
+        Rotates log files.
+        """
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+        _suffix = self.COMPRESSED_SUFFIX if self.compress else ""  # type: str
+        for _index in range(self.backup_count - 1, 0, -1):  # type: int
+            _src = f"{self.baseFilename}.{_index}{_suffix}"  # type: str
+            if os.path.exists(_src):
+                os.replace(_src, f"{self.baseFilename}.{_index + 1}{_suffix}")
+        if os.path.exists(self.baseFilename):
+            os.replace(self.baseFilename, f"{self.baseFilename}.1")
+            if self.compress:
+                self._compressfile(f"{self.baseFilename}.1")
+
+        self.stream = self._open()
+        self._size = 0
+        self._head_full = False
+
+    @staticmethod
+    def _compressfile(
+            path,  # type: str
+    ):  # type: (...) -> None
+        """
+        Compresses a file in place with gzip.
+
+        :param path: Path of the file to compress. Renamed with the '.gz' suffix.
+        """
+        from .compression import Compression
+
+        if os.path.isfile(path):
+            Compression.GZIP.compressfile(path)
@@ -18,8 +18,10 @@
 :class:`Logger` class definition.
 """
 
+import collections.abc
 import enum
 import logging
+import re
 import traceback
 import typing
 
@@ -395,19 +397,127 @@ class Logger:
         :param args: Other positional arguments as a tuple.
         :param max_lines: Maximum number of lines to display. All lines when set to ``None``.
         :param kwargs: Named parameter arguments.
+
+        The long text is formatted and split lazily,
+        so that the computation stops as soon as ``max_lines`` lines have been collected.
+
+        Each line is still sent as a record of its own:
+        log handlers, filters and formatters apply per record (level, date/time, indentation, colors),
+        which a single record gathering several lines would break.
         """
-        _long_text = msg % args  # type: str
+        # Debug lines would be filtered out by :class:`.logfilters.LoggerLogFilter` when debugging is disabled:
+        # don't even format the text in that case.
+        if (level <= logging.DEBUG) and (not self.isdebugenabled()):
+            return
 
         _lines_displayed = 0  # type: int
-        _lines = _long_text.splitlines()  # type: typing.List[str]
-        for _line in _lines:  # type: str
-            _lines_displayed += 1
-            if (max_lines is not None) and (_lines_displayed > max_lines):
-                _lines_displayed -= 1
+        for _line in Logger._iterlines(Logger._iterformat(msg, args)):  # type: str
+            if (max_lines is not None) and (_lines_displayed >= max_lines):
+                # More lines than expected.
+                self._torecord(level, "...", tuple([]), **kwargs)
                 break
+            _lines_displayed += 1
             self._torecord(level, _line, tuple([]), **kwargs)
-        if _lines_displayed < len(_lines):
-            self._torecord(level, "...", tuple([]), **kwargs)
+
+    @staticmethod
+    def _iterformat(
+            msg,  # type: str
+            args,  # type: typing.Tuple[typing.Any, ...]
+    ):  # type: (...) -> typing.Iterator[str]
+        """
+        Formats a log message with its arguments by chunks.
+
+        :param msg: Log message.
+        :param args: Positional arguments.
+        :return: Formatted string chunks.
+
+        Simple '%s' arguments that are :class:`.debugutils.DelayedStr` instances are iterated by chunks as well
+        (see :meth:`.debugutils.DelayedStr.iterstr()`).
+
+        Falls back to a plain ``msg % args`` formatting for mappings, '*' widths or precisions,
+        and when the number of arguments does not match the format.
+        """
+        from .debugutils import DelayedStr
+
+        if (not args) and isinstance(msg, DelayedStr):
+            yield from msg.iterstr()
+            return
+
+        _specs = list(_FORMAT_SPEC_REGEX.finditer(msg))  # type: typing.List[typing.Match[str]]
+        _fallback = False  # type: bool
+        if any(("(" in _spec.group(0)) or ("*" in _spec.group(0)) for _spec in _specs):
+            _fallback = True
+        elif len([_spec for _spec in _specs if _spec.group(0) != "%%"]) != len(args):
+            _fallback = True
+        if _fallback:
+            if (len(args) == 1) and isinstance(args[0], collections.abc.Mapping) and args[0]:
+                # Same as :class:`logging.LogRecord`, use a single mapping argument as the format mapping.
+                yield msg % args[0]
+            else:
+                yield msg % args
+            return
+
+        _pos = 0  # type: int
+        _arg_index = 0  # type: int
+        for _spec in _specs:  # Type already declared above.
+            if _spec.start() > _pos:
+                yield msg[_pos:_spec.start()]
+            _pos = _spec.end()
+            if _spec.group(0) == "%%":
+                yield "%"
+                continue
+            _arg = args[_arg_index]  # type: typing.Any
+            _arg_index += 1
+            if (_spec.group(0) == "%s") and isinstance(_arg, DelayedStr):
+                yield from _arg.iterstr()
+            else:
+                yield _spec.group(0) % (_arg, )
+        if _pos < len(msg):
+            yield msg[_pos:]
+
+    @staticmethod
+    def _iterlines(
+            chunks,  # type: typing.Iterable[str]
+    ):  # type: (...) -> typing.Iterator[str]
+        """
+        Splits string chunks into lines, as :meth:`str.splitlines()` would do on the concatenated string.
+
+        :param chunks: String chunks.
+        :return: Lines, without line breaks.
+        """
+        _buffer = []  # type: typing.List[str]
+        _skip_lf = False  # type: bool
+        for _chunk in chunks:  # type: str
+            _pos = 0  # type: int
+            if _skip_lf and _chunk.startswith("\n"):
+                # '\r\n' line break split over two chunks.
+                _pos = 1
+            _skip_lf = False
+            for _match in _LINE_BREAK_REGEX.finditer(_chunk, _pos):  # type: typing.Match[str]
+                _buffer.append(_chunk[_pos:_match.start()])
+                yield "".join(_buffer)
+                _buffer = []
+                _pos = _match.end()
+                _skip_lf = (_match.group(0) == "\r") and (_pos == len(_chunk))
+            if _pos < len(_chunk):
+                _buffer.append(_chunk[_pos:])
+        if _buffer:
+            yield "".join(_buffer)
+
+
+__doc__ += """
+.. py:attribute:: _FORMAT_SPEC_REGEX
+
+    '%' format specifier regular expression.
+"""
+_FORMAT_SPEC_REGEX = re.compile(r'%(\([^)]*\))?[#0\- +]*(\*|\d+)?(\.(\*|\d+))?[hlL]?[diouxXeEfFgGcrsa%]')  # type: typing.Pattern[str]
+
+__doc__ += """
+.. py:attribute:: _LINE_BREAK_REGEX
+
+    Line break regular expression, consistent with :meth:`str.splitlines()`.
+"""
+_LINE_BREAK_REGEX = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")  # type: typing.Pattern[str]
 
 
 if typing.TYPE_CHECKING:
@@ -18,7 +18,6 @@
 Logging service.
 """
 
-import logging
 import typing
 
 
@@ -31,6 +30,7 @@ class LoggingService:
         """
         Starts logging features.
         """
+        from .logfilehandler import LogFileHandler
         from .logfilters import HandlerLogFilter
         from .logformatter import LogFormatter
         from .loggermain import MAIN_LOGGER
@@ -41,7 +41,13 @@ class LoggingService:
         # Start file logging if required.
         _log_outpath = SCENARIO_CONFIG.logoutpath()  # type: typing.Optional[Path]
         if _log_outpath is not None:
-            LogHandler.file_handler = logging.FileHandler(_log_outpath, mode="w", encoding="utf-8")
+            LogHandler.file_handler = LogFileHandler(
+                _log_outpath,
+                max_size=SCENARIO_CONFIG.logfilemaxsize(),
+                tail_size=SCENARIO_CONFIG.logfiletailsize(),
+                backup_count=SCENARIO_CONFIG.logfilebackupcount(),
+                compress=SCENARIO_CONFIG.logfilecompress(),
+            )
             LogHandler.file_handler.addFilter(HandlerLogFilter(handler=LogHandler.file_handler))
             LogHandler.file_handler.setFormatter(LogFormatter(LogHandler.file_handler))
             MAIN_LOGGER.logging_instance.addHandler(LogHandler.file_handler)
@@ -27,6 +27,12 @@ from .console import Console
 # `StrEnum` used for inheritance.
 from .enumutils import StrEnum
 if typing.TYPE_CHECKING:
+    # `Compression` used in method signatures.
+    # Type declared for type checking only.
+    from .compression import Compression
+    # `T` used in method signatures.
+    # Type declared for type checking only.
+    from .configtypes import T
     # `AnyIssueLevelType` used in method signatures.
     from .issuelevels import AnyIssueLevelType
 # `Path` used in method signatures.
@@ -61,8 +67,25 @@ class ScenarioConfig:
         LOG_COLOR = "scenario.log_%s_color"
         #: Should the log lines be written in a log file? File path string.
         LOG_FILE = "scenario.log_file"
+        #: Maximum size of the log file, in bytes. Integer value.
+        LOG_FILE_MAX_SIZE = "scenario.log_file_max_size"
+        #: Size of the end of the log file retained when the maximum size is reached, in bytes. Integer value.
+        LOG_FILE_TAIL_SIZE = "scenario.log_file_tail_size"
+        #: Number of rotated log files to keep when the maximum size is reached. Integer value.
+        LOG_FILE_BACKUP_COUNT = "scenario.log_file_backup_count"
+        #: Should the log file be gzip-compressed once finished? Boolean value.
+        LOG_FILE_COMPRESS = "scenario.log_file_compress"
         #: Which debug classes to display? List of strings, or comma-separated string.
         DEBUG_CLASSES = "scenario.debug_classes"
+        #: Should execution times be traced and saved into a file? File path string.
+        EXEC_TIMES_FILE = "scenario.exec_times_file"
+        #: Should an execution timeline be saved into a file, in the Chrome trace-event format? File path string.
+        TRACE_EVENTS_FILE = "scenario.trace_events_file"
+
+        # Configuration.
+
+        #: Should parsed configuration files be cached, and where? Directory path string.
+        CONFIG_CACHE_DIR = "scenario.config_cache_dir"
 
         # Test execution & results.
 
@@ -72,6 +95,12 @@ class ScenarioConfig:
         CONTINUE_ON_ERROR = "scenario.continue_on_error"
         #: Should we wait between two step executions? Float value.
         DELAY_BETWEEN_STEPS = "scenario.delay_between_steps"
+        #: Should execution metrics be measured for each step and action / expected result? Boolean value.
+        STEP_METRICS = "scenario.step_metrics"
+        #: Should JSON reports be written in a compact form, without indentation? Boolean value.
+        JSON_REPORT_COMPACT = "scenario.json_report_compact"
+        #: Should JSON and JUnit reports be compressed once written, and how? Compression codec name: 'gzip', 'bz2' or 'xz'.
+        REPORT_COMPRESSION = "scenario.report_compression"
         #: Runner script path. Default is 'bin/run-test.py'.
         RUNNER_SCRIPT_PATH = "scenario.runner_script_path"
         #: Maximum time for a scenario execution. Useful when executing campaigns. Float value.
@@ -92,10 +121,14 @@ class ScenarioConfig:
 
     def __init__(self):  # type: (...) -> None
         """
-        Initializes the timezone cache information.
+        Initializes the configuration cache.
         """
-        #: Timezone cache information.
-        self.__timezone = None  # type: typing.Optional[str]
+        #: Configuration cache: configuration key => value computed by an accessor.
+        #:
+        #: See :meth:`_memoize()`.
+        self.__cache = {}  # type: typing.Dict[typing.Union[ScenarioConfig.Key, str], typing.Any]
+        #: Configuration keys subscribed to for changes.
+        self.__subscribed_keys = set()  # type: typing.Set[typing.Union[ScenarioConfig.Key, str]]
 
     def timezone(self):  # type: (...) -> typing.Optional[str]
         """
@@ -108,17 +141,16 @@ class ScenarioConfig:
         """
         from .configdb import CONFIG_DB
 
-        if self.__timezone is None:
-            # Set the cache member with an empty string if no configuration is set.
-            self.__timezone = (CONFIG_DB.get(self.Key.TIMEZONE, type=str) or "").strip()
         # Convert empty string to `None`.
-        return self.__timezone or None
+        return self._memoize(self.Key.TIMEZONE, lambda: (CONFIG_DB.get(self.Key.TIMEZONE, type=str) or "").strip() or None)
 
     def invalidatetimezonecache(self):  # type: (...) -> None
         """
         Invalidates the timezone cache information.
+
+        Kept for compatibility: the timezone cache information is now invalidated automatically on configuration changes.
         """
-        self.__timezone = None
+        self._invalidate(self.Key.TIMEZONE)
 
     def logdatetimeenabled(self):  # type: (...) -> bool
         """
@@ -128,7 +160,7 @@ class ScenarioConfig:
         """
         from .configdb import CONFIG_DB
 
-        return CONFIG_DB.get(self.Key.LOG_DATETIME, type=bool, default=True)
+        return self._memoize(self.Key.LOG_DATETIME, lambda: CONFIG_DB.get(self.Key.LOG_DATETIME, type=bool, default=True))
 
     def logconsoleenabled(self):  # type: (...) -> bool
         """
@@ -138,7 +170,7 @@ class ScenarioConfig:
         """
         from .configdb import CONFIG_DB
 
-        return CONFIG_DB.get(self.Key.LOG_CONSOLE, type=bool, default=True)
+        return self._memoize(self.Key.LOG_CONSOLE, lambda: CONFIG_DB.get(self.Key.LOG_CONSOLE, type=bool, default=True))
 
     def logoutpath(self):  # type: (...) -> typing.Optional[Path]
         """
@@ -151,11 +183,57 @@ class ScenarioConfig:
         from .configdb import CONFIG_DB
 
         _log_outpath = None  # type: typing.Optional[Path]
-        _config = CONFIG_DB.get(self.Key.LOG_FILE, type=str)  # type: typing.Optional[str]
+        _config = self._memoize(self.Key.LOG_FILE, lambda: CONFIG_DB.get(self.Key.LOG_FILE, type=str))  # type: typing.Optional[str]
         if _config is not None:
             _log_outpath = Path(_config)
         return _log_outpath
 
+    def logfilemaxsize(self):  # type: (...) -> typing.Optional[int]
+        """
+        Retrieves the maximum size of the log file.
+
+        :return: Maximum size in bytes, ``None`` for no limit.
+
+        Configurable through :const:`Key.LOG_FILE_MAX_SIZE`.
+        """
+        from .configdb import CONFIG_DB
+
+        return self._memoize(self.Key.LOG_FILE_MAX_SIZE, lambda: CONFIG_DB.get(self.Key.LOG_FILE_MAX_SIZE, type=int) or None)
+
+    def logfiletailsize(self):  # type: (...) -> typing.Optional[int]
+        """
+        Retrieves the size of the end of the log file to retain when the maximum size is reached.
+
+        :return: Tail size in bytes, ``None`` for the default (half of the maximum size).
+
+        Configurable through :const:`Key.LOG_FILE_TAIL_SIZE`.
+        """
+        from .configdb import CONFIG_DB
+
+        return self._memoize(self.Key.LOG_FILE_TAIL_SIZE, lambda: CONFIG_DB.get(self.Key.LOG_FILE_TAIL_SIZE, type=int))
+
+    def logfilebackupcount(self):  # type: (...) -> int
+        """
+        Retrieves the number of rotated log files to keep when the maximum size is reached.
+
+        :return: Number of rotated log files. ``0`` means no rotation (end of the log retained only).
+
+        Configurable through :const:`Key.LOG_FILE_BACKUP_COUNT`.
+        """
+        from .configdb import CONFIG_DB
+
+        return self._memoize(self.Key.LOG_FILE_BACKUP_COUNT, lambda: CONFIG_DB.get(self.Key.LOG_FILE_BACKUP_COUNT, type=int, default=0))
+
+    def logfilecompress(self):  # type: (...) -> bool
+        """
+        Determines whether log files should be gzip-compressed once finished.
+
+        Configurable through :const:`Key.LOG_FILE_COMPRESS`.
+        """
+        from .configdb import CONFIG_DB
+
+        return self._memoize(self.Key.LOG_FILE_COMPRESS, lambda: CONFIG_DB.get(self.Key.LOG_FILE_COMPRESS, type=bool, default=False))
+
     def logcolorenabled(self):  # type: (...) -> bool
         """
         Determines whether log colors should be used when displayed in the console.
@@ -164,7 +242,7 @@ class ScenarioConfig:
         """
         from .configdb import CONFIG_DB
 
-        return CONFIG_DB.get(self.Key.LOG_COLOR_ENABLED, type=bool, default=True)
+        return self._memoize(self.Key.LOG_COLOR_ENABLED, lambda: CONFIG_DB.get(self.Key.LOG_COLOR_ENABLED, type=bool, default=True))
 
     def logcolor(
             self,
@@ -182,16 +260,20 @@ class ScenarioConfig:
         """
         from .configdb import CONFIG_DB, ConfigNode
 
+        def _logcolor():  # type: (...) -> typing.Optional[Console.Color]
+            _config_node = CONFIG_DB.getnode(_key)  # type: typing.Optional[ConfigNode]
+            if _config_node:
+                _color_number = _config_node.cast(type=int)  # type: int
+                if _color_number is not None:
+                    try:
+                        return Console.Color(_color_number)
+                    except ValueError:
+                        self._warning(_config_node, f"Invalid color number {_color_number!r}")
+            return None
+
         _key = str(self.Key.LOG_COLOR) % level.lower()  # type: str
-        _config_node = CONFIG_DB.getnode(_key)  # type: typing.Optional[ConfigNode]
-        if _config_node:
-            _color_number = _config_node.cast(type=int)  # type: int
-            if _color_number is not None:
-                try:
-                    return Console.Color(_color_number)
-                except ValueError:
-                    self._warning(_config_node, f"Invalid color number {_color_number!r}")
-        return default
+        _color = self._memoize(_key, _logcolor)  # type: typing.Optional[Console.Color]
+        return default if _color is None else _color
 
     def debugclasses(self):  # type: (...) -> typing.List[str]
         """
@@ -211,18 +293,66 @@ class ScenarioConfig:
             if _debug_class not in _debug_classes:
                 _debug_classes.append(_debug_class)
         # ...and configuration database.
-        self._readstringlistfromconf(self.Key.DEBUG_CLASSES, _debug_classes)
+        for _debug_class in self._readstringlistfromconf(self.Key.DEBUG_CLASSES):  # Type already declared above.
+            if _debug_class not in _debug_classes:
+                _debug_classes.append(_debug_class)
         return _debug_classes
 
+    def exectimesoutpath(self):  # type: (...) -> typing.Optional[Path]
+        """
+        Determines whether execution times should be traced and saved into a file.
+
+        :return: Output execution times file path if set, ``None`` otherwise.
+
+        Configurable through :const:`Key.EXEC_TIMES_FILE`.
+        """
+        from .configdb import CONFIG_DB
+
+        _exec_times_outpath = None  # type: typing.Optional[Path]
+        _config = self._memoize(self.Key.EXEC_TIMES_FILE, lambda: CONFIG_DB.get(self.Key.EXEC_TIMES_FILE, type=str))  # type: typing.Optional[str]
+        if _config is not None:
+            _exec_times_outpath = Path(_config)
+        return _exec_times_outpath
+
+    def traceeventsoutpath(self):  # type: (...) -> typing.Optional[Path]
+        """
+        Determines whether an execution timeline should be saved into a file, in the Chrome trace-event format.
+
+        :return: Output trace-event file path if set, ``None`` otherwise.
+
+        Configurable through :const:`Key.TRACE_EVENTS_FILE`.
+        """
+        from .configdb import CONFIG_DB
+
+        _trace_events_outpath = None  # type: typing.Optional[Path]
+        _config = self._memoize(self.Key.TRACE_EVENTS_FILE, lambda: CONFIG_DB.get(self.Key.TRACE_EVENTS_FILE, type=str))  # type: typing.Optional[str]
+        if _config is not None:
+            _trace_events_outpath = Path(_config)
+        return _trace_events_outpath
+
+    def configcachedir(self):  # type: (...) -> typing.Optional[Path]
+        """
+        Determines whether parsed configuration files should be cached, and where.
+
+        :return: Configuration cache directory if set, ``None`` otherwise.
+
+        Configurable through :const:`Key.CONFIG_CACHE_DIR`.
+        """
+        from .configdb import CONFIG_DB
+
+        _config_cache_dir = None  # type: typing.Optional[Path]
+        _config = self._memoize(self.Key.CONFIG_CACHE_DIR, lambda: CONFIG_DB.get(self.Key.CONFIG_CACHE_DIR, type=str))  # type: typing.Optional[str]
+        if _config is not None:
+            _config_cache_dir = Path(_config)
+        return _config_cache_dir
+
     def expectedscenarioattributes(self):  # type: (...) -> typing.List[str]
         """
         Retrieves the user scenario expected attributes.
 
         Configurable through :attr:`Key.EXPECTED_ATTRIBUTES`.
         """
-        _attribute_names = []  # type: typing.List[str]
-        self._readstringlistfromconf(self.Key.EXPECTED_ATTRIBUTES, _attribute_names)
-        return _attribute_names
+        return self._readstringlistfromconf(self.Key.EXPECTED_ATTRIBUTES)
 
     def continueonerror(self):  # type: (...) -> bool
         """
@@ -232,7 +362,7 @@ class ScenarioConfig:
         """
         from .configdb import CONFIG_DB
 
-        return CONFIG_DB.get(self.Key.CONTINUE_ON_ERROR, type=bool, default=False)
+        return self._memoize(self.Key.CONTINUE_ON_ERROR, lambda: CONFIG_DB.get(self.Key.CONTINUE_ON_ERROR, type=bool, default=False))
 
     def delaybetweensteps(self):  # type: (...) -> float
         """
@@ -242,7 +372,41 @@ class ScenarioConfig:
         """
         from .configdb import CONFIG_DB
 
-        return CONFIG_DB.get(self.Key.DELAY_BETWEEN_STEPS, type=float, default=0.001)
+        return self._memoize(self.Key.DELAY_BETWEEN_STEPS, lambda: CONFIG_DB.get(self.Key.DELAY_BETWEEN_STEPS, type=float, default=0.001))
+
+    def stepmetrics(self):  # type: (...) -> bool
+        """
+        Determines whether execution metrics should be measured for each step and action / expected result:
+        monotonic wall time, process CPU time, memory allocations and garbage collections.
+
+        Configurable through :const:`Key.STEP_METRICS`.
+        """
+        from .configdb import CONFIG_DB
+
+        return self._memoize(self.Key.STEP_METRICS, lambda: CONFIG_DB.get(self.Key.STEP_METRICS, type=bool, default=False))
+
+    def jsonreportcompact(self):  # type: (...) -> bool
+        """
+        Determines whether JSON reports should be written in a compact form, without indentation nor whitespaces.
+
+        Configurable through :const:`Key.JSON_REPORT_COMPACT`.
+        """
+        from .configdb import CONFIG_DB
+
+        return self._memoize(self.Key.JSON_REPORT_COMPACT, lambda: CONFIG_DB.get(self.Key.JSON_REPORT_COMPACT, type=bool, default=False))
+
+    def reportcompression(self):  # type: (...) -> typing.Optional[Compression]
+        """
+        Determines whether JSON and JUnit reports should be compressed once written, and with which codec.
+
+        Configurable through :const:`Key.REPORT_COMPRESSION`.
+
+        :return: Compression codec. ``None`` for no compression.
+        """
+        from .compression import Compression
+        from .configdb import CONFIG_DB
+
+        return self._memoize(self.Key.REPORT_COMPRESSION, lambda: Compression.parse(CONFIG_DB.get(self.Key.REPORT_COMPRESSION, type=str)))
 
     def runnerscriptpath(self):  # type: (...) -> Path
         """
@@ -265,7 +429,7 @@ class ScenarioConfig:
         """
         from .configdb import CONFIG_DB
 
-        return CONFIG_DB.get(self.Key.SCENARIO_TIMEOUT, type=float, default=600.0)
+        return self._memoize(self.Key.SCENARIO_TIMEOUT, lambda: CONFIG_DB.get(self.Key.SCENARIO_TIMEOUT, type=float, default=600.0))
 
     def resultsextrainfo(self):  # type: (...) -> typing.List[str]
         """
@@ -289,7 +453,9 @@ class ScenarioConfig:
                 if _attribute_name not in _attribute_names:
                     _attribute_names.append(_attribute_name)
         # ...and configuration database.
-        self._readstringlistfromconf(self.Key.RESULTS_EXTRA_INFO, _attribute_names)
+        for _attribute_name in self._readstringlistfromconf(self.Key.RESULTS_EXTRA_INFO):  # Type already declared above.
+            if _attribute_name not in _attribute_names:
+                _attribute_names.append(_attribute_name)
         return _attribute_names
 
     def loadissuelevelnames(self):  # type: (...) -> None
@@ -338,7 +504,7 @@ class ScenarioConfig:
             if _args.issue_level_error is not None:
                 return _args.issue_level_error
 
-        return IssueLevel.parse(CONFIG_DB.get(self.Key.ISSUE_LEVEL_ERROR, type=int))
+        return self._memoize(self.Key.ISSUE_LEVEL_ERROR, lambda: IssueLevel.parse(CONFIG_DB.get(self.Key.ISSUE_LEVEL_ERROR, type=int)))
 
     def issuelevelignored(self):  # type: (...) -> typing.Optional[AnyIssueLevelType]
         """
@@ -358,41 +524,44 @@ class ScenarioConfig:
             if _args.issue_level_ignored is not None:
                 return _args.issue_level_ignored
 
-        return IssueLevel.parse(CONFIG_DB.get(self.Key.ISSUE_LEVEL_IGNORED, type=int))
+        return self._memoize(self.Key.ISSUE_LEVEL_IGNORED, lambda: IssueLevel.parse(CONFIG_DB.get(self.Key.ISSUE_LEVEL_IGNORED, type=int)))
 
     def _readstringlistfromconf(
             self,
             config_key,  # type: ScenarioConfig.Key
-            outlist,  # type: typing.List[str]
-    ):  # type: (...) -> None
+    ):  # type: (...) -> typing.List[str]
         """
-        Reads a string list from the configuration database, and feeds an output list.
+        Reads a string list from the configuration database.
 
         :param config_key:
             Configuration key for the string list.
 
             The configuration node pointed by ``config_key`` may be either a list of strings, or a comma-separated string.
-        :param outlist:
-            Output string list to feed.
-
-            Values are prevented in case of duplicates.
+        :return:
+            New string list, without duplicates.
         """
         from .configdb import CONFIG_DB
 
-        _conf_node = CONFIG_DB.getnode(config_key)  # type: typing.Optional[ConfigNode]
-        if _conf_node:
-            _data = _conf_node.data  # type: typing.Any
-            if isinstance(_data, list):
-                for _item in _data:  # type: typing.Any
-                    if _item and isinstance(_item, str) and (_item not in outlist):
-                        outlist.append(_item)
-            elif isinstance(_data, str):
-                for _part in _data.split(","):  # type: str
-                    _part = _part.strip()
-                    if _part and (_part not in outlist):
-                        outlist.append(_part)
-            else:
-                self._warning(_conf_node, f"Invalid type {type(_data)}")
+        def _readstringlist():  # type: (...) -> typing.List[str]
+            _list = []  # type: typing.List[str]
+            _conf_node = CONFIG_DB.getnode(config_key)  # type: typing.Optional[ConfigNode]
+            if _conf_node:
+                _data = _conf_node.data  # type: typing.Any
+                if isinstance(_data, list):
+                    for _item in _data:  # type: typing.Any
+                        if _item and isinstance(_item, str) and (_item not in _list):
+                            _list.append(_item)
+                elif isinstance(_data, str):
+                    for _part in _data.split(","):  # type: str
+                        _part = _part.strip()
+                        if _part and (_part not in _list):
+                            _list.append(_part)
+                else:
+                    self._warning(_conf_node, f"Invalid type {type(_data)}")
+            return _list
+
+        # Return a copy of the cached list, so that it cannot be modified by the caller.
+        return list(self._memoize(config_key, _readstringlist))
 
     def _warning(
             self,
@@ -409,6 +578,45 @@ class ScenarioConfig:
 
         CONFIG_DB.warning(node.errmsg(msg))
 
+    def _memoize(
+            self,
+            config_key,  # type: typing.Union[ScenarioConfig.Key, str]
+            compute,  # type: typing.Callable[[], T]
+    ):  # type: (...) -> T
+        """
+        Memoizes a value computed from the configuration database.
+
+        :param config_key: Configuration key the value depends on.
+        :param compute: Function that computes the value from the configuration database.
+        :return: Value computed, cached until the configuration changes at ``config_key``, at one of its ancestor keys, or at one of its sub-keys.
+        """
+        # Fast path: value already cached.
+        # Note: Cache entries are indexed with configuration keys as given, enums or strings, in order to avoid conversions.
+        try:
+            return typing.cast("T", self.__cache[config_key])
+        except KeyError:
+            pass
+
+        from .configdb import CONFIG_DB
+
+        if config_key not in self.__subscribed_keys:
+            CONFIG_DB.subscribe(config_key, lambda _changed_key: self._invalidate(config_key))
+            self.__subscribed_keys.add(config_key)
+        _value = compute()  # type: T
+        self.__cache[config_key] = _value
+        return _value
+
+    def _invalidate(
+            self,
+            config_key,  # type: typing.Union[ScenarioConfig.Key, str]
+    ):  # type: (...) -> None
+        """
+        Invalidates the value cached for a configuration key.
+
+        :param config_key: Configuration key of the cached value.
+        """
+        self.__cache.pop(config_key, None)
+
 
 __doc__ += """
 .. py:attribute:: ScenarioConfigKey
@@ -18,7 +18,6 @@
 Statistics class module.
 """
 
-import json
 import sys
 import typing
 
@@ -32,9 +31,18 @@ from .scenarioexecution import ScenarioDefinition
 from .stepdefinition import StepDefinition
 
 if typing.TYPE_CHECKING:
-    # `AnyPathType` used in method signatures.
+    # `ExecutionStatus` used in method signatures.
     # Type declared for type checking only.
-    from .path import AnyPathType
+    from .executionstatus import ExecutionStatus
+    # `AnyPathType` and `Path` used in method signatures.
+    # Type declared for type checking only.
+    from .path import AnyPathType, Path
+    # `ExecTotalStats` and `TimeStats` used in method signatures.
+    # Type declared for type checking only.
+    from .stats import ExecTotalStats, TimeStats
+    # `TestError` used in method signatures.
+    # Type declared for type checking only.
+    from .testerrors import TestError
     # `JSONDict` used in method signatures.
     # Type declared for type checking only.
     from .typing import JSONDict
@@ -57,6 +65,113 @@ class ScenarioReport(Logger):
         #: JSON report path being written or read.
         self._json_path = Path()  # type: Path
 
+        #: JSON report file being written step by step.
+        #:
+        #: See :meth:`beginjsonreport()`.
+        self._stream = None  # type: typing.Optional[typing.BinaryIO]
+        #: Scenario which JSON report is being written step by step.
+        self._stream_scenario = None  # type: typing.Optional[ScenarioDefinition]
+        #: Offsets of the steps already written in the JSON report file.
+        self._stream_step_offsets = []  # type: typing.List[int]
+        #: Offset of the end of the last step written in the JSON report file, where the temporary trailer begins.
+        self._stream_end = 0  # type: int
+        #: ``True`` when the JSON report file is being written in the compact form.
+        self._stream_compact = False  # type: bool
+
+    def beginjsonreport(
+            self,
+            scenario_definition,  # type: ScenarioDefinition
+            json_path,  # type: AnyPathType
+    ):  # type: (...) -> bool
+        """
+        Starts writing the JSON report output file for the given scenario execution.
+
+        :param scenario_definition: Scenario to generate the JSON report for.
+        :param json_path: Path to write the JSON report into.
+        :return: ``True`` for success, ``False`` otherwise.
+
+        Steps are then appended to the file with :meth:`onstepend()` as they finish,
+        and :meth:`writejsonreport()` eventually finalizes the report with the scenario status, errors, time and statistics.
+
+        The file remains a valid JSON document all along,
+        so that a scenario execution interrupted abruptly still leaves a readable report of the steps executed so far.
+        """
+        from .loggermain import MAIN_LOGGER
+        from .path import Path
+        from .scenarioconfig import SCENARIO_CONFIG
+
+        self._closestream()
+        try:
+            self.resetindentation()
+            self.debug("Starting JSON report '%s' for scenario %r", json_path, scenario_definition)
+
+            self._json_path = Path(json_path)
+            self._stream = open(self._json_path, "wb")
+            self._stream_scenario = scenario_definition
+            self._stream_step_offsets = []
+            self._stream_compact = SCENARIO_CONFIG.jsonreportcompact()
+
+            # Write the scenario header, without its closing brace, and open the step list.
+            _json_header = self._dumps(self._scenarioheader2json(scenario_definition, is_main=True))  # type: bytes
+            if self._stream_compact:
+                self._stream.write(_json_header[:-len(b"}")] + b',"steps":[')
+            else:
+                self._stream.write(_json_header[:-len(b"\n}")] + b',\n  "steps": [')
+            self._stream_end = self._stream.tell()
+            self._writestreamtrailer()
+
+            return True
+        except Exception as _err:
+            MAIN_LOGGER.error(f"Could not write JSON report '{json_path}': {_err}")
+            self.debug("Exception", exc_info=sys.exc_info())
+            self._closestream()
+            return False
+        finally:
+            self.resetindentation()
+
+    def onstepend(
+            self,
+            step_definition,  # type: StepDefinition
+    ):  # type: (...) -> None
+        """
+        Appends a step to the JSON report being written, if any, once the step has finished.
+
+        :param step_definition: Step definition just executed.
+
+        Steps of sub-scenarios, or of scenarios which JSON report is not being written with :meth:`beginjsonreport()`, are ignored.
+
+        Steps skipped (by the way of a *goto*) are written as is before the given step.
+        Steps executed again (by the way of a *goto* back) are written again from the given step.
+        """
+        from .loggermain import MAIN_LOGGER
+
+        if (self._stream is None) or (self._stream_scenario is None) or (step_definition.scenario is not self._stream_scenario):
+            return
+
+        try:
+            self.resetindentation()
+
+            # Find out the step index, the next one to write in general.
+            _step_index = len(self._stream_step_offsets)  # type: int
+            _steps = self._stream_scenario.steps  # type: typing.List[StepDefinition]
+            if (_step_index >= len(_steps)) or (_steps[_step_index] is not step_definition):
+                _step_index = _steps.index(step_definition)
+
+            # Step executed again: rewind the report file to the beginning of it.
+            if _step_index < len(self._stream_step_offsets):
+                self.debug("Rewinding JSON report '%s' to step #%d", self._json_path, _step_index + 1)
+                self._stream_end = self._stream_step_offsets[_step_index]
+                del self._stream_step_offsets[_step_index:]
+
+            self._writestreamsteps(_step_index + 1)
+            self._writestreamtrailer()
+        except Exception as _err:
+            MAIN_LOGGER.error(f"Could not write JSON report '{self._json_path}': {_err}")
+            self.debug("Exception", exc_info=sys.exc_info())
+            self._closestream()
+        finally:
+            self.resetindentation()
+
     def writejsonreport(
             self,
             scenario_definition,  # type: ScenarioDefinition
@@ -68,20 +183,47 @@ class ScenarioReport(Logger):
         :param scenario_definition: Scenario to generate the JSON report for.
         :param json_path: Path to write the JSON report into.
         :return: ``True`` for success, ``False`` otherwise.
+
+        Finalizes the JSON report when it has been started with :meth:`beginjsonreport()`,
+        writes it from scratch otherwise.
+
+        When :meth:`.scenarioconfig.ScenarioConfig.reportcompression()` is set,
+        the JSON report file is eventually compressed, and renamed with the compression suffix.
         """
+        from .compression import Compression
         from .loggermain import MAIN_LOGGER
         from .path import Path
+        from .scenarioconfig import SCENARIO_CONFIG
+
+        if (self._stream is None) or (self._stream_scenario is not scenario_definition) or (self._json_path != Path(json_path)):
+            if not self.beginjsonreport(scenario_definition, json_path):
+                return False
+        assert self._stream is not None
 
         try:
             self.resetindentation()
             self.debug("Writing scenario execution to JSON report '%s'", json_path)
 
-            # Build the JSON content.
-            self._json_path = Path(json_path)
-            _json = self._scenario2json(scenario_definition, is_main=True)  # type: JSONDict
-
-            # Write the JSON file.
-            Path(json_path).write_text(json.dumps(_json, indent=2), encoding="utf-8")
+            # Write the steps not written yet.
+            self._writestreamsteps(len(scenario_definition.steps))
+
+            # Close the step list, and write the scenario execution data.
+            self._stream.seek(self._stream_end)
+            self._stream.truncate()
+            self._stream.write(b"\n  ]" if (self._stream_step_offsets and not self._stream_compact) else b"]")
+            _json_execution = self._dumps(self._scenarioexecution2json(scenario_definition, is_main=True))  # type: bytes
+            if _json_execution != b"{}":
+                # Replace the opening brace with a comma.
+                self._stream.write(b"," + _json_execution[1:])
+            else:
+                self._stream.write(b"}" if self._stream_compact else b"\n}")
+            self._closestream()
+
+            # Compress the JSON report file when required.
+            _compression = SCENARIO_CONFIG.reportcompression()  # type: typing.Optional[Compression]
+            if _compression is not None:
+                self.debug("Compressing JSON report '%s' with %s", json_path, _compression)
+                _compression.compressfile(json_path)
 
             return True
         except Exception as _err:
@@ -89,8 +231,81 @@ class ScenarioReport(Logger):
             self.debug("Exception", exc_info=sys.exc_info())
             return False
         finally:
+            self._closestream()
             self.resetindentation()
 
+    def _writestreamsteps(
+            self,
+            step_count,  # type: int
+    ):  # type: (...) -> None
+        """
+        Writes the steps of the JSON report being written, up to the given step count.
+
+        :param step_count: Number of steps that should be written in the end.
+        """
+        assert (self._stream is not None) and (self._stream_scenario is not None)
+
+        self._stream.seek(self._stream_end)
+        self._stream.truncate()
+        while len(self._stream_step_offsets) < step_count:
+            self._stream_step_offsets.append(self._stream_end)
+            _step_definition = self._stream_scenario.steps[len(self._stream_step_offsets) - 1]  # type: StepDefinition
+            _json_step = self._dumps(self._step2json(_step_definition))  # type: bytes
+            if self._stream_compact:
+                self._stream.write((b"," if len(self._stream_step_offsets) > 1 else b"") + _json_step)
+            else:
+                # Indent the step JSON within the step list.
+                # Note: JSON strings dumped have no raw line separators.
+                self._stream.write(
+                    (b",\n" if len(self._stream_step_offsets) > 1 else b"\n")
+                    + b"\n".join(b"    " + _line for _line in _json_step.split(b"\n"))
+                )
+            self._stream_end = self._stream.tell()
+
+    def _writestreamtrailer(self):  # type: (...) -> None
+        """
+        Closes the step list and the scenario object temporarily, after :attr:`_stream_end`,
+        so that the JSON report file remains valid.
+        """
+        assert self._stream is not None
+
+        self._stream.seek(self._stream_end)
+        self._stream.truncate()
+        if self._stream_compact:
+            self._stream.write(b"]}")
+        else:
+            self._stream.write(b"\n  ]\n}" if self._stream_step_offsets else b"]\n}")
+        self._stream.flush()
+
+    def _closestream(self):  # type: (...) -> None
+        """
+        Closes the JSON report file being written, if any.
+        """
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception as _err:
+                self.debug("Error while closing '%s': %s", self._json_path, _err)
+        self._stream = None
+        self._stream_scenario = None
+        self._stream_step_offsets = []
+        self._stream_end = 0
+        self._stream_compact = False
+
+    def _dumps(
+            self,
+            json_data,  # type: JSONDict
+    ):  # type: (...) -> bytes
+        """
+        Dumps JSON data the way the JSON report being written is formatted.
+
+        :param json_data: JSON data to dump.
+        :return: UTF-8 encoded JSON string.
+        """
+        from .jsonutils import Json
+
+        return Json.dumps(json_data, compact=self._stream_compact)
+
     def readjsonreport(
             self,
             json_path,  # type: AnyPathType
@@ -102,7 +317,11 @@ class ScenarioReport(Logger):
         :return:
             Scenario data read from the JSON report file.
             ``None`` when the file could not be read, or its content could not be parsed successfully.
+
+        Compressed JSON report files are detected automatically, and decompressed on the fly.
         """
+        from .compression import Compression
+        from .jsonutils import Json
         from .loggermain import MAIN_LOGGER
         from .path import Path
 
@@ -111,7 +330,7 @@ class ScenarioReport(Logger):
             self.debug("Reading scenario execution from JSON report '%s'", json_path)
 
             # Read the JSON file.
-            _json = json.loads(Path(json_path).read_bytes())  # type: JSONDict
+            _json = Json.loads(Compression.readbytes(json_path))  # type: JSONDict
 
             # Analyze the JSON content.
             self._json_path = Path(json_path)
@@ -125,6 +344,48 @@ class ScenarioReport(Logger):
         finally:
             self.resetindentation()
 
+    def readjsonsummary(
+            self,
+            json_path,  # type: AnyPathType
+    ):  # type: (...) -> typing.Optional[ScenarioReportSummary]
+        """
+        Reads the summary of a JSON report file.
+
+        :param json_path: JSON file path to read.
+        :return:
+            Scenario summary read from the JSON report file.
+            ``None`` when the file could not be read, or its content could not be parsed successfully.
+
+        Compressed JSON report files are detected automatically, and decompressed on the fly.
+
+        Lighter than :meth:`readjsonreport()`:
+        step definitions, action / expected result definitions, their executions and evidence are not built,
+        which saves memory and time when aggregating numerous reports.
+        """
+        from .compression import Compression
+        from .jsonutils import Json
+        from .loggermain import MAIN_LOGGER
+        from .path import Path
+
+        try:
+            self.resetindentation()
+            self.debug("Reading scenario summary from JSON report '%s'", json_path)
+
+            # Read the JSON file.
+            _json = Json.loads(Compression.readbytes(json_path))  # type: JSONDict
+
+            # Analyze the JSON content.
+            self._json_path = Path(json_path)
+            _summary = self._json2summary(_json)  # type: ScenarioReportSummary
+
+            return _summary
+        except Exception as _err:
+            MAIN_LOGGER.error(f"Could not read JSON report '{json_path}': {_err}")
+            self.debug("Exception", exc_info=sys.exc_info())
+            return None
+        finally:
+            self.resetindentation()
+
     def _scenario2json(
             self,
             scenario_definition,  # type: ScenarioDefinition
@@ -138,12 +399,40 @@ class ScenarioReport(Logger):
         :return: JSON report object.
         """
         from .debugutils import jsondump
-        from .path import Path
-        from .testerrors import TestError
 
         self.debug("Generating JSON report for scenario %r", scenario_definition)
         self.pushindentation()
 
+        # Build a JSON object.
+        _json_scenario = self._scenarioheader2json(scenario_definition, is_main)  # type: JSONDict
+
+        # Steps.
+        _json_scenario["steps"] = []
+        for _step_definition in scenario_definition.steps:  # type: StepDefinition
+            _json_scenario["steps"].append(self._step2json(_step_definition))
+
+        # Status, errors, time & statistics.
+        _json_scenario.update(self._scenarioexecution2json(scenario_definition, is_main))
+
+        self.popindentation()
+        self.debug("JSON report generated for scenario %r: %s", scenario_definition.name, jsondump(_json_scenario, indent=2),
+                   extra=self.longtext(max_lines=20))
+        return _json_scenario
+
+    def _scenarioheader2json(
+            self,
+            scenario_definition,  # type: ScenarioDefinition
+            is_main,  # type: bool
+    ):  # type: (...) -> JSONDict
+        """
+        Scenario report JSON generation: fields before the step list.
+
+        :param scenario_definition: Scenario to generate the JSON report for.
+        :param is_main: True for the main scenario, False otherwise.
+        :return: JSON report object, with schema, name, script path and attributes.
+        """
+        from .path import Path
+
         # Build a JSON object.
         _json_scenario = {}  # type: JSONDict
 
@@ -166,10 +455,23 @@ class ScenarioReport(Logger):
         for _attribute_name in scenario_definition.getattributenames():  # type: str
             _json_scenario["attributes"][_attribute_name] = str(scenario_definition.getattribute(_attribute_name))
 
-        # Steps.
-        _json_scenario["steps"] = []
-        for _step_definition in scenario_definition.steps:  # type: StepDefinition
-            _json_scenario["steps"].append(self._step2json(_step_definition))
+        return _json_scenario
+
+    def _scenarioexecution2json(
+            self,
+            scenario_definition,  # type: ScenarioDefinition
+            is_main,  # type: bool
+    ):  # type: (...) -> JSONDict
+        """
+        Scenario report JSON generation: fields after the step list.
+
+        :param scenario_definition: Scenario to generate the JSON report for.
+        :param is_main: True for the main scenario, False otherwise.
+        :return: JSON report object, with status, errors, warnings, time and statistics. Empty when the scenario has not been executed.
+        """
+        from .testerrors import TestError
+
+        _json_scenario = {}  # type: JSONDict
 
         if scenario_definition.execution:
             # Status & errors.
@@ -193,9 +495,6 @@ class ScenarioReport(Logger):
                     "results": scenario_definition.execution.result_stats.tojson(),
                 }
 
-        self.popindentation()
-        self.debug("JSON report generated for scenario %r: %s", scenario_definition.name, jsondump(_json_scenario, indent=2),
-                   extra=self.longtext(max_lines=20))
         return _json_scenario
 
     def _json2scenario(
@@ -240,23 +539,85 @@ class ScenarioReport(Logger):
 
         # Status & errors.
         _scenario_definition.execution = ScenarioExecution(_scenario_definition)
-        for _json_error in json_scenario["errors"]:  # type: JSONDict
+        if "status" not in json_scenario:
+            _scenario_definition.execution.errors.append(self._incompleteerror())
+            self.debug("Error: %s", _scenario_definition.execution.errors[-1])
+        for _json_error in json_scenario.get("errors", []):  # type: JSONDict
             _scenario_definition.execution.errors.append(TestError.fromjson(_json_error))
             self.debug("Error: %s", _scenario_definition.execution.errors[-1])
         self.debug("Errors: %d", len(_scenario_definition.execution.errors))
 
-        for _json_warning in json_scenario["warnings"]:  # type: JSONDict
+        for _json_warning in json_scenario.get("warnings", []):  # type: JSONDict
             _scenario_definition.execution.warnings.append(TestError.fromjson(_json_warning))
             self.debug("Warning: %s", _scenario_definition.execution.warnings[-1])
         self.debug("Warnings: %d", len(_scenario_definition.execution.warnings))
 
         # Time & statistics.
-        _scenario_definition.execution.time = TimeStats.fromjson(json_scenario["time"])
+        if "time" in json_scenario:
+            _scenario_definition.execution.time = TimeStats.fromjson(json_scenario["time"])
         self.debug("Time statistics: %s", _scenario_definition.execution.time)
 
         self.popindentation()
         return _scenario_definition
 
+    def _json2summary(
+            self,
+            json_scenario,  # type: JSONDict
+    ):  # type: (...) -> ScenarioReportSummary
+        """
+        Scenario summary reading from JSON report.
+
+        :param json_scenario: Scenario JSON report to read.
+        :return: Scenario summary.
+        """
+        from .path import Path
+        from .stats import ExecTotalStats, TimeStats
+        from .testerrors import TestError
+
+        _summary = ScenarioReportSummary()  # type: ScenarioReportSummary
+
+        _summary.name = json_scenario["name"]
+        self.debug("Name: %r", _summary.name)
+
+        _summary.script_path = Path(json_scenario["href"], relative_to=Path.getmainpath() or Path.cwd())
+        self.debug("Script path: '%s'", _summary.script_path)
+
+        _summary.attributes = dict(json_scenario["attributes"])
+
+        if "status" not in json_scenario:
+            _summary.errors.append(self._incompleteerror())
+        for _json_error in json_scenario.get("errors", []):  # type: JSONDict
+            _summary.errors.append(TestError.fromjson(_json_error))
+        self.debug("Errors: %d", len(_summary.errors))
+        for _json_warning in json_scenario.get("warnings", []):  # type: JSONDict
+            _summary.warnings.append(TestError.fromjson(_json_warning))
+        self.debug("Warnings: %d", len(_summary.warnings))
+
+        if "time" in json_scenario:
+            _summary.time = TimeStats.fromjson(json_scenario["time"])
+        self.debug("Time statistics: %s", _summary.time)
+
+        # Note: Statistics are not available in incomplete JSON reports.
+        if "stats" in json_scenario:
+            _summary.step_stats = ExecTotalStats.fromjson(json_scenario["stats"]["steps"])
+            _summary.action_stats = ExecTotalStats.fromjson(json_scenario["stats"]["actions"])
+            _summary.result_stats = ExecTotalStats.fromjson(json_scenario["stats"]["results"])
+        self.debug("Statistics: steps %s, actions %s, results %s", _summary.step_stats, _summary.action_stats, _summary.result_stats)
+
+        return _summary
+
+    def _incompleteerror(self):  # type: (...) -> TestError
+        """
+        Builds the error set for the JSON report being read when it is incomplete.
+
+        :return: Test error.
+
+        An incomplete JSON report has no 'status' field, the scenario execution has been interrupted (see :meth:`beginjsonreport()`).
+        """
+        from .testerrors import TestError
+
+        return TestError(f"Incomplete JSON report '{self._json_path}', scenario execution interrupted")
+
     def _step2json(
             self,
             step_definition,  # type: StepDefinition
@@ -290,6 +651,8 @@ class ScenarioReport(Logger):
                     "errors": [],
                     "warnings": [],
                 }  # type: JSONDict
+                if _step_execution.metrics:
+                    _json_step_execution["metrics"] = _step_execution.metrics.tojson()
 
                 for _error in _step_execution.errors:  # type: TestError
                     _json_step_execution["errors"].append(_error.tojson())
@@ -320,7 +683,7 @@ class ScenarioReport(Logger):
         """
         from .debugutils import jsondump
         from .locations import CodeLocation
-        from .stats import TimeStats
+        from .stats import ExecMetrics, TimeStats
         from .stepexecution import StepExecution
         from .stepsection import StepSection
         from .testerrors import TestError
@@ -352,6 +715,10 @@ class ScenarioReport(Logger):
                 _step_execution.time = TimeStats.fromjson(_json_step_execution["time"])
                 self.debug("Time: %s", _step_execution.time)
 
+                if "metrics" in _json_step_execution:
+                    _step_execution.metrics = ExecMetrics.fromjson(_json_step_execution["metrics"])
+                    self.debug("Metrics: %s", _step_execution.metrics)
+
                 for _json_error in _json_step_execution["errors"]:  # type: JSONDict
                     _step_execution.errors.append(TestError.fromjson(_json_error))
                     self.debug("Error: %s", _step_execution.errors[-1])
@@ -404,6 +771,8 @@ class ScenarioReport(Logger):
                 "warnings": [],
                 "subscenarios": [],
             }  # type: JSONDict
+            if _action_result_execution.metrics:
+                _json_action_result_execution["metrics"] = _action_result_execution.metrics.tojson()
 
             for _error in _action_result_execution.errors:  # type: TestError
                 _json_action_result_execution["errors"].append(_error.tojson())
@@ -437,7 +806,7 @@ class ScenarioReport(Logger):
         """
         from .actionresultexecution import ActionResultExecution
         from .debugutils import jsondump
-        from .stats import TimeStats
+        from .stats import ExecMetrics, TimeStats
         from .testerrors import TestError
 
         self.debug("Reading action/result instance from JSON: %s", jsondump(json_action_result_definition, indent=2),
@@ -466,6 +835,10 @@ class ScenarioReport(Logger):
             _action_result_execution.time = TimeStats.fromjson(_json_action_result_execution["time"])
             self.debug("Time: %s", _action_result_execution.time)
 
+            if "metrics" in _json_action_result_execution:
+                _action_result_execution.metrics = ExecMetrics.fromjson(_json_action_result_execution["metrics"])
+                self.debug("Metrics: %s", _action_result_execution.metrics)
+
             _action_result_execution.evidence = _json_action_result_execution["evidence"].copy()
             self.debug("Evidence: %r", _action_result_execution.evidence)
 
@@ -495,6 +868,65 @@ class ScenarioReport(Logger):
         return _action_result_definition
 
 
+class ScenarioReportSummary:
+    """
+    Scenario execution summary, as read from a JSON report with :meth:`ScenarioReport.readjsonsummary()`.
+
+    Gives the same information as :class:`.scenarioexecution.ScenarioExecution` for status, errors, warnings, time and statistics,
+    without the step, action and expected result details.
+    """
+
+    def __init__(self):  # type: (...) -> None
+        """
+        Initializes an empty summary.
+        """
+        from .path import Path
+        from .stats import ExecTotalStats, TimeStats
+
+        #: Scenario name.
+        self.name = ""  # type: str
+        #: Scenario script path.
+        self.script_path = Path()  # type: Path
+        #: Scenario attributes.
+        self.attributes = {}  # type: typing.Dict[str, str]
+        #: Errors.
+        self.errors = []  # type: typing.List[TestError]
+        #: Warnings.
+        self.warnings = []  # type: typing.List[TestError]
+        #: Time statistics.
+        self.time = TimeStats()  # type: TimeStats
+        #: Step statistics.
+        self.step_stats = ExecTotalStats()  # type: ExecTotalStats
+        #: Action statistics.
+        self.action_stats = ExecTotalStats()  # type: ExecTotalStats
+        #: Expected result statistics.
+        self.result_stats = ExecTotalStats()  # type: ExecTotalStats
+
+    def __repr__(self):  # type: (...) -> str
+        """
+        Canonical string representation.
+        """
+        from .reflex import qualname
+
+        return f"<{qualname(type(self))} of '{self.name}'>"
+
+    @property
+    def status(self):  # type: (...) -> ExecutionStatus
+        """
+        Scenario execution status.
+
+        Computed from :attr:`errors` and :attr:`warnings`, the same way as :attr:`.scenarioexecution.ScenarioExecution.status`.
+        """
+        from .executionstatus import ExecutionStatus
+
+        if self.errors:
+            return ExecutionStatus.FAIL
+        elif self.warnings:
+            return ExecutionStatus.WARNINGS
+        else:
+            return ExecutionStatus.SUCCESS
+
+
 __doc__ += """
 .. py:attribute:: SCENARIO_REPORT
 
@@ -74,12 +74,16 @@ class ScenarioResults(Logger):
         """
         from .datetimeutils import f2strduration
         from .loggermain import MAIN_LOGGER
-        from .stats import ExecTotalStats
+        from .stats import ExecMetrics, ExecTotalStats
+        from .stepdefinition import StepDefinition
+        from .stepexecution import StepExecution
 
         _total_step_stats = ExecTotalStats()  # type: ExecTotalStats
         _total_action_stats = ExecTotalStats()  # type: ExecTotalStats
         _total_result_stats = ExecTotalStats()  # type: ExecTotalStats
         _total_time = 0.0  # type: float
+        _total_metrics = None  # type: typing.Optional[ExecMetrics]
+        _longest_step = None  # type: typing.Optional[typing.Tuple[ScenarioExecution, StepExecution, ExecMetrics]]
 
         # Scan the results, sum them up, and determine the way to display them.
         _name_field_len = 20  # type: int
@@ -97,6 +101,14 @@ class ScenarioResults(Logger):
             _total_result_stats.add(_scenario_execution.result_stats)
             if _scenario_execution.time.elapsed is not None:
                 _total_time += _scenario_execution.time.elapsed
+            for _step_definition in _scenario_execution.definition.steps:  # type: StepDefinition
+                for _step_execution in _step_definition.executions:  # type: StepExecution
+                    if _step_execution.metrics:
+                        if _total_metrics is None:
+                            _total_metrics = ExecMetrics()
+                        _total_metrics.add(_step_execution.metrics)
+                        if (_longest_step is None) or (_step_execution.metrics.wall > _longest_step[2].wall):
+                            _longest_step = (_scenario_execution, _step_execution, _step_execution.metrics)
             if _scenario_execution.errors:
                 _errors.append(_scenario_execution)
             elif _scenario_execution.warnings:
@@ -131,6 +143,9 @@ class ScenarioResults(Logger):
             _total_step_stats, _total_action_stats, _total_result_stats,
             f2strduration(_total_time), "",
         ))
+        if _total_metrics and _longest_step:
+            MAIN_LOGGER.info(f"Step metrics: {_total_metrics}")
+            MAIN_LOGGER.info(f"Longest step: {_longest_step[0].definition.name} {_longest_step[1].definition}: {_longest_step[2]}")
         MAIN_LOGGER.rawoutput("------------------------------------------------")
 
         for _scenario_execution in _successes:
@@ -41,6 +41,8 @@ from .stepdefinition import StepDefinition
 from .stepuserapi import StepUserApi
 # `TestError` used in method signatures.
 from .testerrors import TestError
+# `TRACER` used for method decoration.
+from .tracing import TRACER
 
 if typing.TYPE_CHECKING:
     # `StepSpecificationType` used in method signatures.
@@ -101,7 +103,6 @@ class ScenarioRunner(Logger):
 
         :return: Error code.
         """
-        from .debugloggers import ExecTimesLogger
         from .loggermain import MAIN_LOGGER
         from .loggingservice import LOGGING_SERVICE
         from .path import Path
@@ -112,8 +113,6 @@ class ScenarioRunner(Logger):
         from .scenariostack import SCENARIO_STACK
         from .testerrors import ExceptionError
 
-        _exec_times_logger = ExecTimesLogger("ScenarioRunner.main()")  # type: ExecTimesLogger
-
         try:
             # Analyze program arguments, if not already set.
             if not ScenarioArgs.isset():
@@ -124,12 +123,12 @@ class ScenarioRunner(Logger):
 
             # Start log features.
             LOGGING_SERVICE.start()
+            TRACER.start()
 
             _errors = []  # type: typing.List[ErrorCode]
             for _scenario_path in ScenarioArgs.getinstance().scenario_paths:  # type: Path
                 self.debug("Executing '%s'...", _scenario_path)
 
-                _exec_times_logger.tick("Before executepath()")
                 _res = self.executepath(_scenario_path)  # type: ErrorCode
                 if _res != ErrorCode.SUCCESS:
                     # The :meth:`executepath()` and :meth:`execute()` methods don't return :const:`.errcodes.ErrorCode.TEST_ERROR`.
@@ -150,18 +149,18 @@ class ScenarioRunner(Logger):
 
                 # Feed the :attr:`.scenarioresults.SCENARIO_RESULTS` instance.
                 SCENARIO_RESULTS.add(_scenario_execution)
-                _exec_times_logger.tick("After executepath()")
 
                 # Generate JSON report if required.
                 _json_report = ScenarioArgs.getinstance().json_report  # type: typing.Optional[Path]
                 if _json_report:
-                    SCENARIO_REPORT.writejsonreport(_scenario_execution.definition, _json_report)
-                    _exec_times_logger.tick("After JSON report generation")
+                    with TRACER.span("ScenarioRunner.main(): JSON report generation"):
+                        SCENARIO_REPORT.writejsonreport(_scenario_execution.definition, _json_report)
 
             if SCENARIO_RESULTS.count > 1:
                 SCENARIO_RESULTS.display()
 
-            # Terminate log features.
+            # Terminate tracing and log features.
+            TRACER.stop()
             LOGGING_SERVICE.stop()
 
             # End test.
@@ -177,7 +176,7 @@ class ScenarioRunner(Logger):
             ExceptionError(_exception).logerror(MAIN_LOGGER, logging.ERROR)
             return ErrorCode.INTERNAL_ERROR
         finally:
-            _exec_times_logger.finish()
+            TRACER.stop()
 
     # Scenario execution.
 
@@ -200,6 +199,7 @@ class ScenarioRunner(Logger):
         else:
             return ScenarioRunner.ExecutionMode.EXECUTE
 
+    @TRACER.traced("ScenarioRunner.executepath()")
     def executepath(
             self,
             scenario_path,  # type: AnyPathType
@@ -214,22 +214,20 @@ class ScenarioRunner(Logger):
 
         Feeds the :attr:`.scenarioresults.SCENARIO_RESULTS` instance.
         """
-        from .debugloggers import ExecTimesLogger
         from .loggermain import MAIN_LOGGER
         from .scenariodefinition import ScenarioDefinitionHelper
         from .testerrors import ExceptionError
 
-        _exec_times_logger = ExecTimesLogger("ScenarioRunner.executepath()")  # type: ExecTimesLogger
         # Save the current time before loading the scenario script
         # and the `ScenarioDefinition` instance has been eventually created.
         _t0 = time.time()  # type: float
 
         # Create a test instance.
         try:
-            _scenario_definition_class = (
-                ScenarioDefinitionHelper.getscenariodefinitionclassfromscript(scenario_path)
-            )  # type: typing.Type[ScenarioDefinition]
-            _exec_times_logger.tick("Once the definition class has been found")
+            with TRACER.span("ScenarioRunner.executepath(): scenario definition class lookup"):
+                _scenario_definition_class = (
+                    ScenarioDefinitionHelper.getscenariodefinitionclassfromscript(scenario_path)
+                )  # type: typing.Type[ScenarioDefinition]
         except ImportError as _err:
             ExceptionError(_err).logerror(MAIN_LOGGER, logging.ERROR)
             return ErrorCode.INPUT_MISSING_ERROR
@@ -241,25 +239,23 @@ class ScenarioRunner(Logger):
             return ErrorCode.INPUT_FORMAT_ERROR
 
         try:
-            _scenario_definition = _scenario_definition_class()  # type: ScenarioDefinition
-            _exec_times_logger.tick("Once the definition class has been instanciated")
+            with TRACER.span("ScenarioRunner.executepath(): scenario definition instanciation"):
+                _scenario_definition = _scenario_definition_class()  # type: ScenarioDefinition
         except Exception as _err:
             # Unexpected exception.
             MAIN_LOGGER.error(f"Unexpected exception: {_err}", exc_info=sys.exc_info())
             return ErrorCode.INTERNAL_ERROR
 
-        _exec_times_logger.tick("Before executing the step")
         _err_code = self.executescenario(
             _scenario_definition,
             # Instanciation sometimes takes a while.
             # Ensure the starting time is set to when this method has actually been called.
             start_time=_t0,
         )  # type: ErrorCode
-        _exec_times_logger.tick("After executing the step")
 
-        _exec_times_logger.finish()
         return _err_code
 
+    @TRACER.traced("ScenarioRunner.executescenario()")
     def executescenario(
             self,
             scenario_definition,  # type: ScenarioDefinition
@@ -277,20 +273,18 @@ class ScenarioRunner(Logger):
         :return:
             Error code, but no :const:`.errcodes.ErrorCode.TEST_ERROR`.
         """
-        from .debugloggers import ExecTimesLogger
-
-        _exec_times_logger = ExecTimesLogger("ScenarioRunner.executescenario()")  # type: ExecTimesLogger
-
         self.debug("Executing scenario %r", scenario_definition)
+        if TRACER.enabled:
+            TRACER.annotate(scenario=scenario_definition.name)
 
         # Build and begin the scenario.
-        _res = self._buildscenario(scenario_definition)  # type: ErrorCode
-        _exec_times_logger.tick("After _buildscenario()")
+        with TRACER.span("ScenarioRunner.executescenario(): scenario building"):
+            _res = self._buildscenario(scenario_definition)  # type: ErrorCode
         if _res != ErrorCode.SUCCESS:
             return _res
         assert scenario_definition.execution
-        _res = self._beginscenario(scenario_definition)
-        _exec_times_logger.tick("After _beginscenario()")
+        with TRACER.span("ScenarioRunner.executescenario(): scenario beginning"):
+            _res = self._beginscenario(scenario_definition)
         if _res != ErrorCode.SUCCESS:
             return _res
         if start_time is not None:
@@ -308,16 +302,14 @@ class ScenarioRunner(Logger):
             # Move to next step.
             if scenario_definition.execution.current_step_definition:
                 scenario_definition.execution.nextstep()
-        _exec_times_logger.tick("After step executions")
 
         # End the scenario.
-        _res = self._endscenario(scenario_definition)
+        with TRACER.span("ScenarioRunner.executescenario(): scenario ending"):
+            _res = self._endscenario(scenario_definition)
         if _res != ErrorCode.SUCCESS:
             return _res
-        _exec_times_logger.tick("After _endscenario()")
 
         # Whether a test error occurred or not, return SUCCESS in this method.
-        _exec_times_logger.finish()
         return ErrorCode.SUCCESS
 
     def _buildscenario(
@@ -383,9 +375,12 @@ class ScenarioRunner(Logger):
         """
         from .handlers import HANDLERS
         from .loggermain import MAIN_LOGGER
+        from .path import Path
+        from .scenarioargs import ScenarioArgs
         from .scenarioconfig import SCENARIO_CONFIG
         from .scenarioevents import ScenarioEvent, ScenarioEventData
         from .scenariologging import SCENARIO_LOGGING
+        from .scenarioreport import SCENARIO_REPORT
         from .scenariostack import SCENARIO_STACK
 
         self.debug("_beginscenario(scenario_definition=%r)", scenario_definition)
@@ -424,6 +419,12 @@ class ScenarioRunner(Logger):
 
             SCENARIO_LOGGING.endattributes()
 
+            # Start the JSON report if required, in order to write steps as they finish.
+            if ScenarioArgs.isset():
+                _json_report = ScenarioArgs.getinstance().json_report  # type: typing.Optional[Path]
+                if _json_report:
+                    SCENARIO_REPORT.beginjsonreport(scenario_definition, _json_report)
+
         # Start execution time.
         assert scenario_definition.execution
         scenario_definition.execution.time.setstarttime()
@@ -490,6 +491,7 @@ class ScenarioRunner(Logger):
         self.popindentation()
         return ErrorCode.SUCCESS
 
+    @TRACER.traced("ScenarioRunner._execstep()")
     def _execstep(
             self,
             step_definition,  # type: StepDefinition
@@ -503,13 +505,17 @@ class ScenarioRunner(Logger):
         from .scenarioconfig import SCENARIO_CONFIG
         from .scenarioevents import ScenarioEvent, ScenarioEventData
         from .scenariologging import SCENARIO_LOGGING
+        from .scenarioreport import SCENARIO_REPORT
         from .scenariostack import SCENARIO_STACK
+        from .stats import ExecMetrics
         from .stepdefinition import StepDefinitionHelper
         from .stepexecution import StepExecution
         from .stepsection import StepSection
         from .testerrors import ExceptionError
 
         self.debug("Beginning of %r", step_definition)
+        if TRACER.enabled:
+            TRACER.annotate(step=step_definition.name)
 
         if isinstance(step_definition, StepSection):
             if self._execution_mode != ScenarioRunner.ExecutionMode.BUILD_OBJECTS:
@@ -535,6 +541,10 @@ class ScenarioRunner(Logger):
             # Start time by the way.
             if self._execution_mode != ScenarioRunner.ExecutionMode.BUILD_OBJECTS:
                 step_definition.executions.append(StepExecution(step_definition, _step_number))
+            # Start execution metrics when enabled.
+            if (self._execution_mode == ScenarioRunner.ExecutionMode.EXECUTE) and SCENARIO_CONFIG.stepmetrics():
+                step_definition.executions[-1].metrics = ExecMetrics()
+                step_definition.executions[-1].metrics.start()
 
             # Display the step description.
             if self._execution_mode != ScenarioRunner.ExecutionMode.BUILD_OBJECTS:
@@ -576,11 +586,17 @@ class ScenarioRunner(Logger):
             elif self._execution_mode == ScenarioRunner.ExecutionMode.EXECUTE:
                 # End time.
                 step_definition.executions[-1].time.setendtime()
+                if step_definition.executions[-1].metrics:
+                    step_definition.executions[-1].metrics.stop()
 
             # Execute *after step* handlers.
             if self._execution_mode != ScenarioRunner.ExecutionMode.BUILD_OBJECTS:
                 HANDLERS.callhandlers(ScenarioEvent.AFTER_STEP, ScenarioEventData.Step(step_definition=step_definition))
 
+        # Write the step in the JSON report, if being written.
+        if self._execution_mode != ScenarioRunner.ExecutionMode.BUILD_OBJECTS:
+            SCENARIO_REPORT.onstepend(step_definition)
+
         self.debug("End of %r", step_definition)
 
         # Delay between steps.
@@ -642,8 +658,10 @@ class ScenarioRunner(Logger):
         :param description: Action or expected result description.
         """
         from .actionresultexecution import ActionResultExecution
+        from .scenarioconfig import SCENARIO_CONFIG
         from .scenariologging import SCENARIO_LOGGING
         from .scenariostack import SCENARIO_STACK
+        from .stats import ExecMetrics
 
         self.debug("onactionresult(action_result_type=%s, description=%r)", action_result_type, description)
 
@@ -674,6 +692,10 @@ class ScenarioRunner(Logger):
             # Create the action/result execution instance (in EXECUTE mode only).
             if self._execution_mode == ScenarioRunner.ExecutionMode.EXECUTE:
                 _action_result_definition.executions.append(ActionResultExecution(_action_result_definition))
+                if SCENARIO_CONFIG.stepmetrics():
+                    _action_result_definition.executions[-1].metrics = ExecMetrics()
+                    _action_result_definition.executions[-1].metrics.start()
+                TRACER.begin(f"ScenarioRunner.onactionresult(): {action_result_type}", args={"description": description})
 
             # Display.
             SCENARIO_LOGGING.actionresult(_action_result_definition, description)
@@ -693,6 +715,9 @@ class ScenarioRunner(Logger):
 
                 if self._execution_mode == ScenarioRunner.ExecutionMode.EXECUTE:
                     SCENARIO_STACK.current_action_result_execution.time.setendtime()
+                    if SCENARIO_STACK.current_action_result_execution.metrics:
+                        SCENARIO_STACK.current_action_result_execution.metrics.stop()
+                    TRACER.end()
 
                 SCENARIO_STACK.current_step_execution.current_action_result_definition = None
 
@@ -275,3 +275,300 @@ class ExecTotalStats:
         if ("total" in json_data) and isinstance(json_data["total"], int):
             _stat.total = json_data["total"]
         return _stat
+
+
+class ExecMetrics:
+    """
+    Execution metrics: monotonic wall time, process CPU time, memory allocations and garbage collections.
+
+    Memory allocations are traced with :mod:`tracemalloc`, started with the outermost measurement,
+    and stopped with it when not started by someone else.
+
+    Measurements may be nested (actions within steps, sub-scenario steps within actions...).
+    """
+
+    #: Measurements in progress, from the outermost to the innermost.
+    _measuring = []  # type: typing.List[ExecMetrics]
+    #: ``True`` when :mod:`tracemalloc` has been started by :class:`ExecMetrics`.
+    _tracemalloc_started = False  # type: bool
+
+    def __init__(self):  # type: (...) -> None
+        """
+        Initializes the metrics with ``0`` values.
+        """
+        #: Monotonic wall time, in seconds.
+        self.wall = 0.0  # type: float
+        #: Process CPU time, in seconds.
+        self.cpu = 0.0  # type: float
+        #: Peak memory allocated above the starting level, in bytes.
+        self.mem_peak = 0  # type: int
+        #: Net memory allocated (possibly negative), in bytes.
+        self.mem_net = 0  # type: int
+        #: Number of garbage collections.
+        self.gc_collections = 0  # type: int
+
+        #: Starting monotonic time.
+        self._wall0 = 0.0  # type: float
+        #: Starting process CPU time.
+        self._cpu0 = 0.0  # type: float
+        #: Starting traced memory.
+        self._mem0 = 0  # type: int
+        #: Peak traced memory.
+        self._peak = 0  # type: int
+        #: :mod:`tracemalloc` peak at start, above which the :mod:`tracemalloc` peak is known to be reached during the measurement.
+        self._tracemalloc_peak0 = 0  # type: int
+        #: Starting number of garbage collections.
+        self._gc0 = 0  # type: int
+
+    def __str__(self):  # type: (...) -> str
+        """
+        Computes a human readable representation of the metrics.
+
+        :return: String representation of the metrics.
+        """
+        from .datetimeutils import f2strduration
+
+        return (
+            f"wall {f2strduration(self.wall)}, CPU {f2strduration(self.cpu)}, "
+            f"memory peak {self.mem_peak / 1024:.1f} KB, net {self.mem_net / 1024:+.1f} KB, "
+            f"{self.gc_collections} GC collection(s)"
+        )
+
+    def start(self):  # type: (...) -> None
+        """
+        Starts measuring.
+        """
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            ExecMetrics._tracemalloc_started = True
+
+        # Save the peak memory of the measurements in progress before resetting it.
+        ExecMetrics._collectpeak()
+        # Note: `tracemalloc.reset_peak()` available from Python 3.9 only.
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        self._mem0, self._tracemalloc_peak0 = tracemalloc.get_traced_memory()
+        self._peak = self._mem0
+        self._gc0 = ExecMetrics._gccollections()
+        ExecMetrics._measuring.append(self)
+
+        self._cpu0 = time.process_time()
+        self._wall0 = time.perf_counter()
+
+    def stop(self):  # type: (...) -> None
+        """
+        Stops measuring, and computes the metrics.
+        """
+        import tracemalloc
+
+        _wall = time.perf_counter()  # type: float
+        _cpu = time.process_time()  # type: float
+
+        if self not in ExecMetrics._measuring:
+            return
+
+        ExecMetrics._collectpeak()
+        # Inner measurements not stopped are dropped as well.
+        del ExecMetrics._measuring[ExecMetrics._measuring.index(self):]
+
+        self.wall = _wall - self._wall0
+        self.cpu = _cpu - self._cpu0
+        self.mem_peak = self._peak - self._mem0
+        self.mem_net = tracemalloc.get_traced_memory()[0] - self._mem0
+        self.gc_collections = ExecMetrics._gccollections() - self._gc0
+
+        # Stop tracing memory allocations with the outermost measurement, so that it does not slow down the rest of the process.
+        if (not ExecMetrics._measuring) and ExecMetrics._tracemalloc_started:
+            tracemalloc.stop()
+            ExecMetrics._tracemalloc_started = False
+
+    def add(
+            self,
+            metrics,  # type: ExecMetrics
+    ):  # type: (...) -> ExecMetrics
+        """
+        Integrates a tier :class:`ExecMetrics` instance into this one.
+
+        :param metrics: Tier :class:`ExecMetrics` instance.
+        :return: Self (named parameter idiom).
+
+        Sums up times, net memory and garbage collections, and keeps the greatest peak memory.
+        """
+        self.wall += metrics.wall
+        self.cpu += metrics.cpu
+        self.mem_peak = max(self.mem_peak, metrics.mem_peak)
+        self.mem_net += metrics.mem_net
+        self.gc_collections += metrics.gc_collections
+        return self
+
+    def tojson(self):  # type: (...) -> JSONDict
+        """
+        Converts the :class:`ExecMetrics` instance into a JSON dictionary.
+
+        :return: JSON dictionary, with 'wall' and 'cpu' ``float`` fields in seconds,
+                 'memory-peak' and 'memory-net' ``int`` fields in bytes, and a 'gc-collections' ``int`` field.
+        """
+        return {
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "memory-peak": self.mem_peak,
+            "memory-net": self.mem_net,
+            "gc-collections": self.gc_collections,
+        }
+
+    @staticmethod
+    def fromjson(
+            json_data,  # type: JSONDict
+    ):  # type: (...) -> ExecMetrics
+        """
+        Builds a :class:`ExecMetrics` instance from its JSON representation.
+
+        :param json_data: JSON dictionary, with 'wall', 'cpu', 'memory-peak', 'memory-net' and 'gc-collections' fields.
+        :return: New :class:`ExecMetrics` instance.
+        """
+        _metrics = ExecMetrics()  # type: ExecMetrics
+        if isinstance(json_data.get("wall"), (int, float)):
+            _metrics.wall = float(json_data["wall"])
+        if isinstance(json_data.get("cpu"), (int, float)):
+            _metrics.cpu = float(json_data["cpu"])
+        if isinstance(json_data.get("memory-peak"), int):
+            _metrics.mem_peak = json_data["memory-peak"]
+        if isinstance(json_data.get("memory-net"), int):
+            _metrics.mem_net = json_data["memory-net"]
+        if isinstance(json_data.get("gc-collections"), int):
+            _metrics.gc_collections = json_data["gc-collections"]
+        return _metrics
+
+    @staticmethod
+    def _collectpeak():  # type: (...) -> None
+        """
+        Reports the current peak traced memory to the measurements in progress.
+
+        When the :mod:`tracemalloc` peak has not exceeded its value at the beginning of a measurement,
+        it may have been reached before (:func:`tracemalloc.reset_peak()` not available before Python 3.9):
+        the current traced memory is reported instead.
+        """
+        import tracemalloc
+
+        if ExecMetrics._measuring:
+            _current, _peak = tracemalloc.get_traced_memory()  # type: int, int
+            for _metrics in ExecMetrics._measuring:  # type: ExecMetrics
+                _metrics._peak = max(_metrics._peak, _peak if (_peak > _metrics._tracemalloc_peak0) else _current)
+
+    @staticmethod
+    def _gccollections():  # type: (...) -> int
+        """
+        :return: Number of garbage collections so far, all generations included.
+        """
+        import gc
+
+        return sum(_gen_stats["collections"] for _gen_stats in gc.get_stats())
+
+
+class ResourceUsage:
+    """
+    Resource usage of a terminated child process, as given by :func:`os.wait4()`.
+    """
+
+    def __init__(self):  # type: (...) -> None
+        """
+        Initializes the resource usage with ``0`` values.
+        """
+        #: User CPU time, in seconds.
+        self.user_time = 0.0  # type: float
+        #: System CPU time, in seconds.
+        self.system_time = 0.0  # type: float
+        #: Maximum resident set size, in bytes.
+        self.max_rss = 0  # type: int
+        #: Number of voluntary context switches.
+        self.voluntary_ctx_switches = 0  # type: int
+        #: Number of involuntary context switches.
+        self.involuntary_ctx_switches = 0  # type: int
+        #: Number of block input operations.
+        self.in_blocks = 0  # type: int
+        #: Number of block output operations.
+        self.out_blocks = 0  # type: int
+
+    def __str__(self):  # type: (...) -> str
+        """
+        Computes a human readable representation of the resource usage.
+
+        :return: String representation of the resource usage.
+        """
+        from .datetimeutils import f2strduration
+
+        return (
+            f"user {f2strduration(self.user_time)}, system {f2strduration(self.system_time)}, "
+            f"max RSS {self.max_rss / 1024:.1f} KB, "
+            f"context switches {self.voluntary_ctx_switches} voluntary / {self.involuntary_ctx_switches} involuntary, "
+            f"blocks {self.in_blocks} in / {self.out_blocks} out"
+        )
+
+    @staticmethod
+    def fromrusage(
+            rusage,  # type: typing.Any
+    ):  # type: (...) -> ResourceUsage
+        """
+        Builds a :class:`ResourceUsage` instance from a :class:`resource.struct_rusage` object.
+
+        :param rusage: :class:`resource.struct_rusage` object, as returned by :func:`os.wait4()`.
+        :return: New :class:`ResourceUsage` instance.
+        """
+        import sys
+
+        _rusage = ResourceUsage()  # type: ResourceUsage
+        _rusage.user_time = rusage.ru_utime
+        _rusage.system_time = rusage.ru_stime
+        # Note: `ru_maxrss` is given in bytes on macOS, in kilobytes elsewhere.
+        _rusage.max_rss = rusage.ru_maxrss if sys.platform == "darwin" else (rusage.ru_maxrss * 1024)
+        _rusage.voluntary_ctx_switches = rusage.ru_nvcsw
+        _rusage.involuntary_ctx_switches = rusage.ru_nivcsw
+        _rusage.in_blocks = rusage.ru_inblock
+        _rusage.out_blocks = rusage.ru_oublock
+        return _rusage
+
+    def tojson(self):  # type: (...) -> JSONDict
+        """
+        Converts the :class:`ResourceUsage` instance into a JSON dictionary.
+
+        :return: JSON dictionary, with 'user-time' and 'system-time' ``float`` fields in seconds, a 'max-rss' ``int`` field in bytes,
+                 and 'voluntary-ctx-switches', 'involuntary-ctx-switches', 'in-blocks' and 'out-blocks' ``int`` fields.
+        """
+        return {
+            "user-time": self.user_time,
+            "system-time": self.system_time,
+            "max-rss": self.max_rss,
+            "voluntary-ctx-switches": self.voluntary_ctx_switches,
+            "involuntary-ctx-switches": self.involuntary_ctx_switches,
+            "in-blocks": self.in_blocks,
+            "out-blocks": self.out_blocks,
+        }
+
+    @staticmethod
+    def fromjson(
+            json_data,  # type: JSONDict
+    ):  # type: (...) -> ResourceUsage
+        """
+        Builds a :class:`ResourceUsage` instance from its JSON representation.
+
+        :param json_data: JSON dictionary, with the fields described by :meth:`tojson()`.
+        :return: New :class:`ResourceUsage` instance.
+        """
+        _rusage = ResourceUsage()  # type: ResourceUsage
+        if isinstance(json_data.get("user-time"), (int, float)):
+            _rusage.user_time = float(json_data["user-time"])
+        if isinstance(json_data.get("system-time"), (int, float)):
+            _rusage.system_time = float(json_data["system-time"])
+        if isinstance(json_data.get("max-rss"), int):
+            _rusage.max_rss = json_data["max-rss"]
+        if isinstance(json_data.get("voluntary-ctx-switches"), int):
+            _rusage.voluntary_ctx_switches = json_data["voluntary-ctx-switches"]
+        if isinstance(json_data.get("involuntary-ctx-switches"), int):
+            _rusage.involuntary_ctx_switches = json_data["involuntary-ctx-switches"]
+        if isinstance(json_data.get("in-blocks"), int):
+            _rusage.in_blocks = json_data["in-blocks"]
+        if isinstance(json_data.get("out-blocks"), int):
+            _rusage.out_blocks = json_data["out-blocks"]
+        return _rusage
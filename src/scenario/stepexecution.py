@@ -23,8 +23,8 @@ import typing
 
 # `ActionResultDefinition` used in method signatures.
 from .actionresultdefinition import ActionResultDefinition
-# `ExecTotalStats` used in method signatures.
-from .stats import ExecTotalStats
+# `ExecMetrics` and `ExecTotalStats` used in method signatures.
+from .stats import ExecMetrics, ExecTotalStats
 # `StepDefinition` used in method signatures.
 from .stepdefinition import StepDefinition
 
@@ -68,6 +68,10 @@ class StepExecution:
         self.current_action_result_definition = None  # type: typing.Optional[ActionResultDefinition]
         #: Time statistics.
         self.time = TimeStats()  # type: TimeStats
+        #: Execution metrics, when enabled.
+        #:
+        #: See :meth:`.scenarioconfig.ScenarioConfig.stepmetrics()`.
+        self.metrics = None  # type: typing.Optional[ExecMetrics]
         #: Error.
         self.errors = []  # type: typing.List[TestError]
         #: Warnings.
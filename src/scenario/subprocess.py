@@ -18,29 +18,40 @@
 :class:`SubProcess` class definition.
 """
 
+import functools
 import logging
 import os
 import pathlib
 import subprocess
 import sys
 import threading
+import time
 import typing
 
 # `ErrorCode` used in method signatures.
 from .errcodes import ErrorCode
 # `Logger` used in method signatures.
 from .logger import Logger
+# `SubProcessOutput` used in method signatures.
+from .subprocessoutput import SubProcessOutput
 
 if typing.TYPE_CHECKING:
     # `AnyPathType` used in method signatures.
     # Type declared for type checking only.
     from .path import AnyPathType
+    # `ResourceUsage` used in type definitions.
+    # Type declared for type checking only.
+    from .stats import ResourceUsage
+    # `DispatchQueue` used in type definitions.
+    # Type declared for type checking only.
+    from .subprocessreactor import DispatchQueue
 
 
 class SubProcess:
     """
     Sub-process execution.
     """
+
     def __init__(
             self,
             *args  # type: typing.Union[str, AnyPathType]
@@ -68,26 +79,40 @@ class SubProcess:
         self._stdout_line_handler = None  # type: typing.Optional[typing.Callable[[bytes], None]]
         #: Handler to call on each stderr line.
         self._stderr_line_handler = None  # type: typing.Optional[typing.Callable[[bytes], None]]
+        #: Handler to call on each batch of stdout lines.
+        self._stdout_lines_handler = None  # type: typing.Optional[typing.Callable[[typing.List[bytes]], None]]
+        #: Handler to call on each batch of stderr lines.
+        self._stderr_lines_handler = None  # type: typing.Optional[typing.Callable[[typing.List[bytes]], None]]
         #: See :meth:`exitonerror()`.
         self._exit_on_error_code = None  # type: typing.Optional[ErrorCode]
 
         #: Sub-process return code.
         self.returncode = None  # type: typing.Optional[int]
-        #: Standard output as a string.
-        self.stdout = b''  # type: bytes
-        #: Standard error as a string.
-        self.stderr = b''  # type: bytes
+        #: Standard output buffer.
+        #:
+        #: See :meth:`setoutputlimit()`.
+        self.stdout_buffer = SubProcessOutput("stdout")  # type: SubProcessOutput
+        #: Standard error buffer.
+        #:
+        #: See :meth:`setoutputlimit()`.
+        self.stderr_buffer = SubProcessOutput("stderr")  # type: SubProcessOutput
         #: Time statistics.
         self.time = TimeStats()  # type: TimeStats
+        #: Resource usage, once the sub-process has terminated.
+        #:
+        #: Available on platforms providing :func:`os.wait4()` only, and not with :meth:`arun()`.
+        self.rusage = None  # type: typing.Optional[ResourceUsage]
 
         #: :class:`subprocess.Popen` instance.
         self._popen = None  # type: typing.Optional[subprocess.Popen[bytes]]
         #: Tells whether the :meth:`run()` method should wait for the end of the sub-process.
         self._async = False  # type: bool
-        #: Stdout reader thread routine.
-        self._stdout_reader = None  # type: typing.Optional[threading.Thread]
-        #: Stderr reader thread routine.
-        self._stderr_reader = None  # type: typing.Optional[threading.Thread]
+        #: Events set when the stdout and stderr pipes have been read until their end.
+        self._readers_done = []  # type: typing.List[threading.Event]
+        #: Reader threads, when the shared reactor is not available.
+        self._reader_threads = []  # type: typing.List[threading.Thread]
+        #: Queue of line handler calls, when the pipes are served by the shared reactor.
+        self._dispatch_queue = None  # type: typing.Optional[DispatchQueue]
 
     def __repr__(self):  # type: (...) -> str
         """
@@ -97,6 +122,24 @@ class SubProcess:
 
         return f"{qualname(type(self))}({self.cmd_line!r}, cwd={self.cwd!r}, env={self.env!r})"
 
+    @property
+    def stdout(self):  # type: (...) -> bytes
+        """
+        Standard output as a string.
+
+        Head and tail only when the output limit has been exceeded (see :meth:`setoutputlimit()`).
+        """
+        return self.stdout_buffer.getvalue()
+
+    @property
+    def stderr(self):  # type: (...) -> bytes
+        """
+        Standard error as a string.
+
+        Head and tail only when the output limit has been exceeded (see :meth:`setoutputlimit()`).
+        """
+        return self.stderr_buffer.getvalue()
+
     def __str__(self):  # type: (...) -> str
         """
         Human readable string representation.
@@ -222,6 +265,55 @@ class SubProcess:
         self._stderr_line_handler = handler
         return self
 
+    def onstdoutlines(
+            self,  # type: VarSubProcessType
+            handler,  # type: typing.Callable[[typing.List[bytes]], None]
+    ):  # type: (...) -> VarSubProcessType
+        """
+        Installs a handler to be called on each batch of stdout lines.
+
+        Cheaper than :meth:`onstdoutline()` for large outputs.
+
+        :param handler: Handler to call with the stdout lines read at once.
+        :return: ``self``
+        """
+        self._stdout_lines_handler = handler
+        return self
+
+    def onstderrlines(
+            self,  # type: VarSubProcessType
+            handler,  # type: typing.Callable[[typing.List[bytes]], None]
+    ):  # type: (...) -> VarSubProcessType
+        """
+        Installs a handler to be called on each batch of stderr lines.
+
+        Cheaper than :meth:`onstderrline()` for large outputs.
+
+        :param handler: Handler to call with the stderr lines read at once.
+        :return: ``self``
+        """
+        self._stderr_lines_handler = handler
+        return self
+
+    def setoutputlimit(
+            self,  # type: VarSubProcessType
+            limit,  # type: typing.Optional[int]
+    ):  # type: (...) -> VarSubProcessType
+        """
+        Limits the size of the stdout and stderr outputs kept in memory.
+
+        :param limit: Maximum number of bytes kept in memory for each output. ``None`` for no limit.
+        :return: ``self``
+
+        Beyond the limit, only the head and the tail of the outputs are kept in memory,
+        and the full streams are spilled to temporary files
+        (see :attr:`.subprocessoutput.SubProcessOutput.path` for :attr:`stdout_buffer` and :attr:`stderr_buffer`).
+        Lines longer than the limit are passed on to line handlers as several partial lines.
+        """
+        self.stdout_buffer.limit = limit
+        self.stderr_buffer.limit = limit
+        return self
+
     def exitonerror(
             self,  # type: VarSubProcessType
             exit_on_error_code,  # type: typing.Union[bool, typing.Optional[ErrorCode]]
@@ -256,11 +348,66 @@ class SubProcess:
 
         The sub-process return code is available through the :attr:`returncode` attribute.
         """
+        from .subprocessreactor import DispatchQueue, SUBPROCESS_REACTOR
+        from .tracing import TRACER
+
         if self._async:
             self._log(logging.DEBUG, "Launching %s", self.tostring())
         else:
             self._log(logging.DEBUG, "Executing %s", self.tostring())
 
+        _cmd_line, _cwd, _env = self._prepare()  # type: typing.List[str], AnyPathType, typing.Dict[str, str]
+
+        # Launch the subprocess.
+        self.time.setstarttime()
+        self.returncode = None
+        self.rusage = None
+        try:
+            with TRACER.span("SubProcess.run(): spawn"):
+                self._popen = subprocess.Popen(
+                    _cmd_line, cwd=_cwd, env=_env,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE
+                )
+        except Exception as _err:
+            self._onerror("Error while executing %s: %s", self, _err)
+            return self
+
+        # Read stdout and stderr with the shared reactor when available, with reader threads otherwise.
+        # With the shared reactor, line handlers are called from its dispatch workers,
+        # so that they don't hold the reactor thread serving the other sub-processes.
+        assert self._popen.stdout and self._popen.stderr
+        self._readers_done = []
+        self._reader_threads = []
+        self._dispatch_queue = DispatchQueue() if SUBPROCESS_REACTOR.isavailable() else None
+        for _pipe, _output in ((self._popen.stdout, self.stdout_buffer), (self._popen.stderr, self.stderr_buffer)):  # type: typing.IO[bytes], SubProcessOutput
+            _done = threading.Event()  # type: threading.Event
+            self._readers_done.append(_done)
+            if self._dispatch_queue is not None:
+                SUBPROCESS_REACTOR.register(_pipe.fileno(), functools.partial(self._ondata, _pipe, _output, _done, self._dispatch_queue))
+            else:
+                _reader_thread = threading.Thread(
+                    name=f"{self}[{_output.name}]", target=self._readthread, args=(_pipe, _output, _done),
+                )  # type: threading.Thread
+                self._reader_threads.append(_reader_thread)
+                _reader_thread.start()
+
+        # Wait for the end of the sub-process.
+        if not self._async:
+            try:
+                self.wait(timeout=timeout)
+            except TimeoutError as _err:
+                self._popen.kill()
+                self._onerror("%s timeout: %s", self, _err)
+
+        return self
+
+    def _prepare(self):  # type: (...) -> typing.Tuple[typing.List[str], AnyPathType, typing.Dict[str, str]]
+        """
+        Prepares the sub-process launch.
+
+        :return: Command line arguments, current working directory and environment variables.
+        """
         # Prepare the current working directory.
         _cwd = pathlib.Path.cwd()  # type: AnyPathType
         if self.cwd:
@@ -292,32 +439,80 @@ class SubProcess:
                 else:
                     _env[_var] = str(self.env[_var])
 
+        return _cmd_line, _cwd, _env
+
+    async def arun(
+            self,  # type: VarSubProcessType
+            timeout=None,  # type: float
+    ):  # type: (...) -> VarSubProcessType
+        """
+        :mod:`asyncio` variant of :meth:`run()`.
+
+        :param timeout: Waiting timeout, in seconds. ``None`` to wait infinitely.
+        :return: ``self``
+
+        Runs the sub-process with :func:`asyncio.create_subprocess_exec()`,
+        and reads its outputs from the running event loop, without threads.
+        Many sub-processes may be driven concurrently with :func:`asyncio.gather()` then.
+
+        The sub-process return code is available through the :attr:`returncode` attribute.
+        """
+        import asyncio
+
+        from .debugutils import saferepr
+
+        self._log(logging.DEBUG, "Executing %s", self.tostring())
+        _cmd_line, _cwd, _env = self._prepare()  # type: typing.List[str], AnyPathType, typing.Dict[str, str]
+
         # Launch the subprocess.
         self.time.setstarttime()
         self.returncode = None
+        self.rusage = None
         try:
-            self._popen = subprocess.Popen(
-                _cmd_line, cwd=_cwd, env=_env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
+            _process = await asyncio.create_subprocess_exec(
+                *_cmd_line, cwd=_cwd, env=_env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )  # type: asyncio.subprocess.Process
         except Exception as _err:
             self._onerror("Error while executing %s: %s", self, _err)
             return self
 
-        # Launch the stdout and stderr reader threads.
-        self._stdout_reader = threading.Thread(name=f"{self}[stdout]", target=self._readstdoutthread)
-        self._stdout_reader.start()
-        self._stderr_reader = threading.Thread(name=f"{self}[stderr]", target=self._readstderrthread)
-        self._stderr_reader.start()
+        async def _read(
+                stream,  # type: asyncio.StreamReader
+                output,  # type: SubProcessOutput
+        ):  # type: (...) -> None
+            from .subprocessreactor import SubProcessReactor
 
-        # Wait for the end of the sub-process.
-        if not self._async:
-            try:
-                self.wait(timeout=timeout)
-            except TimeoutError as _err:
-                self._popen.kill()
-                self._onerror("%s timeout: %s", self, _err)
+            while True:
+                _data = await stream.read(SubProcessReactor.READ_CHUNK_SIZE)  # type: bytes
+                if not _data:
+                    break
+                self._onlines(output.name, output.feed(_data))
+            self._onlines(output.name, output.close())
+
+        # Read stdout and stderr, and wait for the end of the sub-process.
+        assert _process.stdout and _process.stderr
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(_read(_process.stdout, self.stdout_buffer), _read(_process.stderr, self.stderr_buffer), _process.wait()),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            _process.kill()
+            await _process.wait()
+            # The `_read()` tasks have been cancelled: deliver the pending last lines, if any.
+            self._onlines(self.stdout_buffer.name, self.stdout_buffer.close())
+            self._onlines(self.stderr_buffer.name, self.stderr_buffer.close())
+            self._onerror("%s timeout: %s", self, f"Command {_cmd_line!r} timed out after {timeout} seconds")
+            return self
+        finally:
+            self.time.setendtime()
+
+        self.returncode = _process.returncode
+
+        if self.returncode != 0:
+            self._onerror("%s failed: retcode=%r, stderr=%s", self.tostring(), self.returncode, saferepr(self.stderr))
 
         return self
 
@@ -333,55 +528,124 @@ class SubProcess:
         self._async = True
         return self.run()
 
-    def _readstdoutthread(self):  # type: (...) -> None
+    def _readthread(
+            self,
+            pipe,  # type: typing.IO[bytes]
+            output,  # type: SubProcessOutput
+            done,  # type: threading.Event
+    ):  # type: (...) -> None
         """
-        Stdout reader thread routine.
+        Stdout / stderr reader thread routine, when the shared reactor is not available.
+
+        :param pipe: Sub-process pipe to read from.
+        :param output: Output buffer to store the data into.
+        :param done: Event to set at the end of the stream.
         """
-        while self._popen and self._popen.stdout:
-            # Read a stdout line.
-            _line = self._popen.stdout.readline()  # type: bytes
-            if not _line:
+        from .subprocessreactor import SubProcessReactor
+
+        _fd = pipe.fileno()  # type: int
+        while True:
+            # Read the data available by chunks.
+            _data = os.read(_fd, SubProcessReactor.READ_CHUNK_SIZE)  # type: bytes
+            self._ondata(pipe, output, done, None, _data)
+            if not _data:
                 break
 
-            # Save it in the stdout buffer as is, then remove the end-of-line character(s).
-            self.stdout += _line
-            _line = _line.rstrip(b'\r\n')
+    def _ondata(
+            self,
+            pipe,  # type: typing.IO[bytes]
+            output,  # type: SubProcessOutput
+            done,  # type: threading.Event
+            dispatch_queue,  # type: typing.Optional[DispatchQueue]
+            data,  # type: bytes
+    ):  # type: (...) -> None
+        """
+        Processes data read from a sub-process pipe.
 
-            # Debug the line (only if no stdout handler is set).
-            if not self._stdout_line_handler:
-                self._log(logging.DEBUG, "  stdout: %r", _line)
+        :param pipe: Sub-process pipe the data was read from.
+        :param output: Output buffer to store the data into.
+        :param done: Event to set at the end of the stream.
+        :param dispatch_queue: Queue to call the line handlers from. ``None`` to call them directly.
+        :param data: Data read. Empty at the end of the stream.
+        """
+        if data:
+            self._dispatchlines(output.name, output.feed(data), dispatch_queue)
+        else:
+            try:
+                self._dispatchlines(output.name, output.close(), dispatch_queue)
+            finally:
+                pipe.close()
+                if dispatch_queue is not None:
+                    # Set the event once the lines queued before have been handled.
+                    dispatch_queue.put(done.set)
+                else:
+                    done.set()
 
-            # Call the user handler.
-            if self._stdout_line_handler:
-                # Prevent from potential exceptions in the user handler.
-                try:
-                    self._stdout_line_handler(_line)
-                except Exception as _err:
-                    self._log(logging.ERROR, str(_err))
+    def _dispatchlines(
+            self,
+            stream,  # type: str
+            lines,  # type: typing.List[bytes]
+            dispatch_queue,  # type: typing.Optional[DispatchQueue]
+    ):  # type: (...) -> None
+        """
+        Dispatches a batch of lines to the user handlers, from the dispatch queue if any.
 
-    def _readstderrthread(self):  # type: (...) -> None
+        :param stream: 'stdout' or 'stderr'.
+        :param lines: Lines read, without end-of-line characters.
+        :param dispatch_queue: Queue to call the line handlers from. ``None`` to call them directly.
         """
-        Stderr reader thread routine.
+        if lines and (dispatch_queue is not None) and self._haslinehandlers(stream):
+            dispatch_queue.put(functools.partial(self._onlines, stream, lines))
+        else:
+            self._onlines(stream, lines)
+
+    def _haslinehandlers(
+            self,
+            stream,  # type: str
+    ):  # type: (...) -> bool
         """
-        while self._popen and self._popen.stderr:
-            # Read a stderr line.
-            _line = self._popen.stderr.readline()  # type: bytes
-            if not _line:
-                break
+        Tells whether line handlers are set for the given stream.
 
-            # Save it in the stderr buffer as is, then remove the end-of-line character(s).
-            self.stderr += _line
-            _line = _line.rstrip(b'\r\n')
+        :param stream: 'stdout' or 'stderr'.
+        :return: ``True`` when a line handler or a batch line handler is set.
+        """
+        if stream == "stdout":
+            return (self._stdout_line_handler is not None) or (self._stdout_lines_handler is not None)
+        return (self._stderr_line_handler is not None) or (self._stderr_lines_handler is not None)
 
-            # Debug the line (only if no stderr handler is set).
-            if not self._stderr_line_handler:
-                self._log(logging.DEBUG, "  stderr: %r", _line)
+    def _onlines(
+            self,
+            stream,  # type: str
+            lines,  # type: typing.List[bytes]
+    ):  # type: (...) -> None
+        """
+        Dispatches a batch of lines to the user handlers.
 
-            # Call the user handler.
-            if self._stderr_line_handler:
-                # Prevent from potential exceptions in the user handler.
+        :param stream: 'stdout' or 'stderr'.
+        :param lines: Lines read, without end-of-line characters.
+        """
+        if not lines:
+            return
+
+        _line_handler = self._stdout_line_handler if stream == "stdout" else self._stderr_line_handler  # type: typing.Optional[typing.Callable[[bytes], None]]
+        _lines_handler = self._stdout_lines_handler if stream == "stdout" else self._stderr_lines_handler  # type: typing.Optional[typing.Callable[[typing.List[bytes]], None]]
+
+        # Debug the lines (only if no handler is set).
+        if (not _line_handler) and (not _lines_handler) and self._logger and self._logger.isdebugenabled():
+            for _line in lines:  # type: bytes
+                self._log(logging.DEBUG, "  %s: %r", stream, _line)
+
+        # Call the user handlers.
+        # Prevent from potential exceptions in the user handlers.
+        if _lines_handler:
+            try:
+                _lines_handler(lines)
+            except Exception as _err:
+                self._log(logging.ERROR, str(_err))
+        if _line_handler:
+            for _line in lines:  # Type already declared above.
                 try:
-                    self._stderr_line_handler(_line)
+                    _line_handler(_line)
                 except Exception as _err:
                     self._log(logging.ERROR, str(_err))
 
@@ -415,22 +679,89 @@ class SubProcess:
                 self._log(logging.DEBUG, "Waiting for %s to terminate within %f seconds", self.tostring(), timeout)
             else:
                 self._log(logging.DEBUG, "Waiting for %s to terminate...", self.tostring())
-            self.returncode = self._popen.wait(timeout=timeout)
+            self.returncode = self._reap(timeout=timeout)
         except subprocess.TimeoutExpired as _err:
             raise TimeoutError(str(_err))
 
         self.time.setendtime()
+        if self.rusage is not None:
+            self._log(logging.DEBUG, "%s resource usage: %s", self, self.rusage)
 
-        if self._stdout_reader:
-            self._stdout_reader.join()
-        if self._stderr_reader:
-            self._stderr_reader.join()
+        self._waitreaders()
 
         if self.returncode != 0:
             self._onerror("%s failed: retcode=%r, stderr=%s", self.tostring(), self.returncode, saferepr(self.stderr))
 
         return self
 
+    def _reap(
+            self,
+            timeout,  # type: typing.Optional[float]
+    ):  # type: (...) -> int
+        """
+        Waits for the sub-process to terminate, and collects its resource usage with :func:`os.wait4()` when available.
+
+        :param timeout: Waiting timeout, in seconds. ``None`` to wait infinitely.
+        :return: Sub-process return code.
+        :raise subprocess.TimeoutExpired: When the sub-process did not terminate within ``timeout`` seconds.
+        """
+        from .stats import ResourceUsage
+
+        assert self._popen
+        if not hasattr(os, "wait4"):
+            return self._popen.wait(timeout=timeout)
+
+        # Poll with growing delays when a timeout is set, like :meth:`subprocess.Popen.wait()` does.
+        _deadline = None if timeout is None else (time.monotonic() + timeout)  # type: typing.Optional[float]
+        _delay = 0.0005  # type: float
+        while True:
+            # Prevent concurrent :meth:`subprocess.Popen.poll()` calls from reaping the sub-process meanwhile.
+            # Note: `_waitpid_lock` is a :class:`subprocess.Popen` implementation detail, we don't rely on it when not available.
+            _lock = getattr(self._popen, "_waitpid_lock", None)  # type: typing.Optional[threading.Lock]
+            if _lock is not None:
+                _lock.acquire()
+            try:
+                if self._popen.returncode is not None:
+                    # Already reaped, or reaped by a concurrent :meth:`subprocess.Popen.poll()` call: resource usage not available.
+                    return self._popen.returncode
+                _pid, _status, _rusage = os.wait4(self._popen.pid, 0 if (_deadline is None) else os.WNOHANG)  # type: int, int, typing.Any
+                if _pid == self._popen.pid:
+                    self.rusage = ResourceUsage.fromrusage(_rusage)
+                    # Let the :class:`subprocess.Popen` instance know about the termination, so that it does not try to reap the sub-process again.
+                    self._popen.returncode = SubProcess._exitcode(_status)
+                    return self._popen.returncode
+            except ChildProcessError:
+                # Sub-process reaped by someone else: resource usage not available.
+                break
+            finally:
+                if _lock is not None:
+                    _lock.release()
+
+            assert _deadline is not None
+            _remaining = _deadline - time.monotonic()  # type: float
+            if _remaining <= 0.0:
+                raise subprocess.TimeoutExpired(self._popen.args, timeout or 0.0)
+            _delay = min(_delay * 2, _remaining, 0.05)
+            time.sleep(_delay)
+
+        # Let :meth:`subprocess.Popen.wait()` set the return code of a sub-process reaped by someone else.
+        return self._popen.wait(timeout=timeout)
+
+    @staticmethod
+    def _exitcode(
+            status,  # type: int
+    ):  # type: (...) -> int
+        """
+        Converts a wait status into a return code, the way :attr:`subprocess.Popen.returncode` is computed.
+
+        :param status: Wait status, as returned by :func:`os.wait4()`.
+        :return: Exit code, or negative signal number when the sub-process was killed by a signal.
+        """
+        # Note: :func:`os.waitstatus_to_exitcode()` available in Python 3.9 only.
+        if os.WIFSIGNALED(status):
+            return -os.WTERMSIG(status)
+        return os.WEXITSTATUS(status)
+
     def kill(
             self,  # type: VarSubProcessType
     ):  # type: (...) -> VarSubProcessType
@@ -442,13 +773,25 @@ class SubProcess:
         if self._popen:
             self._popen.kill()
 
-        if self._stdout_reader:
-            self._stdout_reader.join()
-        if self._stderr_reader:
-            self._stderr_reader.join()
+        self._waitreaders()
 
         return self
 
+    def _waitreaders(self):  # type: (...) -> None
+        """
+        Waits for the stdout and stderr readers to reach the end of the streams.
+
+        Does not wait when called from one of the line handlers of this sub-process:
+        the reader thread or dispatch worker would wait for itself otherwise.
+        """
+        if threading.current_thread() in self._reader_threads:
+            return
+        if (self._dispatch_queue is not None) and self._dispatch_queue.iscurrent():
+            return
+
+        for _done in self._readers_done:  # type: threading.Event
+            _done.wait()
+
     def _onerror(
             self,
             error_message,  # type: str
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+:class:`SubProcessBatch` class definition.
+"""
+
+import logging
+import os
+import sys
+import typing
+
+if typing.TYPE_CHECKING:
+    # `Logger` used in method signatures.
+    # Type declared for type checking only.
+    from .logger import Logger
+    # `SubProcess` used in method signatures.
+    # Type declared for type checking only.
+    from .subprocess import SubProcess
+
+
+class SubProcessBatch:
+    """
+    Batch of sub-processes, executed with a concurrency limit.
+
+    Sub-processes are configured as usual before being submitted (see :meth:`submit()`),
+    then executed with :meth:`.subprocess.SubProcess.arun()` from an :mod:`asyncio` event loop, without threads.
+    """
+
+    def __init__(
+            self,
+            max_concurrency=None,  # type: int
+            timeout=None,  # type: float
+            fail_fast=False,  # type: bool
+    ):  # type: (...) -> None
+        """
+        :param max_concurrency: Maximum number of sub-processes running at the same time. Defaults to the number of CPUs.
+        :param timeout: Timeout for each sub-process, in seconds. ``None`` to wait infinitely.
+        :param fail_fast: ``True`` to stop launching sub-processes as soon as one has failed.
+        """
+        from .stats import TimeStats
+
+        #: Maximum number of sub-processes running at the same time.
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1  # type: int
+        #: Timeout for each sub-process, in seconds. ``None`` to wait infinitely.
+        self.timeout = timeout  # type: typing.Optional[float]
+        #: ``True`` to stop launching sub-processes as soon as one has failed.
+        self.fail_fast = fail_fast  # type: bool
+
+        #: Sub-processes, in submission order.
+        self.subprocesses = []  # type: typing.List[SubProcess]
+        #: Time statistics of the whole batch.
+        self.time = TimeStats()  # type: TimeStats
+
+        #: See :meth:`setlogger()`.
+        self._logger = None  # type: typing.Optional[Logger]
+        #: Sub-processes launched.
+        self._launched = set()  # type: typing.Set[SubProcess]
+        #: Sub-processes terminated.
+        self._terminated = set()  # type: typing.Set[SubProcess]
+
+    def __str__(self):  # type: (...) -> str
+        """
+        Human readable string representation.
+        """
+        return f"batch of {len(self.subprocesses)} sub-processes"
+
+    def submit(
+            self,  # type: VarSubProcessBatchType
+            *subprocesses  # type: SubProcess
+    ):  # type: (...) -> VarSubProcessBatchType
+        """
+        Adds sub-processes to the batch.
+
+        :param subprocesses: Sub-processes to execute.
+        :return: ``self``
+        """
+        self.subprocesses.extend(subprocesses)
+        return self
+
+    def setlogger(
+            self,  # type: VarSubProcessBatchType
+            logger,  # type: Logger
+    ):  # type: (...) -> VarSubProcessBatchType
+        """
+        Directs log lines of the batch and of its sub-processes to the given logger instance.
+
+        :param logger: Logger instance to use.
+        :return: ``self``
+        """
+        self._logger = logger
+        return self
+
+    def run(
+            self,  # type: VarSubProcessBatchType
+    ):  # type: (...) -> VarSubProcessBatchType
+        """
+        Executes the batch of sub-processes, and waits for their termination.
+
+        :return: ``self``
+
+        Runs its own :mod:`asyncio` event loop. Use :meth:`arun()` from a running event loop.
+        """
+        import asyncio
+
+        # Note: `asyncio.run()` available from Python 3.7 only.
+        _loop = asyncio.new_event_loop()  # type: asyncio.AbstractEventLoop
+        asyncio.set_event_loop(_loop)
+        try:
+            if (sys.version_info < (3, 8)) and (sys.platform != "win32"):
+                # Before Python 3.8, the child watcher monitors sub-processes from the loop it is attached to.
+                asyncio.get_child_watcher().attach_loop(_loop)
+            _loop.run_until_complete(self.arun())
+        finally:
+            asyncio.set_event_loop(None)
+            _loop.close()
+        return self
+
+    async def arun(
+            self,  # type: VarSubProcessBatchType
+    ):  # type: (...) -> VarSubProcessBatchType
+        """
+        :mod:`asyncio` variant of :meth:`run()`.
+
+        :return: ``self``
+        """
+        import asyncio
+
+        _semaphore = asyncio.Semaphore(self.max_concurrency)  # type: asyncio.Semaphore
+
+        async def _run(
+                subprocess,  # type: SubProcess
+        ):  # type: (...) -> None
+            async with _semaphore:
+                # Fail fast: don't launch other sub-processes once one has failed.
+                if self.fail_fast and self.failed:
+                    self._log(logging.DEBUG, "%s skipped", subprocess)
+                    return
+                if self._logger:
+                    subprocess.setlogger(self._logger)
+                self._launched.add(subprocess)
+                try:
+                    await subprocess.arun(timeout=self.timeout)
+                finally:
+                    self._terminated.add(subprocess)
+
+        self._log(logging.DEBUG, "Executing %s, %d at most at the same time", self, self.max_concurrency)
+        self._launched.clear()
+        self._terminated.clear()
+        self.time.setstarttime()
+        await asyncio.gather(*[_run(_subprocess) for _subprocess in self.subprocesses])
+        self.time.setendtime()
+        self._log(logging.DEBUG, "%s", self.summary())
+
+        return self
+
+    @property
+    def returncodes(self):  # type: (...) -> typing.List[typing.Optional[int]]
+        """
+        Return codes of the sub-processes, in submission order.
+
+        ``None`` for sub-processes that timed out, or that have not been launched.
+        """
+        return [_subprocess.returncode for _subprocess in self.subprocesses]
+
+    @property
+    def succeeded(self):  # type: (...) -> typing.List[SubProcess]
+        """
+        Sub-processes that terminated with a 0 return code, in submission order.
+        """
+        return [_subprocess for _subprocess in self.subprocesses if _subprocess.returncode == 0]
+
+    @property
+    def failed(self):  # type: (...) -> typing.List[SubProcess]
+        """
+        Sub-processes terminated that either failed or timed out, in submission order.
+        """
+        return [_subprocess for _subprocess in self.subprocesses if (_subprocess in self._terminated) and (_subprocess.returncode != 0)]
+
+    @property
+    def skipped(self):  # type: (...) -> typing.List[SubProcess]
+        """
+        Sub-processes not launched (yet), or skipped due to the fail-fast option, in submission order.
+        """
+        return [_subprocess for _subprocess in self.subprocesses if _subprocess not in self._launched]
+
+    def summary(self):  # type: (...) -> str
+        """
+        Builds a summary of the batch execution.
+
+        :return: Numbers of sub-processes succeeded, failed and skipped, with the batch elapsed time,
+                 and the time cumulated by the sub-processes.
+        """
+        from .datetimeutils import f2strduration
+
+        _cumulated = sum(_subprocess.time.elapsed or 0.0 for _subprocess in self._launched)  # type: float
+        return (
+            f"{len(self.subprocesses)} sub-processes: "
+            f"{len(self.succeeded)} succeeded, {len(self.failed)} failed, {len(self.skipped)} skipped, "
+            f"elapsed {f2strduration(self.time.elapsed)}, cumulated {f2strduration(_cumulated)}"
+        )
+
+    def _log(
+            self,
+            level,  # type: int
+            message,  # type: str
+            *args,  # type: typing.Any
+    ):  # type: (...) -> None
+        """
+        Pushes a log line to the attached logger, if any.
+
+        :param level: Log level.
+        :param message: Log message.
+        :param args: Format arguments.
+        """
+        if self._logger:
+            self._logger.log(level, message, *args)
+
+
+if typing.TYPE_CHECKING:
+    VarSubProcessBatchType = typing.TypeVar("VarSubProcessBatchType", bound=SubProcessBatch)
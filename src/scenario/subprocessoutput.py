@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Sub-process output buffering.
+"""
+
+import collections
+import tempfile
+import typing
+
+
+class SubProcessOutput:
+    """
+    Sub-process output buffer.
+
+    Output data is collected as a list of chunks, joined lazily when the output is read.
+
+    When a size limit is set, only the head and the tail of the output are kept in memory,
+    and the full stream is spilled to a temporary file (see :attr:`path`).
+    """
+
+    def __init__(
+            self,
+            name,  # type: str
+            limit=None,  # type: int
+    ):  # type: (...) -> None
+        """
+        :param name: Stream name: 'stdout' or 'stderr'.
+        :param limit: Maximum number of bytes kept in memory. ``None`` for no limit.
+        """
+        #: Stream name: 'stdout' or 'stderr'.
+        self.name = name  # type: str
+        #: Maximum number of bytes kept in memory. ``None`` for no limit.
+        self.limit = limit  # type: typing.Optional[int]
+        #: Total number of bytes received.
+        self.size = 0  # type: int
+        #: Path of the temporary file the full stream is spilled to, once the size limit has been exceeded.
+        #:
+        #: Left for the user to remove.
+        self.path = None  # type: typing.Optional[str]
+
+        #: Head chunks.
+        self._head = []  # type: typing.List[bytes]
+        #: Number of bytes in :attr:`_head`.
+        self._head_size = 0  # type: int
+        #: Tail chunks, when the size limit has been exceeded.
+        self._tail = collections.deque()  # type: typing.Deque[bytes]
+        #: Number of bytes in :attr:`_tail`.
+        self._tail_size = 0  # type: int
+        #: Spill file, when the size limit has been exceeded.
+        self._spill_file = None  # type: typing.Optional[typing.IO[bytes]]
+        #: Cached output value.
+        self._value = None  # type: typing.Optional[bytes]
+        #: Chunks of the pending line, not terminated yet.
+        self._pending_line = []  # type: typing.List[bytes]
+        #: Number of bytes in :attr:`_pending_line`.
+        self._pending_size = 0  # type: int
+
+    def __len__(self):  # type: (...) -> int
+        """
+        Total number of bytes received.
+        """
+        return self.size
+
+    @property
+    def truncated(self):  # type: (...) -> bool
+        """
+        ``True`` when the size limit has been exceeded, and the output kept in memory is truncated.
+        """
+        return self._spill_file is not None
+
+    def write(
+            self,
+            data,  # type: bytes
+    ):  # type: (...) -> None
+        """
+        Stores output data.
+
+        :param data: Output data.
+        """
+        if not data:
+            return
+        self._value = None
+
+        # Spill the full stream to a temporary file as soon as the size limit is exceeded.
+        if (self.limit is not None) and (self._spill_file is None) and (self.size + len(data) > self.limit):
+            _spill_file = tempfile.NamedTemporaryFile(prefix=f"scenario-{self.name}-", suffix=".log", delete=False)  # type: typing.IO[bytes]
+            self.path = _spill_file.name
+            for _chunk in self._head:  # type: bytes
+                _spill_file.write(_chunk)
+            self._spill_file = _spill_file
+        if self._spill_file is not None:
+            self._spill_file.write(data)
+        self.size += len(data)
+
+        if self._spill_file is None:
+            # Memory buffer not limited (yet).
+            self._head.append(data)
+            self._head_size += len(data)
+            return
+
+        # Size limit exceeded: keep the first half of the limit as the head, the second half as the tail.
+        assert self.limit is not None
+        _head_limit = self.limit // 2  # type: int
+        if self._head_size > _head_limit:
+            # Move the extra head bytes to the tail.
+            _head = b''.join(self._head)  # type: bytes
+            self._head = [_head[:_head_limit]]
+            self._head_size = _head_limit
+            self._tail.append(_head[_head_limit:])
+            self._tail_size += len(_head) - _head_limit
+        elif self._head_size < _head_limit:
+            # Fill in the head first.
+            _head_part = data[:_head_limit - self._head_size]  # type: bytes
+            self._head.append(_head_part)
+            self._head_size += len(_head_part)
+            data = data[len(_head_part):]
+        if data:
+            self._tail.append(data)
+            self._tail_size += len(data)
+        _tail_limit = self.limit - _head_limit  # type: int
+        while self._tail and (self._tail_size - len(self._tail[0]) >= _tail_limit):
+            self._tail_size -= len(self._tail.popleft())
+        if self._tail_size > _tail_limit:
+            self._tail[0] = self._tail[0][self._tail_size - _tail_limit:]
+            self._tail_size = _tail_limit
+
+    def feed(
+            self,
+            data,  # type: bytes
+    ):  # type: (...) -> typing.List[bytes]
+        """
+        Stores output data, and splits it into lines.
+
+        :param data: Output data.
+        :return: Lines terminated with this new data, without end-of-line characters.
+
+        When a size limit is set, a pending line that exceeds it is returned as a partial line,
+        so that memory remains bounded for long lines or outputs without end-of-line characters.
+        """
+        self.write(data)
+
+        self._pending_line.append(data)
+        self._pending_size += len(data)
+        _lines = []  # type: typing.List[bytes]
+        if b'\n' in data:
+            _lines = b''.join(self._pending_line).split(b'\n')
+            _pending_line = _lines.pop()  # type: bytes
+            self._pending_line = [_pending_line]
+            self._pending_size = len(_pending_line)
+            _lines = [_line.rstrip(b'\r') for _line in _lines]
+        if (self.limit is not None) and (self._pending_size > self.limit):
+            # Flush the pending line as a partial line.
+            _lines.append(b''.join(self._pending_line))
+            self._pending_line = []
+            self._pending_size = 0
+        return _lines
+
+    def close(self):  # type: (...) -> typing.List[bytes]
+        """
+        Terminates the output.
+
+        :return: Last line when not terminated with an end-of-line character, no line otherwise.
+        """
+        if self._spill_file is not None:
+            self._spill_file.close()
+
+        _lines = []  # type: typing.List[bytes]
+        _pending_line = b''.join(self._pending_line)  # type: bytes
+        if _pending_line:
+            _lines.append(_pending_line.rstrip(b'\r'))
+        self._pending_line = []
+        self._pending_size = 0
+        return _lines
+
+    def getvalue(self):  # type: (...) -> bytes
+        """
+        Output data kept in memory.
+
+        :return:
+            Full output when no size limit has been exceeded.
+            Head and tail of the output otherwise, separated with a line telling the number of bytes skipped.
+        """
+        if self._value is None:
+            if not self.truncated:
+                self._value = b''.join(self._head)
+            else:
+                _skipped = self.size - self._head_size - self._tail_size  # type: int
+                self._value = b''.join([
+                    *self._head,
+                    f"\n... {_skipped} bytes skipped, see '{self.path}' ...\n".encode("utf-8"),
+                    *self._tail,
+                ])
+        return self._value
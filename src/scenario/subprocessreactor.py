@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Shared I/O reactor for sub-process pipes.
+"""
+
+import collections
+import os
+import selectors
+import sys
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+class SubProcessReactor:
+    """
+    Shared I/O reactor.
+
+    Serves the stdout and stderr pipes of all running :class:`.subprocess.SubProcess` instances with a single thread,
+    based on the :mod:`selectors` module (epoll on Linux).
+
+    The reactor thread is started when a first pipe is registered, and terminates when no more pipes are registered.
+
+    Line handlers are not called from the reactor thread, but from a small pool of dispatch workers (see :class:`DispatchQueue`),
+    so that slow line handlers do not hold the pipes of the other sub-processes.
+    """
+
+    #: Maximum number of bytes read at once from a pipe.
+    READ_CHUNK_SIZE = 64 * 1024  # type: int
+    #: Maximum number of dispatch worker threads.
+    DISPATCH_MAX_WORKERS = 4  # type: int
+
+    def __init__(self):  # type: (...) -> None
+        #: Lock protecting the reactor thread lifecycle.
+        self._lock = threading.Lock()  # type: threading.Lock
+        #: Selector instance.
+        self._selector = None  # type: typing.Optional[selectors.BaseSelector]
+        #: Reactor thread.
+        self._thread = None  # type: typing.Optional[threading.Thread]
+        #: Wake-up pipe, used to interrupt the reactor thread when a new pipe is registered: (read end, write end).
+        #:
+        #: Non-blocking, so that :meth:`register()` never waits for the reactor thread while holding :attr:`_lock`.
+        self._wakeup_pipe = None  # type: typing.Optional[typing.Tuple[int, int]]
+        #: Dispatch worker pool, created with the first :class:`DispatchQueue` function to call.
+        self._dispatch_pool = None  # type: typing.Optional[concurrent.futures.ThreadPoolExecutor]
+
+    @staticmethod
+    def isavailable():  # type: (...) -> bool
+        """
+        Tells whether the reactor can be used on the current platform.
+
+        :return: ``False`` on Windows, where pipes cannot be polled.
+        """
+        return sys.platform != "win32"
+
+    def register(
+            self,
+            fd,  # type: int
+            callback,  # type: typing.Callable[[bytes], None]
+    ):  # type: (...) -> None
+        """
+        Registers a pipe to read from.
+
+        :param fd: File descriptor of the pipe.
+        :param callback:
+            Function called from the reactor thread with the data read from the pipe.
+
+            Called a last time with empty data at the end of the stream, once the pipe has been unregistered.
+        """
+        with self._lock:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+                self._wakeup_pipe = os.pipe()
+                os.set_blocking(self._wakeup_pipe[0], False)
+                os.set_blocking(self._wakeup_pipe[1], False)
+                self._selector.register(self._wakeup_pipe[0], selectors.EVENT_READ)
+            self._selector.register(fd, selectors.EVENT_READ, callback)
+
+            if self._thread is None:
+                self._thread = threading.Thread(name="SubProcessReactor", target=self._run, daemon=True)
+                self._thread.start()
+            else:
+                # Make the reactor thread take the new pipe into account.
+                assert self._wakeup_pipe
+                try:
+                    os.write(self._wakeup_pipe[1], b'\0')
+                except BlockingIOError:
+                    # Wake-up pipe full: the reactor thread will wake up anyway.
+                    pass
+
+    def dispatch(
+            self,
+            func,  # type: typing.Callable[[], None]
+    ):  # type: (...) -> None
+        """
+        Calls a function from a dispatch worker thread.
+
+        :param func: Function to call.
+        """
+        import concurrent.futures
+
+        with self._lock:
+            if self._dispatch_pool is None:
+                self._dispatch_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=SubProcessReactor.DISPATCH_MAX_WORKERS, thread_name_prefix="SubProcessDispatcher",
+                )
+            self._dispatch_pool.submit(func)
+
+    def _run(self):  # type: (...) -> None
+        """
+        Reactor thread routine.
+        """
+        from .loggermain import MAIN_LOGGER
+
+        assert self._selector and self._wakeup_pipe
+
+        while True:
+            for _key, _events in self._selector.select():  # type: selectors.SelectorKey, int
+                if _key.fd == self._wakeup_pipe[0]:
+                    try:
+                        os.read(self._wakeup_pipe[0], SubProcessReactor.READ_CHUNK_SIZE)
+                    except BlockingIOError:
+                        pass
+                    continue
+
+                try:
+                    _data = os.read(_key.fd, SubProcessReactor.READ_CHUNK_SIZE)  # type: bytes
+                except OSError:
+                    _data = b''
+                if not _data:
+                    with self._lock:
+                        self._selector.unregister(_key.fd)
+                try:
+                    _key.data(_data)
+                except Exception as _err:
+                    # Don't let a callback error stop serving the other pipes.
+                    MAIN_LOGGER.error(f"Error while processing sub-process data: {_err}")
+
+            with self._lock:
+                # Terminate the reactor thread when the wake-up pipe only remains registered.
+                if len(self._selector.get_map()) <= 1:
+                    self._thread = None
+                    return
+
+
+class DispatchQueue:
+    """
+    Functions called one after the other, in order, from the dispatch workers of the shared reactor.
+
+    Functions of different queues may be called concurrently.
+    """
+
+    #: Queue which functions are being called by the current thread, if any.
+    _current = threading.local()  # type: typing.Any
+
+    def __init__(self):  # type: (...) -> None
+        #: Lock protecting :attr:`_pending` and :attr:`_scheduled`.
+        self._lock = threading.Lock()  # type: threading.Lock
+        #: Functions to call.
+        self._pending = collections.deque()  # type: typing.Deque[typing.Callable[[], None]]
+        #: ``True`` when a dispatch worker has been requested to call the pending functions.
+        self._scheduled = False  # type: bool
+
+    def put(
+            self,
+            func,  # type: typing.Callable[[], None]
+    ):  # type: (...) -> None
+        """
+        Queues a function to call.
+
+        :param func: Function to call.
+        """
+        with self._lock:
+            self._pending.append(func)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        SUBPROCESS_REACTOR.dispatch(self._drain)
+
+    def iscurrent(self):  # type: (...) -> bool
+        """
+        Tells whether the current thread is calling the functions of this queue.
+
+        :return: ``True`` when called from one of the functions of this queue.
+        """
+        return getattr(DispatchQueue._current, "queue", None) is self
+
+    def _drain(self):  # type: (...) -> None
+        """
+        Dispatch worker routine: calls the pending functions until the queue is empty.
+        """
+        from .loggermain import MAIN_LOGGER
+
+        DispatchQueue._current.queue = self
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        self._scheduled = False
+                        return
+                    _func = self._pending.popleft()  # type: typing.Callable[[], None]
+                try:
+                    _func()
+                except Exception as _err:
+                    # Don't let a function error stop calling the next ones.
+                    MAIN_LOGGER.error(f"Error while processing sub-process data: {_err}")
+        finally:
+            DispatchQueue._current.queue = None
+
+
+__doc__ += """
+.. py:attribute:: SUBPROCESS_REACTOR
+
+    Main instance of :class:`SubProcessReactor`.
+"""
+SUBPROCESS_REACTOR = SubProcessReactor()  # type: SubProcessReactor
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Execution tracing.
+
+Named and nestable spans, recorded in a preallocated in-memory buffer,
+aggregated in a timing table at the end of the run,
+and possibly exported as a timeline in the Chrome trace-event format.
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+# `Logger` used for inheritance.
+from .logger import Logger
+
+if typing.TYPE_CHECKING:
+    # `Path` used in method signatures.
+    # Type declared for type checking only.
+    from .path import Path
+    # `JSONDict` used in method signatures.
+    # Type declared for type checking only.
+    from .typing import JSONDict
+
+    #: Variable callable type.
+    VarCallableType = typing.TypeVar("VarCallableType", bound=typing.Callable[..., typing.Any])
+
+
+class Tracer(Logger):
+    """
+    Execution tracer.
+
+    Tracing is enabled by :meth:`start()` when either:
+
+    - the :attr:`.scenarioconfig.ScenarioConfig.Key.EXEC_TIMES_FILE` configuration is set,
+    - the :attr:`.scenarioconfig.ScenarioConfig.Key.TRACE_EVENTS_FILE` configuration is set,
+    - or the :attr:`.debugclasses.DebugClass.EXECUTION_TIMES` debug class is enabled.
+
+    Otherwise, :meth:`span()` returns a shared no-op context, which makes tracing almost free.
+
+    .. code-block:: python
+
+        with TRACER.span("My processing"):
+            ...
+    """
+
+    class _Span:
+        """
+        Context that ends the current span of the calling thread when exited.
+
+        A single instance is shared by all spans, which are ended in a LIFO order.
+        """
+
+        __slots__ = ("_tracer", )
+
+        def __init__(
+                self,
+                tracer,  # type: Tracer
+        ):  # type: (...) -> None
+            """
+            :param tracer: Owner tracer.
+            """
+            #: Owner tracer.
+            self._tracer = tracer  # type: Tracer
+
+        def __enter__(self):  # type: (...) -> Tracer._Span
+            return self
+
+        def __exit__(
+                self,
+                *exc_info,  # type: typing.Any
+        ):  # type: (...) -> None
+            self._tracer.end()
+
+    class _NoSpan:
+        """
+        No-op context, returned by :meth:`Tracer.span()` when tracing is disabled.
+        """
+
+        __slots__ = ()
+
+        def __enter__(self):  # type: (...) -> Tracer._NoSpan
+            return self
+
+        def __exit__(
+                self,
+                *exc_info,  # type: typing.Any
+        ):  # type: (...) -> None
+            pass
+
+    #: Initial capacity of the span buffer.
+    INITIAL_CAPACITY = 4096  # type: int
+
+    def __init__(self):  # type: (...) -> None
+        """
+        Initializes an empty, disabled tracer.
+        """
+        from .debugclasses import DebugClass
+
+        Logger.__init__(self, log_class=DebugClass.EXECUTION_TIMES)
+
+        #: ``True`` when tracing is enabled.
+        self.enabled = False  # type: bool
+        #: Output file path for the timing table, if any.
+        self.outpath = None  # type: typing.Optional[Path]
+        #: Output file path for the Chrome trace-event timeline, if any.
+        self.trace_events_outpath = None  # type: typing.Optional[Path]
+        #: Process name, displayed in the timeline.
+        self.process_name = os.path.basename(sys.argv[0])  # type: str
+
+        #: Number of spans recorded.
+        self._count = 0  # type: int
+        #: Span names.
+        self._names = []  # type: typing.List[str]
+        #: Span starting times, in nanoseconds.
+        self._starts = []  # type: typing.List[int]
+        #: Span ending times, in nanoseconds. ``0`` while the span is still open.
+        self._ends = []  # type: typing.List[int]
+        #: Parent span indexes. ``-1`` for top-level spans.
+        self._parents = []  # type: typing.List[int]
+        #: Thread identifiers.
+        self._tids = []  # type: typing.List[int]
+        #: Span arguments, displayed in the timeline.
+        self._args = []  # type: typing.List[typing.Optional[typing.Dict[str, typing.Any]]]
+        self._allocate(Tracer.INITIAL_CAPACITY)
+
+        #: Thread names, per thread identifier.
+        self._thread_names = {}  # type: typing.Dict[int, str]
+        #: Wall-clock reference time, in nanoseconds, that makes timelines of several processes consistent.
+        self._wall_t0 = 0  # type: int
+        #: :meth:`_perfcounterns()` time corresponding to :attr:`_wall_t0`.
+        self._perf_t0 = 0  # type: int
+        #: Trace-event files of other processes to merge in the timeline.
+        self._trace_event_files = []  # type: typing.List[Path]
+
+        #: Open span indexes, per thread.
+        self._stacks = {}  # type: typing.Dict[int, typing.List[int]]
+        #: Lock for span allocation.
+        self._lock = threading.Lock()  # type: threading.Lock
+
+        #: Shared span context.
+        self._span = Tracer._Span(self)  # type: Tracer._Span
+        #: Shared no-op context.
+        self._no_span = Tracer._NoSpan()  # type: Tracer._NoSpan
+
+    def start(self):  # type: (...) -> None
+        """
+        Starts tracing, if configured.
+
+        Resets the spans recorded previously.
+        """
+        from .scenarioconfig import SCENARIO_CONFIG
+
+        self.outpath = SCENARIO_CONFIG.exectimesoutpath()
+        self.trace_events_outpath = SCENARIO_CONFIG.traceeventsoutpath()
+        if (self.outpath is not None) or (self.trace_events_outpath is not None) or self.isdebugenabled():
+            with self._lock:
+                self._count = 0
+                self._stacks.clear()
+                self._thread_names.clear()
+                self._trace_event_files.clear()
+            self._wall_t0 = Tracer._timens()
+            self._perf_t0 = Tracer._perfcounterns()
+            self.enabled = True
+
+    def stop(self):  # type: (...) -> None
+        """
+        Stops tracing, and dumps the timing table and timeline.
+
+        The timing table is displayed as debug lines,
+        and saved in the :attr:`outpath` file if set.
+
+        The timeline is saved in the :attr:`trace_events_outpath` file if set.
+
+        Spans still open are ended.
+        """
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        _now = Tracer._perfcounterns()  # type: int
+        for _index in range(self._count):  # type: int
+            if not self._ends[_index]:
+                self._ends[_index] = _now
+
+        _lines = self.totable()  # type: typing.List[str]
+        for _line in _lines:  # type: str
+            self.debug("%s", _line)
+        if self.outpath is not None:
+            try:
+                self.outpath.write_text("".join(_line + "\n" for _line in _lines), encoding="utf-8")
+            except Exception as _err:
+                self.error(f"Could not write execution times to '{self.outpath}': {_err}")
+        if self.trace_events_outpath is not None:
+            try:
+                self.trace_events_outpath.write_text(json.dumps(self.totraceevents()), encoding="utf-8")
+            except Exception as _err:
+                self.error(f"Could not write trace events to '{self.trace_events_outpath}': {_err}")
+
+    def span(
+            self,
+            name,  # type: str
+            args=None,  # type: typing.Dict[str, typing.Any]
+    ):  # type: (...) -> typing.Union[Tracer._Span, Tracer._NoSpan]
+        """
+        Opens a span, to be used as a context.
+
+        :param name: Span name.
+        :param args: Optional span arguments, displayed in the timeline.
+        :return: Context that ends the span when exited.
+        """
+        if not self.enabled:
+            return self._no_span
+        self.begin(name, args)
+        return self._span
+
+    def traced(
+            self,
+            name,  # type: str
+    ):  # type: (...) -> typing.Callable[[VarCallableType], VarCallableType]
+        """
+        Function or method decorator that traces each call as a span.
+
+        :param name: Span name.
+        :return: Decorator.
+        """
+        def _decorator(
+                func,  # type: VarCallableType
+        ):  # type: (...) -> VarCallableType
+            @functools.wraps(func)
+            def _wrapper(
+                    *args,  # type: typing.Any
+                    **kwargs,  # type: typing.Any
+            ):  # type: (...) -> typing.Any
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return typing.cast("VarCallableType", _wrapper)
+        return _decorator
+
+    def begin(
+            self,
+            name,  # type: str
+            args=None,  # type: typing.Dict[str, typing.Any]
+    ):  # type: (...) -> None
+        """
+        Begins a span in the calling thread.
+
+        :param name: Span name.
+        :param args: Optional span arguments, displayed in the timeline.
+
+        Should be balanced with a :meth:`end()` call.
+        Prefer :meth:`span()` when possible.
+        """
+        if not self.enabled:
+            return
+
+        _tid = threading.get_ident()  # type: int
+        with self._lock:
+            _index = self._count  # type: int
+            if _index >= len(self._names):
+                self._allocate(len(self._names))
+            self._count += 1
+
+        if _tid not in self._thread_names:
+            self._thread_names[_tid] = threading.current_thread().name
+        _stack = self._stacks.setdefault(_tid, [])  # type: typing.List[int]
+        self._names[_index] = name
+        self._args[_index] = args
+        self._parents[_index] = _stack[-1] if _stack else -1
+        self._tids[_index] = _tid
+        self._ends[_index] = 0
+        _stack.append(_index)
+        self._starts[_index] = Tracer._perfcounterns()
+
+    def end(self):  # type: (...) -> None
+        """
+        Ends the current span of the calling thread.
+        """
+        if not self.enabled:
+            return
+        _now = Tracer._perfcounterns()  # type: int
+
+        _stack = self._stacks.get(threading.get_ident())  # type: typing.Optional[typing.List[int]]
+        if _stack:
+            self._ends[_stack.pop()] = _now
+
+    def annotate(
+            self,
+            **kwargs,  # type: typing.Any
+    ):  # type: (...) -> None
+        """
+        Adds arguments to the current span of the calling thread.
+
+        :param kwargs: Span arguments, displayed in the timeline.
+        """
+        if not self.enabled:
+            return
+
+        _stack = self._stacks.get(threading.get_ident())  # type: typing.Optional[typing.List[int]]
+        if _stack:
+            _args = self._args[_stack[-1]]  # type: typing.Optional[typing.Dict[str, typing.Any]]
+            if _args is None:
+                _args = self._args[_stack[-1]] = {}
+            _args.update(kwargs)
+
+    def addtraceeventsfile(
+            self,
+            path,  # type: Path
+    ):  # type: (...) -> None
+        """
+        Registers the trace-event file of another process, to be merged in the timeline.
+
+        :param path: Trace-event file path.
+        """
+        if self.enabled:
+            self._trace_event_files.append(path)
+
+    def aggregate(self):  # type: (...) -> typing.List[Tracer.Stats]
+        """
+        Aggregates the spans recorded by name.
+
+        :return: Span statistics, sorted by decreasing total times.
+        """
+        _stats = {}  # type: typing.Dict[str, Tracer.Stats]
+        for _index in range(self._count):  # type: int
+            if not self._ends[_index]:
+                continue
+            _name = self._names[_index]  # type: str
+            if _name not in _stats:
+                _stats[_name] = Tracer.Stats(_name)
+            _stats[_name].add(self._ends[_index] - self._starts[_index])
+        return sorted(_stats.values(), key=lambda stats: stats.total, reverse=True)
+
+    def totable(self):  # type: (...) -> typing.List[str]
+        """
+        Builds the timing table.
+
+        :return: Timing table lines.
+        """
+        from .datetimeutils import f2strduration
+
+        _all_stats = self.aggregate()  # type: typing.List[Tracer.Stats]
+        _name_len = max([len("Span")] + [len(_stats.name) for _stats in _all_stats])  # type: int
+        _lines = [
+            "Execution times:",
+            f"  {'Span':<{_name_len}}  {'Count':>8}  {'Total':<15}  {'Mean':<15}  {'Max'}",
+        ]  # type: typing.List[str]
+        for _stats in _all_stats:  # type: Tracer.Stats
+            _lines.append(
+                f"  {_stats.name:<{_name_len}}  {_stats.count:>8}"
+                f"  {f2strduration(_stats.total / 1e9)}  {f2strduration(_stats.mean / 1e9)}  {f2strduration(_stats.max / 1e9)}"
+            )
+        return _lines
+
+    def totraceevents(self):  # type: (...) -> JSONDict
+        """
+        Builds the timeline in the Chrome trace-event format.
+
+        :return: Trace-event JSON data, with the events of the trace-event files registered with :meth:`addtraceeventsfile()`.
+
+        Each process appears with its own track, and each thread with its own sub-track.
+        """
+        _pid = os.getpid()  # type: int
+        _events = [{
+            "name": "process_name", "ph": "M", "pid": _pid, "tid": 0,
+            "args": {"name": self.process_name},
+        }]  # type: typing.List[JSONDict]
+        for _tid in self._thread_names:  # type: int
+            _events.append({
+                "name": "thread_name", "ph": "M", "pid": _pid, "tid": _tid,
+                "args": {"name": self._thread_names[_tid]},
+            })
+        for _index in range(self._count):  # type: int
+            if not self._ends[_index]:
+                continue
+            _event = {
+                "name": self._names[_index], "cat": "scenario", "ph": "X", "pid": _pid, "tid": self._tids[_index],
+                # Timestamps and durations in microseconds.
+                "ts": (self._wall_t0 + self._starts[_index] - self._perf_t0) / 1000.0,
+                "dur": (self._ends[_index] - self._starts[_index]) / 1000.0,
+            }  # type: JSONDict
+            _args = self._args[_index]  # type: typing.Optional[typing.Dict[str, typing.Any]]
+            if _args:
+                _event["args"] = {_key: str(_value) for _key, _value in _args.items()}
+            _events.append(_event)
+
+        for _path in self._trace_event_files:  # type: Path
+            try:
+                _events.extend(json.loads(_path.read_bytes())["traceEvents"])
+            except Exception as _err:
+                self.warning(f"Could not read trace events from '{_path}': {_err}")
+
+        return {"traceEvents": _events, "displayTimeUnit": "ms"}
+
+    def _allocate(
+            self,
+            size,  # type: int
+    ):  # type: (...) -> None
+        """
+        Extends the span buffer.
+
+        :param size: Number of span slots to add.
+        """
+        self._names.extend([""] * size)
+        self._starts.extend([0] * size)
+        self._ends.extend([0] * size)
+        self._parents.extend([-1] * size)
+        self._tids.extend([0] * size)
+        self._args.extend([None] * size)
+
+    @staticmethod
+    def _perfcounterns():  # type: (...) -> int
+        """
+        :return: Performance counter, in nanoseconds.
+
+        :func:`time.perf_counter_ns()` is available from Python 3.7 only.
+        """
+        if sys.version_info >= (3, 7):
+            return time.perf_counter_ns()
+        else:
+            return int(time.perf_counter() * 1000000000)
+
+    @staticmethod
+    def _timens():  # type: (...) -> int
+        """
+        :return: Wall-clock time, in nanoseconds.
+
+        :func:`time.time_ns()` is available from Python 3.7 only.
+        """
+        if sys.version_info >= (3, 7):
+            return time.time_ns()
+        else:
+            return int(time.time() * 1000000000)
+
+    class Stats:
+        """
+        Aggregated statistics for spans of the same name.
+        """
+
+        def __init__(
+                self,
+                name,  # type: str
+        ):  # type: (...) -> None
+            """
+            :param name: Span name.
+            """
+            #: Span name.
+            self.name = name  # type: str
+            #: Number of spans.
+            self.count = 0  # type: int
+            #: Total time, in nanoseconds.
+            self.total = 0  # type: int
+            #: Maximum time, in nanoseconds.
+            self.max = 0  # type: int
+
+        @property
+        def mean(self):  # type: (...) -> float
+            """
+            Mean time, in nanoseconds.
+            """
+            return (self.total / self.count) if self.count else 0.0
+
+        def add(
+                self,
+                duration,  # type: int
+        ):  # type: (...) -> None
+            """
+            Accounts for a span.
+
+            :param duration: Span duration, in nanoseconds.
+            """
+            self.count += 1
+            self.total += duration
+            self.max = max(self.max, duration)
+
+
+__doc__ += """
+.. py:attribute:: TRACER
+
+    Main instance of :class:`Tracer`.
+"""
+TRACER = Tracer()  # type: Tracer
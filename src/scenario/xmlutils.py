@@ -21,6 +21,7 @@ XML DOM utils.
 import abc
 import typing
 import xml.dom.minidom
+import xml.etree.ElementTree
 
 if typing.TYPE_CHECKING:
     # `AnyPathType` used in method signatures.
@@ -80,15 +81,16 @@ class Xml:
             """
             Reads from an XML file.
 
-            :param path: File to read from.
+            :param path: File to read from. Compressed files are detected automatically, and decompressed on the fly.
             :return: XML document read from the file.
             """
-            from .path import Path
+            from .compression import Compression
 
             _doc = Xml.Document()  # type: Xml.Document
-            _doc._xml_doc = xml.dom.minidom.parseString(  # type?: ignore  ## Call to untyped function "parseString" in typed context
-                Path(path).read_bytes(),
-            )
+            with Compression.openread(path) as _file:
+                _doc._xml_doc = xml.dom.minidom.parse(  # type?: ignore  ## Call to untyped function "parse" in typed context
+                    _file,
+                )
             return _doc
 
         def write(
@@ -299,6 +301,87 @@ class Xml:
             """
             self._xml_text.data += data
 
+    @staticmethod
+    def iterparse(
+            path,  # type: AnyPathType
+            expand,  # type: typing.Iterable[str]
+            skip=(),  # type: typing.Iterable[str]
+    ):  # type: (...) -> typing.Iterator[typing.Tuple[str, Xml.Node]]
+        """
+        Reads an XML file incrementally.
+
+        :param path: File to read from. Compressed files are detected automatically, and decompressed on the fly.
+        :param expand: Tag names of the nodes to build with their children.
+        :param skip: Tag names of the children not to build in expanded nodes.
+        :return:
+            Iterator of ``(event, node)`` pairs:
+
+            - ``("start", node)`` when a node not expanded starts, with its attributes, but without children,
+            - ``("end", node)`` when a node not expanded ends (same node as the ``"start"`` one),
+            - ``("end", node)`` when a node expanded has been read, with its children, except the skipped ones.
+
+        Based on :func:`xml.etree.ElementTree.iterparse()`.
+        Elements are dropped once read, so that the memory used remains bounded by the size of the nodes expanded.
+        """
+        from .compression import Compression
+
+        _expand = set(expand)  # type: typing.Set[str]
+        _skip = set(skip)  # type: typing.Set[str]
+        _xml_doc = xml.dom.minidom.Document()  # type: xml.dom.minidom.Document
+        # Elements being read, out of expanded nodes, with their respective nodes.
+        _stack = []  # type: typing.List[typing.Tuple[xml.etree.ElementTree.Element, Xml.Node]]
+        # Depth in the node being expanded, if any.
+        _expand_depth = 0  # type: int
+        with Compression.openread(path) as _file:
+            for _event, _et_element in xml.etree.ElementTree.iterparse(_file, events=("start", "end")):  # type: str, xml.etree.ElementTree.Element
+                if _event == "start":
+                    if _expand_depth or (_et_element.tag in _expand):
+                        _expand_depth += 1
+                    else:
+                        _stack.append((_et_element, Xml.Node(Xml._et2minidom(_xml_doc, _et_element, _skip, children=False))))
+                        yield "start", _stack[-1][1]
+                elif _expand_depth:
+                    _expand_depth -= 1
+                    if _et_element.tag in _skip:
+                        # Release the skipped content as soon as possible.
+                        _et_element.clear()
+                    if not _expand_depth:
+                        yield "end", Xml.Node(Xml._et2minidom(_xml_doc, _et_element, _skip, children=True))
+                        # Drop the element expanded.
+                        if _stack:
+                            _stack[-1][0].remove(_et_element)
+                else:
+                    yield "end", _stack.pop()[1]
+
+    @staticmethod
+    def _et2minidom(
+            xml_doc,  # type: xml.dom.minidom.Document
+            et_element,  # type: xml.etree.ElementTree.Element
+            skip,  # type: typing.Set[str]
+            children,  # type: bool
+    ):  # type: (...) -> xml.dom.minidom.Element
+        """
+        Converts an :mod:`xml.etree.ElementTree` element into a :mod:`xml.dom.minidom` one.
+
+        :param xml_doc: Document to create the node with.
+        :param et_element: Element to convert.
+        :param skip: Tag names of the children not to convert.
+        :param children: ``True`` to convert the children and texts, ``False`` to convert the attributes only.
+        :return: Converted node.
+        """
+        _xml_element = xml_doc.createElement(et_element.tag)  # type: xml.dom.minidom.Element
+        for _name, _value in et_element.attrib.items():  # type: str, str
+            _xml_element.setAttribute(_name, _value)
+        if children:
+            if et_element.text:
+                _xml_element.appendChild(xml_doc.createTextNode(et_element.text))
+            for _et_child in et_element:  # type: xml.etree.ElementTree.Element
+                if _et_child.tag not in skip:
+                    _xml_element.appendChild(Xml._et2minidom(xml_doc, _et_child, skip, children=True))
+                if _et_child.tail:
+                    _xml_element.appendChild(xml_doc.createTextNode(_et_child.tail))
+        return _xml_element
+
 
 if typing.TYPE_CHECKING:
     #: Variable step definition type.
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import scenario.test
+
+# Steps:
+from .steps.execution import ExecCampaign
+from .steps.outdirfiles import CheckCampaignLogFileLimitations
+from .steps.junitreport import CheckCampaignJunitReport
+
+
+class Campaign006(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Campaign & log file limitations",
+            objective="Check that scenario log files can be size-capped and compressed, and still be read by the campaign.",
+            features=[scenario.test.features.CAMPAIGNS, scenario.test.features.LOGGING],
+        )
+
+        _campaign_expectations = scenario.test.CampaignExpectations()  # type: scenario.test.CampaignExpectations
+        scenario.test.data.testsuiteexpectations(_campaign_expectations, scenario.test.paths.TEST_DATA_TEST_SUITE)
+        assert _campaign_expectations.all_test_case_expectations
+
+        self.section("Compressed log files")
+        self.addstep(ExecCampaign([scenario.test.paths.TEST_DATA_TEST_SUITE], config_values={
+            scenario.ConfigKey.LOG_FILE_COMPRESS: "1",
+        }))
+        self.addstep(CheckCampaignLogFileLimitations(ExecCampaign.getinstance(0), _campaign_expectations, compressed=True))
+        self.addstep(CheckCampaignJunitReport(ExecCampaign.getinstance(0), _campaign_expectations))
+
+        self.section("Size-capped log files")
+        self.addstep(ExecCampaign([scenario.test.paths.TEST_DATA_TEST_SUITE], config_values={
+            scenario.ConfigKey.LOG_FILE_MAX_SIZE: "1024",
+            scenario.ConfigKey.LOG_FILE_TAIL_SIZE: "512",
+        }))
+        self.addstep(CheckCampaignLogFileLimitations(ExecCampaign.getinstance(1), _campaign_expectations, compressed=False, max_size=1024))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import scenario.test
+
+# Steps:
+from .steps.execution import ExecCampaign
+from .steps.outdirfiles import CheckCampaignTraceEvents
+from .steps.junitreport import CheckCampaignJunitReport
+
+
+class Campaign007(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Campaign & execution timeline",
+            objective="Check that the campaign saves an execution timeline that merges the timelines of its test cases.",
+            features=[scenario.test.features.CAMPAIGNS, scenario.test.features.LOGGING],
+        )
+
+        _campaign_expectations = scenario.test.CampaignExpectations()  # type: scenario.test.CampaignExpectations
+        scenario.test.data.testsuiteexpectations(_campaign_expectations, scenario.test.paths.TEST_DATA_TEST_SUITE)
+        assert _campaign_expectations.all_test_case_expectations
+
+        _trace_events_path = self.mktmppath(suffix=".trace.json")  # type: scenario.Path
+
+        self.addstep(ExecCampaign([scenario.test.paths.TEST_DATA_TEST_SUITE], config_values={
+            scenario.ConfigKey.TRACE_EVENTS_FILE: _trace_events_path,
+        }))
+        self.addstep(CheckCampaignJunitReport(ExecCampaign.getinstance(), _campaign_expectations))
+        self.addstep(CheckCampaignTraceEvents(ExecCampaign.getinstance(), _campaign_expectations, _trace_events_path))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import scenario.test
+
+# Steps:
+from .steps.execution import ExecCampaign
+from .steps.junitreport import CheckCampaignJunitReport
+
+
+class Campaign008(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Campaign report reading in summary mode",
+            objective=(
+                "Check that the campaign report can be read with the test case JSON reports in summary mode, "
+                "with the same statuses, errors and statistics as in full mode."
+            ),
+            features=[scenario.test.features.CAMPAIGNS],
+        )
+
+        # Campaign execution.
+        self.addstep(ExecCampaign([scenario.test.paths.TEST_DATA_TEST_SUITE]))
+
+        # Campaign expectations.
+        _campaign_expectations = scenario.test.CampaignExpectations()  # type: scenario.test.CampaignExpectations
+        scenario.test.data.testsuiteexpectations(_campaign_expectations, scenario.test.paths.TEST_DATA_TEST_SUITE, error_details=True, stats=True)
+
+        # Verifications.
+        self.addstep(CheckCampaignJunitReport(ExecCampaign.getinstance(), _campaign_expectations, summary=True))
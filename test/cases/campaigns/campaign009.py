@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import scenario.test
+
+# Steps:
+from .steps.execution import ExecCampaign
+from .steps.outdirfiles import CheckCampaignCompressedReports
+from .steps.junitreport import CheckCampaignJunitReport
+
+
+class Campaign009(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Campaign & compressed reports",
+            objective="Check that JSON and JUnit reports can be compressed, and still be read transparently.",
+            features=[scenario.test.features.CAMPAIGNS, scenario.test.features.SCENARIO_REPORT],
+        )
+
+        _campaign_expectations = scenario.test.CampaignExpectations()  # type: scenario.test.CampaignExpectations
+        scenario.test.data.testsuiteexpectations(_campaign_expectations, scenario.test.paths.TEST_DATA_TEST_SUITE)
+        assert _campaign_expectations.all_test_case_expectations
+
+        self.addstep(ExecCampaign([scenario.test.paths.TEST_DATA_TEST_SUITE], config_values={
+            scenario.ConfigKey.REPORT_COMPRESSION: "xz",
+            scenario.ConfigKey.LOG_FILE_COMPRESS: "1",
+        }))
+        self.addstep(CheckCampaignCompressedReports(ExecCampaign.getinstance(), _campaign_expectations, suffix=".xz"))
+        self.addstep(CheckCampaignJunitReport(ExecCampaign.getinstance(), _campaign_expectations))
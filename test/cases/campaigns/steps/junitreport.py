@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import typing
 
 import scenario
@@ -30,10 +31,12 @@ class CheckCampaignJunitReport(scenario.test.VerificationStep):
             self,
             exec_step,  # type: ExecCampaign
             campaign_expectations,  # type: scenario.test.CampaignExpectations
+            summary=False,  # type: bool
     ):  # type: (...) -> None
         scenario.test.VerificationStep.__init__(self, exec_step)
 
         self.campaign_expectations = campaign_expectations  # type: scenario.test.CampaignExpectations
+        self.summary = summary  # type: bool
 
     def step(self):  # type: (...) -> None
         self.STEP("JUnit report")
@@ -41,9 +44,9 @@ class CheckCampaignJunitReport(scenario.test.VerificationStep):
         scenario.logging.resetindentation()
 
         _campaign_execution = scenario.CampaignExecution(outdir=None)  # type: scenario.CampaignExecution
-        if self.ACTION("Read the .xml campaign report file."):
+        if self.ACTION("Read the .xml campaign report file" + (", with test case JSON reports in summary mode." if self.summary else ".")):
             self.evidence(f"Campaign report path: '{self.getexecstep(ExecCampaign).junit_report_path}'")
-            _campaign_execution_read = scenario.campaign_report.readjunitreport(self.getexecstep(ExecCampaign).junit_report_path)
+            _campaign_execution_read = scenario.campaign_report.readjunitreport(self.getexecstep(ExecCampaign).junit_report_path, summary=self.summary)
             self.assertisnotnone(
                 _campaign_execution_read,
                 evidence="Campaign report successfully read",
@@ -181,6 +184,27 @@ class CheckCampaignJunitReport(scenario.test.VerificationStep):
                 test_case_execution.json.path,
                 evidence="JSON report",
             )
+        if self.summary:
+            if self.RESULT("The scenario report has been read in summary mode."):
+                self.assertisnone(
+                    test_case_execution.scenario_execution,
+                    evidence="Full scenario execution",
+                )
+                self.assertisnotnone(
+                    test_case_execution.json.summary,
+                    evidence="Scenario summary",
+                )
+        if hasattr(os, "wait4"):
+            if self.RESULT("The report gives the resource usage of the scenario sub-process."):
+                self.assertisnotnone(
+                    test_case_execution.rusage,
+                    evidence="Resource usage",
+                )
+                assert test_case_execution.rusage
+                self.assertgreater(
+                    test_case_execution.rusage.max_rss, 0,
+                    evidence="Max RSS",
+                )
 
         if scenario_expectations.status is not None:
             if self.RESULT(f"The test case status is {scenario_expectations.status}."):
@@ -281,3 +305,68 @@ class CheckCampaignJunitReport(scenario.test.VerificationStep):
                         _stats.executed, _stat_expectations.executed,
                         evidence=f"Total number of {_stat_types_txt.plural}",
                     )
+
+
+class CheckCampaignJunitReportIteration(scenario.test.VerificationStep):
+
+    def __init__(
+            self,
+            exec_step,  # type: ExecCampaign
+            campaign_expectations,  # type: scenario.test.CampaignExpectations
+    ):  # type: (...) -> None
+        scenario.test.VerificationStep.__init__(self, exec_step)
+
+        self.campaign_expectations = campaign_expectations  # type: scenario.test.CampaignExpectations
+
+    def step(self):  # type: (...) -> None
+        self.STEP("JUnit report incremental reading")
+
+        _executions = []  # type: typing.List[typing.Union[scenario.CampaignExecution, scenario.TestSuiteExecution, scenario.TestCaseExecution]]
+        if self.ACTION("Iterate over the .xml campaign report file with `scenario.campaign_report.iterjunitreport()`."):
+            self.evidence(f"Campaign report path: '{self.getexecstep(ExecCampaign).junit_report_path}'")
+            _executions = list(scenario.campaign_report.iterjunitreport(self.getexecstep(ExecCampaign).junit_report_path, summary=True))
+            self.evidence(f"{len(_executions)} execution objects read")
+
+        if self.RESULT("The campaign execution is yielded first."):
+            self.assertisnotempty(
+                _executions,
+                evidence="Execution objects",
+            )
+            self.assertisinstance(
+                _executions[0], scenario.CampaignExecution,
+                evidence="First execution object",
+            )
+
+        assert self.campaign_expectations.test_suite_expectations is not None
+        _test_suites_txt = scenario.text.Countable("test suite", self.campaign_expectations.test_suite_expectations)  # type: scenario.text.Countable
+        if self.RESULT(f"{len(_test_suites_txt)} {_test_suites_txt} {_test_suites_txt.are} yielded, each one before its test cases."):
+            _test_suite_executions = [_execution for _execution in _executions if isinstance(_execution, scenario.TestSuiteExecution)]
+            self.assertlen(
+                _test_suite_executions, len(self.campaign_expectations.test_suite_expectations),
+                evidence="Number of test suites",
+            )
+            for _execution in _executions:
+                if isinstance(_execution, scenario.TestCaseExecution):
+                    self.assertin(
+                        _execution.test_suite_execution, _executions[:_executions.index(_execution)],
+                        evidence=f"'{_execution.name}' test suite yielded before",
+                    )
+
+        assert self.campaign_expectations.all_test_case_expectations is not None
+        _test_cases_txt = scenario.text.Countable("test case", self.campaign_expectations.all_test_case_expectations)  # type: scenario.text.Countable
+        if self.RESULT(f"{len(_test_cases_txt)} {_test_cases_txt} {_test_cases_txt.are} yielded, "
+                       f"and attached to their test suite and campaign executions by the way."):
+            _test_case_executions = [_execution for _execution in _executions if isinstance(_execution, scenario.TestCaseExecution)]
+            self.assertlen(
+                _test_case_executions, len(self.campaign_expectations.all_test_case_expectations),
+                evidence="Number of test cases",
+            )
+            for _test_case_execution in _test_case_executions:  # type: scenario.TestCaseExecution
+                self.assertin(
+                    _test_case_execution, _test_case_execution.test_suite_execution.test_case_executions,
+                    evidence=f"'{_test_case_execution.name}' attached to its test suite",
+                )
+                self.assertsameinstances(
+                    _test_case_execution.test_suite_execution.campaign_execution, _executions[0],
+                    evidence=f"'{_test_case_execution.name}' campaign execution",
+                )
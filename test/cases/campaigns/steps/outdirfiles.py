@@ -14,8 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import typing
 
+if typing.TYPE_CHECKING:
+    from scenario.typing import JSONDict
 import scenario
 import scenario.test
 
@@ -127,3 +130,167 @@ class CheckCampaignOutdirFiles(scenario.test.VerificationStep):
                     del self._outdir_content[_index]
                 else:
                     _index += 1
+
+
+class CheckCampaignLogFileLimitations(scenario.test.VerificationStep):
+
+    def __init__(
+            self,
+            exec_step,  # type: ExecCampaign
+            campaign_expectations,  # type: scenario.test.CampaignExpectations
+            compressed,  # type: bool
+            max_size=None,  # type: int
+    ):  # type: (...) -> None
+        scenario.test.VerificationStep.__init__(self, exec_step)
+
+        self.campaign_expectations = campaign_expectations  # type: scenario.test.CampaignExpectations
+        self.compressed = compressed  # type: bool
+        self.max_size = max_size  # type: typing.Optional[int]
+        self._outfiles = CampaignOutdirFilesManager(exec_step)  # type: CampaignOutdirFilesManager
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Log file limitations")
+
+        assert self.campaign_expectations.all_test_case_expectations
+        for _test_case_expectations in self.campaign_expectations.all_test_case_expectations:  # type: scenario.test.ScenarioExpectations
+            assert _test_case_expectations.script_path is not None
+            _log = None  # type: typing.Optional[scenario.campaignexecution.LogFileReader]
+            if self.doexecute():
+                _log = self._outfiles.getscenarioresults(_test_case_expectations.script_path).log
+
+            if self.compressed:
+                if self.RESULT(f"'{_test_case_expectations.script_path}' log file is compressed with a '.gz' suffix."):
+                    assert _log and _log.path
+                    self.assertisfile(
+                        _log.path.parent / (_log.path.name + ".gz"),
+                        evidence="Compressed log file",
+                    )
+                    self.assertnotexists(
+                        _log.path,
+                        evidence="Uncompressed log file",
+                    )
+
+            if self.ACTION(f"Read the '{_test_case_expectations.script_path}' log file."):
+                assert _log
+                self.asserttrue(_log.locate(), evidence="Log file located")
+                self.asserttrue(_log.read(), evidence="Log file read")
+                assert _log.content is not None
+                self.evidence(f"{len(_log.content)} bytes read")
+            if self.RESULT("The log file content is not empty."):
+                assert _log and (_log.content is not None)
+                self.assertisnotempty(
+                    _log.content,
+                    evidence="Log file content",
+                )
+            if self.max_size is not None:
+                if self.RESULT(f"The log file content does not exceed {self.max_size} bytes (plus the skipped lines indication)."):
+                    assert _log and (_log.content is not None)
+                    self.assertlessequal(
+                        len(_log.content), self.max_size + 128,
+                        evidence="Log file size",
+                    )
+
+
+class CheckCampaignCompressedReports(scenario.test.VerificationStep):
+
+    def __init__(
+            self,
+            exec_step,  # type: ExecCampaign
+            campaign_expectations,  # type: scenario.test.CampaignExpectations
+            suffix,  # type: str
+    ):  # type: (...) -> None
+        scenario.test.VerificationStep.__init__(self, exec_step)
+
+        self.campaign_expectations = campaign_expectations  # type: scenario.test.CampaignExpectations
+        self.suffix = suffix  # type: str
+        self._outfiles = CampaignOutdirFilesManager(exec_step)  # type: CampaignOutdirFilesManager
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Compressed reports")
+
+        assert self.campaign_expectations.all_test_case_expectations
+        for _test_case_expectations in self.campaign_expectations.all_test_case_expectations:  # type: scenario.test.ScenarioExpectations
+            assert _test_case_expectations.script_path is not None
+            _json = None  # type: typing.Optional[scenario.campaignexecution.JsonReportReader]
+            if self.doexecute():
+                _json = self._outfiles.getscenarioresults(_test_case_expectations.script_path).json
+
+            if self.RESULT(f"'{_test_case_expectations.script_path}' JSON report is compressed with a '{self.suffix}' suffix."):
+                assert _json and _json.path
+                self.assertisfile(
+                    _json.path.parent / (_json.path.name + self.suffix),
+                    evidence="Compressed JSON report",
+                )
+                self.assertnotexists(
+                    _json.path,
+                    evidence="Uncompressed JSON report",
+                )
+            if self.ACTION(f"Read the '{_test_case_expectations.script_path}' JSON report."):
+                assert _json
+                self.asserttrue(_json.locate(), evidence="JSON report located")
+                self.asserttrue(_json.read(), evidence="JSON report read")
+            if self.RESULT("The JSON report gives the scenario execution."):
+                assert _json
+                self.assertisnotnone(
+                    _json.content,
+                    evidence="Scenario execution",
+                )
+
+        if self.RESULT(f"The campaign report is compressed with a '{self.suffix}' suffix."):
+            self.assertisfile(
+                self._outfiles.junit_report_path.parent / (self._outfiles.junit_report_path.name + self.suffix),
+                evidence="Compressed campaign report",
+            )
+            self.assertnotexists(
+                self._outfiles.junit_report_path,
+                evidence="Uncompressed campaign report",
+            )
+
+
+class CheckCampaignTraceEvents(scenario.test.VerificationStep):
+
+    def __init__(
+            self,
+            exec_step,  # type: ExecCampaign
+            campaign_expectations,  # type: scenario.test.CampaignExpectations
+            trace_events_path,  # type: scenario.Path
+    ):  # type: (...) -> None
+        scenario.test.VerificationStep.__init__(self, exec_step)
+
+        self.campaign_expectations = campaign_expectations  # type: scenario.test.CampaignExpectations
+        self.trace_events_path = trace_events_path  # type: scenario.Path
+        self.exec_campaign = exec_step  # type: ExecCampaign
+        self.trace_events = []  # type: typing.List[JSONDict]
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Execution timeline")
+
+        assert self.campaign_expectations.all_test_case_expectations
+        for _test_case_expectations in self.campaign_expectations.all_test_case_expectations:  # type: scenario.test.ScenarioExpectations
+            assert _test_case_expectations.script_path is not None
+            if self.RESULT(f"A timeline file has been generated for '{_test_case_expectations.script_path}'."):
+                self.assertisfile(
+                    self.exec_campaign.final_outdir_path / _test_case_expectations.script_path.name.replace(".py", ".trace.json"),
+                    evidence="Test case timeline file",
+                )
+
+        if self.ACTION(f"Read the {self.test_case.getpathdesc(self.trace_events_path)} campaign timeline file."):
+            self.trace_events = json.loads(self.trace_events_path.read_bytes())["traceEvents"]
+            self.evidence(f"{len(self.trace_events)} trace events read")
+        if self.RESULT("The campaign timeline describes the test case executions of the campaign process."):
+            _pids = set(_event["pid"] for _event in self.trace_events if _event["name"] == "CampaignRunner._exectestcase()")  # type: typing.Set[int]
+            self.assertlen(
+                _pids, 1,
+                evidence="Campaign process identifiers",
+            )
+            self.assertlen(
+                [_event for _event in self.trace_events if _event["name"] == "CampaignRunner._exectestcase()"],
+                len(self.campaign_expectations.all_test_case_expectations),
+                evidence="Test case executions",
+            )
+        if self.RESULT("The campaign timeline merges the step executions of the test case processes."):
+            _pids = set(_event["pid"] for _event in self.trace_events if _event["name"] == "ScenarioRunner._execstep()")  # Type already declared above.
+            self.assertlen(
+                _pids, len(self.campaign_expectations.all_test_case_expectations),
+                evidence="Test case process identifiers",
+            )
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+import scenario
+import scenario.test
+
+# Steps:
+from steps.common import ExecScenario
+from .steps.currentprocess import StoreConfigValue
+from .steps.currentprocess import CheckConfigValueOrigin
+from .steps.subprocesslog import CheckConfigValueScenarioLog
+from .steps.subprocesslog import CheckConfigShowScenarioLog
+
+
+class ConfigDb025(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Configuration value origins from code",
+            objective=(
+                "Check that configuration values set from the code give the code location as their origin, "
+                "with a fully qualified name, in the 'path:line:qualname' form."
+            ),
+            features=[scenario.test.features.CONFIG_DB],
+        )
+
+        # Make this scenario continue on errors, in order to make sure temporary configuration keys are removed in the end.
+        self.continue_on_error = True
+
+        _origin = scenario.CodeLocation(
+            scenario.test.paths.CONFIG_DB_SCENARIO,
+            34,  # location: CONFIG_DB_SCENARIO/set
+            "ConfigDbScenario.step000",
+        ).tolongstring()  # type: str
+
+        self.section("Scenario execution")
+        self.addstep(ExecScenario(scenario.test.paths.CONFIG_DB_SCENARIO))
+        self.addstep(CheckConfigValueScenarioLog(ExecScenario.getinstance(), key="foo.bar", origin=_origin, value="1"))
+        self.addstep(CheckConfigShowScenarioLog(ExecScenario.getinstance(), key="foo.bar", origin=_origin, value="1"))
+
+        self.section("Current process")
+        self.tmp_root_key = scenario.Path(__file__).stem  # type: str
+        self.addstep(StoreConfigValue(f"{self.tmp_root_key}.a", 1))
+        self.addstep(CheckConfigValueOrigin(f"{self.tmp_root_key}.a", StoreConfigValue.setlocation().tolongstring()))
+
+        scenario.handlers.install(
+            scenario.Event.AFTER_TEST, self._finalize,
+            scenario=self, once=True,
+        )
+
+    def _finalize(
+            self,
+            event,  # type: str
+            data,  # type: typing.Any
+    ):  # type: (...) -> None
+        if self.doexecute():
+            self.info(f"Removing configuration value {self.tmp_root_key!r}")
+            scenario.conf.remove(self.tmp_root_key)
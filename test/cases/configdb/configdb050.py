@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+import scenario
+import scenario.test
+
+# Steps:
+from .steps.currentprocess import StoreConfigValue
+from .steps.currentprocess import RemoveConfigValue
+from .steps.currentprocess import SubscribeConfigChanges
+from .steps.currentprocess import CheckConfigChanges
+
+
+class ConfigDb050(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Configuration change subscription",
+            objective="Check that configuration changes are notified for the key subscribed to, its ancestor keys and sub-keys.",
+            features=[scenario.test.features.CONFIG_DB],
+        )
+
+        self.tmp_root_key = scenario.Path(__file__).stem  # type: str
+        _config_key = f"{self.tmp_root_key}.a"  # type: str
+
+        self.addstep(SubscribeConfigChanges(_config_key))
+
+        self.section("Sub-key")
+        self.addstep(StoreConfigValue(f"{_config_key}.b", 5))
+        self.addstep(CheckConfigChanges(SubscribeConfigChanges.getinstance(), notified=True))
+
+        self.section("Sibling key")
+        self.addstep(StoreConfigValue(f"{self.tmp_root_key}.ab", 10))
+        self.addstep(CheckConfigChanges(SubscribeConfigChanges.getinstance(), notified=False))
+
+        self.section("Ancestor key")
+        self.addstep(StoreConfigValue(self.tmp_root_key, {"a": {"b": 1}}))
+        self.addstep(CheckConfigChanges(SubscribeConfigChanges.getinstance(), notified=True))
+
+        self.section("Key subscribed to")
+        self.addstep(RemoveConfigValue(_config_key))
+        self.addstep(CheckConfigChanges(SubscribeConfigChanges.getinstance(), notified=True))
+
+        scenario.handlers.install(
+            scenario.Event.AFTER_TEST, self._finalize,
+            scenario=self, once=True,
+        )
+
+    def _finalize(
+            self,
+            event,  # type: str
+            data,  # type: typing.Any
+    ):  # type: (...) -> None
+        if self.doexecute():
+            SubscribeConfigChanges.getinstance().unsubscribe()
+            self.info(f"Removing configuration value {self.tmp_root_key!r}")
+            scenario.conf.remove(self.tmp_root_key)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+import scenario
+import scenario.test
+
+# Steps:
+from .steps.currentprocess import StoreConfigValue
+from .steps.currentprocess import CheckDictConfigNode
+from .steps.currentprocess import CheckListConfigNode
+from .steps.currentprocess import CheckConfigValue
+
+
+class ConfigDb060(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Configuration tree stored at once",
+            objective="Check that nested dictionaries and lists stored at once are split into the expected configuration nodes.",
+            features=[scenario.test.features.CONFIG_DB],
+        )
+
+        self.tmp_root_key = scenario.Path(__file__).stem  # type: str
+
+        self.addstep(StoreConfigValue(self.tmp_root_key, {
+            "devices": [
+                {"name": "dev0", "ports": [1, 2, 3]},
+                {"name": "dev1", "ports": [], "path": scenario.Path(__file__)},
+            ],
+            "a.b": "dotted",
+            "none": None,
+        }))
+
+        self.section("Dictionaries")
+        self.addstep(CheckDictConfigNode(self.tmp_root_key, ["devices", "a"]))
+        self.addstep(CheckDictConfigNode(f"{self.tmp_root_key}.devices[1]", ["name", "ports", "path"]))
+
+        self.section("Lists")
+        self.addstep(CheckListConfigNode(f"{self.tmp_root_key}.devices", 2))
+        self.addstep(CheckListConfigNode(f"{self.tmp_root_key}.devices[0].ports", 3))
+        self.addstep(CheckListConfigNode(f"{self.tmp_root_key}.devices[1].ports", 0))
+
+        self.section("Final values")
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.devices[1].name", read_as=None, expected_type=str, expected_value="dev1"))
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.devices[0].ports[2]", read_as=None, expected_type=int, expected_value=3))
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.devices[1].path", read_as=None, expected_type=str, expected_value=scenario.Path(__file__).abspath))
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.a.b", read_as=None, expected_type=str, expected_value="dotted"))
+
+        scenario.handlers.install(
+            scenario.Event.AFTER_TEST, self._finalize,
+            scenario=self, once=True,
+        )
+
+    def _finalize(
+            self,
+            event,  # type: str
+            data,  # type: typing.Any
+    ):  # type: (...) -> None
+        if self.doexecute():
+            self.info(f"Removing configuration value {self.tmp_root_key!r}")
+            scenario.conf.remove(self.tmp_root_key)
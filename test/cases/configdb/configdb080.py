@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+import scenario
+import scenario.test
+
+# Steps:
+from .steps.currentprocess import StoreConfigValue
+from .steps.currentprocess import RemoveConfigValue
+from .steps.currentprocess import CheckDictConfigNode
+from .steps.currentprocess import CheckListConfigNode
+from .steps.currentprocess import CheckConfigValue
+from .steps.currentprocess import CheckConfigDataReadOnly
+
+
+class ConfigDb080(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Configuration data views",
+            objective="Check that dictionary and list configuration data is read-only, "
+                      "and that it reflects the changes made on sub-keys.",
+            features=[scenario.test.features.CONFIG_DB],
+        )
+
+        self.tmp_root_key = scenario.Path(__file__).stem  # type: str
+
+        self.addstep(StoreConfigValue(self.tmp_root_key, {"a": {"b": 1}, "l": [1, 2]}))
+
+        self.section("Read-only data")
+        self.addstep(CheckConfigDataReadOnly(self.tmp_root_key))
+        self.addstep(CheckConfigDataReadOnly(f"{self.tmp_root_key}.l"))
+
+        self.section("Sub-key changes")
+        self.addstep(StoreConfigValue(f"{self.tmp_root_key}.a.c", 2))
+        self.addstep(CheckDictConfigNode(f"{self.tmp_root_key}.a", ["b", "c"]))
+        self.addstep(StoreConfigValue(f"{self.tmp_root_key}.l[2]", 3))
+        self.addstep(CheckListConfigNode(f"{self.tmp_root_key}.l", 3))
+        self.addstep(StoreConfigValue(f"{self.tmp_root_key}.a.b", 10))
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.a", read_as=None, expected_type=dict, expected_value={"b": 10, "c": 2}))
+        self.addstep(RemoveConfigValue(f"{self.tmp_root_key}.a.c"))
+        self.addstep(CheckDictConfigNode(f"{self.tmp_root_key}.a", ["b"]))
+
+        scenario.handlers.install(
+            scenario.Event.AFTER_TEST, self._finalize,
+            scenario=self, once=True,
+        )
+
+    def _finalize(
+            self,
+            event,  # type: str
+            data,  # type: typing.Any
+    ):  # type: (...) -> None
+        if self.doexecute():
+            self.info(f"Removing configuration value {self.tmp_root_key!r}")
+            scenario.conf.remove(self.tmp_root_key)
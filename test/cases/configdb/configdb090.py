@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+import scenario
+import scenario.test
+
+# Steps:
+from .steps.currentprocess import StoreConfigValue
+from .steps.currentprocess import RemoveConfigValue
+from .steps.currentprocess import CheckDictConfigNode
+from .steps.currentprocess import CheckListConfigNode
+from .steps.currentprocess import CheckConfigValue
+
+
+class ConfigDb090(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Configuration removal",
+            objective="Check that list items are renumbered when a list item is removed, "
+                      "and that sections left empty are removed with their last sub-key.",
+            features=[scenario.test.features.CONFIG_DB],
+        )
+
+        self.tmp_root_key = scenario.Path(__file__).stem  # type: str
+
+        self.addstep(StoreConfigValue(self.tmp_root_key, {"a": {"b": {"c": 1}}, "d": 2, "l": [{"x": 10}, {"x": 11}, {"x": 12}, {"x": 13}]}))
+
+        self.section("List item removal")
+        self.addstep(RemoveConfigValue(f"{self.tmp_root_key}.l[1]"))
+        self.addstep(CheckListConfigNode(f"{self.tmp_root_key}.l", 3))
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.l[1].x", read_as=None, expected_type=int, expected_value=12))
+        self.addstep(RemoveConfigValue(f"{self.tmp_root_key}.l[1]"))
+        self.addstep(CheckListConfigNode(f"{self.tmp_root_key}.l", 2))
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.l[1].x", read_as=None, expected_type=int, expected_value=13))
+
+        self.section("Empty sections")
+        self.addstep(RemoveConfigValue(f"{self.tmp_root_key}.a.b.c"))
+        self.addstep(CheckDictConfigNode(self.tmp_root_key, ["d", "l"]))
+
+        scenario.handlers.install(
+            scenario.Event.AFTER_TEST, self._finalize,
+            scenario=self, once=True,
+        )
+
+    def _finalize(
+            self,
+            event,  # type: str
+            data,  # type: typing.Any
+    ):  # type: (...) -> None
+        if self.doexecute():
+            self.info(f"Removing configuration value {self.tmp_root_key!r}")
+            scenario.conf.remove(self.tmp_root_key)
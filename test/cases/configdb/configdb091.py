@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+import scenario
+import scenario.test
+
+# Steps:
+from .steps.currentprocess import LoadConfigFile
+from .steps.currentprocess import StoreConfigValue
+from .steps.currentprocess import RemoveConfigValue
+from .steps.currentprocess import CheckConfigNode
+from .steps.currentprocess import CheckDictConfigNode
+
+
+class ConfigDb091(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Configuration node keys and origins",
+            objective="Check that configuration nodes give their full key and origins, after values are set, after removals and list renumbering.",
+            features=[scenario.test.features.CONFIG_DB],
+        )
+
+        # Make this scenario continue on errors, in order to make sure temporary configuration keys are removed in the end.
+        self.continue_on_error = True
+
+        self.tmp_root_key = scenario.Path(__file__).stem  # type: str
+        _set_origin = StoreConfigValue.setlocation().tolongstring()  # type: str
+        _conf_file = scenario.test.paths.datapath("conf.json")  # type: scenario.Path
+
+        self.section("Set")
+        self.addstep(StoreConfigValue(self.tmp_root_key, {"a": {"b": 1}, "l": [{"x": 10}, {"x": 11}, {"x": 12}]}))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.a.b", 1, origins=[_set_origin]))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.l[2].x", 12, origins=[_set_origin]))
+        self.addstep(StoreConfigValue(f"{self.tmp_root_key}.a.b", 2))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.a.b", 2, origins=[_set_origin]))
+
+        self.section("Origins accumulation")
+        self.addstep(LoadConfigFile(_conf_file, root_key=f"{self.tmp_root_key}.f"))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.f.a.b.c1", 55, origins=[str(_conf_file)]))
+        self.addstep(StoreConfigValue(f"{self.tmp_root_key}.f.a.b.c1", 56))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.f.a.b.c1", 56, origins=[str(_conf_file), _set_origin]))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.f.a.b.c2", 0.050, origins=[str(_conf_file)]))
+
+        self.section("Removal and renumbering")
+        self.addstep(RemoveConfigValue(f"{self.tmp_root_key}.l[0]"))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.l[0].x", 11, origins=[_set_origin]))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.l[1].x", 12, origins=[_set_origin]))
+        self.addstep(RemoveConfigValue(f"{self.tmp_root_key}.f.x.y[1]"))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.f.x.y[1].z", 102, origins=[str(_conf_file)]))
+        self.addstep(CheckConfigNode(f"{self.tmp_root_key}.f.x.y[2].z", 103, origins=[str(_conf_file)]))
+        self.addstep(RemoveConfigValue(f"{self.tmp_root_key}.a.b"))
+        self.addstep(CheckDictConfigNode(self.tmp_root_key, ["f", "l"]))
+
+        scenario.handlers.install(
+            scenario.Event.AFTER_TEST, self._finalize,
+            scenario=self, once=True,
+        )
+
+    def _finalize(
+            self,
+            event,  # type: str
+            data,  # type: typing.Any
+    ):  # type: (...) -> None
+        if self.doexecute():
+            self.info(f"Removing configuration value {self.tmp_root_key!r}")
+            scenario.conf.remove(self.tmp_root_key)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import scenario
+import scenario.test
+
+# Steps:
+from steps.common import ExecScenario
+from steps.common import LogVerificationStep
+
+
+class ConfigDb095(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Invalid scenario configuration values",
+            objective="Check that invalid scenario configuration values are ignored with a warning, without breaking the test execution.",
+            features=[scenario.test.features.CONFIG_DB],
+        )
+
+        self.addstep(ExecScenario(scenario.test.paths.SIMPLE_SCENARIO, config_files=[scenario.test.paths.datapath("invalidconf.json")]))
+        self.addstep(CheckInvalidConfigWarnings(ExecScenario.getinstance()))
+
+
+class CheckInvalidConfigWarnings(LogVerificationStep):
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Invalid configuration warnings")
+
+        _config_file = scenario.test.paths.datapath("invalidconf.json")  # type: scenario.Path
+
+        if self.RESULT(f"A warning is displayed for the invalid '{scenario.ConfigKey.DEBUG_CLASSES}' value."):
+            _line = self.assertline(f"'{scenario.ConfigKey.DEBUG_CLASSES}': Invalid type <class 'int'>")  # type: str
+            self.assertregex(r"^ *WARNING ", _line, evidence=True)
+            self.assertin(_config_file.name, _line, evidence=True)
+
+        if self.RESULT(f"A warning is displayed for the invalid '{scenario.ConfigKey.ISSUE_LEVEL_NAMES}.foo' value."):
+            _line = self.assertline(f"'{scenario.ConfigKey.ISSUE_LEVEL_NAMES}.foo': Not an integer value 'abc', issue level name ignored")
+            self.assertregex(r"^ *WARNING ", _line, evidence=True)
+            self.assertin(_config_file.name, _line, evidence=True)
+
+        if self.RESULT("The scenario executes successfully."):
+            self.assertline("Status: SUCCESS", evidence=True)
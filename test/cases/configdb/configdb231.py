@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+import scenario.test
+
+# Steps:
+from .steps.currentprocess import LoadConfigFile
+from .steps.currentprocess import CheckConfigNodeLazy
+from .steps.currentprocess import CheckConfigValue
+
+
+class ConfigDb231(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Lazy JSON configuration file modified",
+            objective="Check that reaching a sub-tree of a JSON configuration file mapped lazily, "
+                      "after the file has been modified, raises an error that tells the file path.",
+            features=[scenario.test.features.CONFIG_DB],
+        )
+
+        # Make this scenario continue on errors, in order to make sure temporary configuration keys are removed in the end.
+        self.continue_on_error = True
+
+        self.tmp_json_path = self.mktmppath(suffix=".json")  # type: scenario.Path
+        self.tmp_root_key = scenario.Path(__file__).stem  # type: str
+
+        self.section("Lazy mapping")
+        self.addstep(CopyJsonFile(scenario.test.paths.datapath("conf.json"), self.tmp_json_path))
+        self.addstep(LoadConfigFile(self.tmp_json_path, root_key=self.tmp_root_key, lazy=True))
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.a.b.c1", read_as=None, expected_type=int, expected_value=55))
+        self.addstep(CheckConfigNodeLazy(f"{self.tmp_root_key}.x", lazy=True))
+
+        self.section("File modification")
+        self.addstep(CopyJsonFile(scenario.test.paths.datapath("conf.json"), self.tmp_json_path, prefix="  "))
+        self.addstep(CheckConfigValue(f"{self.tmp_root_key}.x.y[3].z", read_as=None, expected_type=ValueError, origin=str(self.tmp_json_path)))
+
+        scenario.handlers.install(
+            scenario.Event.AFTER_TEST, self._finalize,
+            scenario=self, once=True,
+        )
+
+    def _finalize(
+            self,
+            event,  # type: str
+            data,  # type: typing.Any
+    ):  # type: (...) -> None
+        if self.doexecute():
+            self.info(f"Removing configuration value {self.tmp_root_key!r}")
+            scenario.conf.remove(self.tmp_root_key)
+
+
+class CopyJsonFile(scenario.test.Step):
+
+    def __init__(
+            self,
+            input_path,  # type: scenario.Path
+            output_path,  # type: scenario.Path
+            prefix="",  # type: str
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.input_path = input_path  # type: scenario.Path
+        self.output_path = output_path  # type: scenario.Path
+        self.prefix = prefix  # type: str
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Copy '{self.input_path}'")
+
+        _prefix_spec = f", with {len(self.prefix)} leading space(s)" if self.prefix else ""  # type: str
+        if self.ACTION(f"Copy the '{self.input_path}' JSON file to {self.test_case.getpathdesc(self.output_path)}{_prefix_spec}."):
+            self.output_path.write_bytes(self.prefix.encode("utf-8") + self.input_path.read_bytes())
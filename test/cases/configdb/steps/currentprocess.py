@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import logging
 import typing
 
@@ -29,18 +30,20 @@ class LoadConfigFile(scenario.test.Step):
             self,
             input_path,  # type: scenario.Path
             root_key="",  # type: str
+            lazy=False,  # type: bool
     ):  # type: (...) -> None
         scenario.test.Step.__init__(self)
 
         self.input_path = input_path  # type: scenario.Path
         self.root_key = root_key  # type: str
+        self.lazy = lazy  # type: bool
 
     def step(self):  # type: (...) -> None
-        self.STEP(f"Load '{self.input_path}'")
+        self.STEP(f"{'Map' if self.lazy else 'Load'} '{self.input_path}'")
 
         _root_key_spec = f" from key {self.root_key!r}" if self.root_key else " at the root level"  # type:str
-        if self.ACTION(f"Load the '{self.input_path}' configuration file{_root_key_spec}."):
-            scenario.conf.loadfile(self.input_path, root=self.root_key)
+        if self.ACTION(f"{'Map' if self.lazy else 'Load'} the '{self.input_path}' configuration file{_root_key_spec}{' lazily' if self.lazy else ''}."):
+            scenario.conf.loadfile(self.input_path, root=self.root_key, lazy=self.lazy)
 
 
 class SaveConfigFile(scenario.test.Step):
@@ -96,7 +99,100 @@ class StoreConfigValue(scenario.test.Step):
         self.STEP(f"Set {self.key}={self.value!r}")
 
         if self.ACTION(f"Store {self.key}={self.value!r} in the configuration database."):
-            scenario.conf.set(self.key, self.value)
+            scenario.conf.set(self.key, self.value)  # location: StoreConfigValue/set
+
+    @staticmethod
+    def setlocation():  # type: (...) -> scenario.CodeLocation
+        """
+        Code location of the :meth:`scenario.conf.set()` call above.
+        """
+        _path = scenario.Path(__file__)  # type: scenario.Path
+        for _line_index, _line in enumerate(_path.read_text().splitlines()):  # type: int, str
+            if _line.endswith("# location: StoreConfigValue/set"):
+                return scenario.CodeLocation(_path, _line_index + 1, "StoreConfigValue.step")
+        raise LookupError(f"No 'StoreConfigValue/set' location in '{_path}'")
+
+
+class CheckConfigValueOrigin(scenario.test.Step):
+
+    def __init__(
+            self,
+            key,  # type: str
+            origin,  # type: str
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.key = key  # type: str
+        self.origin = origin  # type: str
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Check {self.key!r} origin")
+
+        _node = None  # type: typing.Optional[scenario.ConfigNode]
+        if self.ACTION(f"Retrieve the configuration node for key {self.key!r}."):
+            _node = scenario.conf.getnode(self.key)
+            self.evidence(f"Node: {_node!r}")
+
+        if self.RESULT(f"The origin of the configuration node is displayed as {self.origin!r}."):
+            assert _node
+            self.assertequal(
+                str(_node.origin), self.origin,
+                evidence="Origin",
+            )
+        if self.RESULT("Error messages for the configuration node start with the origin."):
+            assert _node
+            self.assertstartswith(
+                _node.errmsg("Error"), f"{self.origin}:'{self.key}': ",
+                evidence="Error message",
+            )
+        if self.RESULT("The snapshot of the configuration node gives the origin as a string."):
+            assert _node
+            self.assertequal(
+                _node.tosnapshot()[0], [self.origin],
+                evidence="Snapshot origins",
+            )
+
+
+class CheckConfigNode(scenario.test.Step):
+
+    def __init__(
+            self,
+            key,  # type: str
+            expected_value,  # type: typing.Any
+            origins,  # type: typing.List[str]
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.key = key  # type: str
+        self.expected_value = expected_value  # type: typing.Any
+        self.origins = origins  # type: typing.List[str]
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Check {self.key!r} node")
+
+        _node = None  # type: typing.Optional[scenario.ConfigNode]
+        if self.ACTION(f"Retrieve the configuration node for key {self.key!r}."):
+            _node = scenario.conf.getnode(self.key)
+            self.evidence(f"Node: {_node!r}")
+
+        if self.RESULT(f"The node gives {self.key!r} for key."):
+            assert _node
+            self.assertequal(
+                _node.key, self.key,
+                evidence="Node key",
+            )
+        if self.RESULT(f"The node gives {self.expected_value!r} for value."):
+            assert _node
+            self.assertequal(
+                _node.data, self.expected_value,
+                evidence="Node value",
+            )
+        if self.RESULT(f"The node gives {self.origins!r} for origins."):
+            assert _node
+            self.assertequal(
+                [str(_origin) for _origin in _node.origins], self.origins,
+                evidence="Node origins",
+            )
 
 
 class RemoveConfigValue(scenario.test.Step):
@@ -249,3 +345,193 @@ class CheckConfigValue(scenario.test.Step):
                         self.origin, str(_value_error),
                         evidence="Configuration value origin",
                     )
+
+
+class SubscribeConfigChanges(scenario.test.Step):
+
+    def __init__(
+            self,
+            key,  # type: str
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.key = key  # type: str
+        self.changed_keys = []  # type: typing.List[str]
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Subscribe to {self.key} changes")
+
+        if self.ACTION(f"Subscribe to configuration changes for {self.key!r}, and record the keys notified."):
+            scenario.conf.subscribe(self.key, self.changed_keys.append)
+
+    def unsubscribe(self):  # type: (...) -> None
+        scenario.conf.unsubscribe(self.key, self.changed_keys.append)
+
+
+class CheckConfigChanges(scenario.test.Step):
+
+    def __init__(
+            self,
+            subscribe_step,  # type: SubscribeConfigChanges
+            notified,  # type: bool
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.subscribe_step = subscribe_step  # type: SubscribeConfigChanges
+        self.notified = notified  # type: bool
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Check {self.subscribe_step.key} changes")
+
+        if self.notified:
+            if self.RESULT(f"Configuration changes have been notified for {self.subscribe_step.key!r}."):
+                self.assertisnotempty(self.subscribe_step.changed_keys, evidence="Keys notified")
+        else:
+            if self.RESULT(f"No configuration change has been notified for {self.subscribe_step.key!r}."):
+                self.assertisempty(self.subscribe_step.changed_keys, evidence="Keys notified")
+        if self.ACTION("Reset the keys notified."):
+            self.subscribe_step.changed_keys.clear()
+
+
+class CheckConfigCacheFiles(scenario.test.Step):
+
+    def __init__(
+            self,
+            cache_dir,  # type: scenario.Path
+            count,  # type: int
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.cache_dir = cache_dir  # type: scenario.Path
+        self.count = count  # type: int
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Check configuration cache files")
+
+        _cache_files = []  # type: typing.List[scenario.Path]
+        if self.ACTION("List the files in the configuration cache directory."):
+            _cache_files = list(self.cache_dir.glob("*.pickle"))
+            self.evidence(f"Cache files: {[_cache_file.name for _cache_file in _cache_files]}")
+        _files_txt = scenario.text.Countable("cache file", self.count)  # type: scenario.text.Countable
+        if self.RESULT(f"The configuration cache directory contains {len(_files_txt)} {_files_txt}."):
+            self.assertlen(
+                _cache_files, self.count,
+                evidence="Number of cache files",
+            )
+
+
+class SaveConfigSnapshot(scenario.test.Step):
+
+    def __init__(
+            self,
+            output_path,  # type: scenario.Path
+            root_key="",  # type: str
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.output_path = output_path  # type: scenario.Path
+        self.root_key = root_key  # type: str
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Save '{self.output_path}' snapshot")
+
+        _root_key_spec = f" from key {self.root_key!r}" if self.root_key else " from the root level"  # type:str
+        if self.ACTION(f"Save the '{self.output_path}' configuration snapshot{_root_key_spec}."):
+            scenario.conf.savesnapshot(self.output_path, root=self.root_key)
+
+
+class LoadConfigSnapshot(scenario.test.Step):
+
+    def __init__(
+            self,
+            input_path,  # type: scenario.Path
+            root_key="",  # type: str
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.input_path = input_path  # type: scenario.Path
+        self.root_key = root_key  # type: str
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Load '{self.input_path}' snapshot")
+
+        _root_key_spec = f" from key {self.root_key!r}" if self.root_key else " at the root level"  # type:str
+        if self.ACTION(f"Load the '{self.input_path}' configuration snapshot{_root_key_spec}."):
+            scenario.conf.loadsnapshot(self.input_path, root=self.root_key)
+
+
+class CheckConfigDataReadOnly(scenario.test.Step):
+
+    def __init__(
+            self,
+            key,  # type: str
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.key = key  # type: str
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Check {self.key!r} data is read-only")
+
+        _data = None  # type: typing.Any
+        if self.ACTION(f"Retrieve configuration data for key {self.key!r}."):
+            _data = scenario.conf.get(self.key)
+            self.evidence(f"Data: {scenario.debug.saferepr(_data)}")
+
+        _type_error = None  # type: typing.Optional[TypeError]
+        if self.ACTION("Try to modify the data retrieved."):
+            try:
+                if isinstance(_data, dict):
+                    _data["new"] = 0
+                else:
+                    _data.append(0)
+            except TypeError as _err:
+                _type_error = _err
+                self.evidence(f"Error: {_err}")
+        if self.RESULT("A `TypeError` exception is raised."):
+            self.assertisnotnone(
+                _type_error,
+                evidence="Type error",
+            )
+        if self.RESULT("A deep copy of the data can be modified."):
+            _copy = copy.deepcopy(_data)  # type: typing.Any
+            if isinstance(_copy, dict):
+                _copy["new"] = 0
+            else:
+                _copy.append(0)
+            self.assertlen(
+                _copy, len(_data) + 1,
+                evidence="Modified copy",
+            )
+
+
+class CheckConfigNodeLazy(scenario.test.Step):
+
+    def __init__(
+            self,
+            key,  # type: str
+            lazy,  # type: bool
+    ):  # type: (...) -> None
+        scenario.test.Step.__init__(self)
+
+        self.key = key  # type: str
+        self.lazy = lazy  # type: bool
+
+    def step(self):  # type: (...) -> None
+        self.STEP(f"Check whether {self.key!r} is loaded")
+
+        _node_repr = ""  # type: str
+        if self.ACTION(f"Retrieve the {self.key!r} configuration node."):
+            _node_repr = repr(scenario.conf.getnode(self.key))
+            self.evidence(f"Node: {_node_repr}")
+        if self.RESULT(f"The node data is {'not loaded yet' if self.lazy else 'loaded'}."):
+            if self.lazy:
+                self.assertin(
+                    "LazyJsonData", _node_repr,
+                    evidence="Lazy data",
+                )
+            else:
+                self.assertnotin(
+                    "LazyJsonData", _node_repr,
+                    evidence="Lazy data",
+                )
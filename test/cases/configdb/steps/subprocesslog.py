@@ -43,3 +43,28 @@ class CheckConfigValueScenarioLog(LogVerificationStep):
                 f"{self.key} ({self.origin}): {self.value}",
                 evidence=True,
             )
+
+
+class CheckConfigShowScenarioLog(LogVerificationStep):
+
+    def __init__(
+            self,
+            exec_step,  # type: scenario.test.AnyExecutionStepType
+            key,  # type: str
+            origin,  # type: str
+            value,  # type: str
+    ):  # type: (...) -> None
+        LogVerificationStep.__init__(self, exec_step)
+
+        self.key = key  # type: str
+        self.origin = origin  # type: str
+        self.value = value  # type: str
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Configuration database display verification")
+
+        if self.RESULT(f"{self.value!r} is displayed for the '{self.key}' configuration value with '{self.origin}' for origin."):
+            self.assertline(
+                f"{self.key}: {self.value}  # from {self.origin}",
+                evidence=True,
+            )
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 import typing
 
 import scenario
@@ -93,45 +94,35 @@ class CheckTimes(LogVerificationStep):
         # Info collection for the characterization of the known-issue tracked above.
 
         _match = self.assertregex(b'', b'')  # type: typing.Match[bytes]
-        _run_times = []  # type: typing.List[float]
-        _log_file_times = []  # type: typing.List[float]
-        _json_file_times = []  # type: typing.List[float]
-        _untracked_times = []  # type: typing.List[float]
+        _exec_times = {}  # type: typing.Dict[str, float]
+        _run_time = 0.0  # type: float
+        _log_file_time = 0.0  # type: float
+        _json_file_time = 0.0  # type: float
+        _untracked_time = 0.0  # type: float
         if self.ACTION("Evaluate the time taken to execute test case sub-processes, then to read the log and JSON report files."):
 
             _debug_lines = self.assertlines(b'[scenario.#65.exec-times]')  # type: typing.List[bytes]
             for _debug_line in _debug_lines:  # type: bytes
-                _match = self.assertregex(
-                    rb'(%s) \(\+(%s)\)$' % (self.tobytes(scenario.datetime.DURATION_REGEX), self.tobytes(scenario.datetime.DURATION_REGEX)),
+                _match_or_none = re.search(
+                    rb'\] +(.*?) +[0-9]+ +(%s) +%s +%s$' % (
+                        self.tobytes(scenario.datetime.DURATION_REGEX),
+                        self.tobytes(scenario.datetime.DURATION_REGEX),
+                        self.tobytes(scenario.datetime.DURATION_REGEX),
+                    ),
                     _debug_line,
-                )
-                _tick_time = scenario.datetime.str2fduration(self.tostr(_match.group(2)))  # type: float
-
-                if b'After sub-process execution' in _debug_line:
-                    _run_times.append(_tick_time)
-                elif b'After reading the log file' in _debug_line:
-                    _log_file_times.append(_tick_time)
-                elif b'After reading the JSON file' in _debug_line:
-                    _json_file_times.append(_tick_time)
-                else:
-                    _untracked_times.append(_tick_time)
-
-            self.evidence(
-                f"Sub-process execution times: {_run_times!r} "
-                f"=> {sum(_run_times)} ({ratio(sum(_run_times), _t1)})"
-            )
-            self.evidence(
-                f"Log file times: {_log_file_times!r} "
-                f"=> {sum(_log_file_times)} ({ratio(sum(_log_file_times), _t1)})"
-            )
-            self.evidence(
-                f"JSON file times: {_json_file_times!r} "
-                f"=> {sum(_json_file_times)} ({ratio(sum(_json_file_times), _t1)})"
-            )
-            self.evidence(
-                f"Untracked times (while executing test cases): {_untracked_times!r} "
-                f"=> {sum(_untracked_times)} ({ratio(sum(_untracked_times), _t1)})"
-            )
+                )  # type: typing.Optional[typing.Match[bytes]]
+                if _match_or_none:
+                    _exec_times[self.tostr(_match_or_none.group(1))] = scenario.datetime.str2fduration(self.tostr(_match_or_none.group(2)))
+
+            _run_time = _exec_times.get("CampaignRunner._exectestcase(): sub-process execution", 0.0)
+            _log_file_time = _exec_times.get("CampaignRunner._exectestcase(): log file reading", 0.0)
+            _json_file_time = _exec_times.get("CampaignRunner._exectestcase(): JSON report reading", 0.0)
+            _untracked_time = _exec_times.get("CampaignRunner._exectestcase()", 0.0) - _run_time - _log_file_time - _json_file_time
+
+            self.evidence(f"Sub-process execution times: {_run_time} ({ratio(_run_time, _t1)})")
+            self.evidence(f"Log file times: {_log_file_time} ({ratio(_log_file_time, _t1)})")
+            self.evidence(f"JSON file times: {_json_file_time} ({ratio(_json_file_time, _t1)})")
+            self.evidence(f"Untracked times (while executing test cases): {_untracked_time} ({ratio(_untracked_time, _t1)})")
 
         _before_test_cases_time = 0.0  # type: float
         _after_test_cases_time = 0.0  # type: float
@@ -142,13 +133,13 @@ class CheckTimes(LogVerificationStep):
             _before_test_cases_time = _before_test_cases_tf - self.assertisnotnone(self.subprocess.time.start)
             self.evidence(f"Before test cases: {_before_test_cases_time} ({ratio(_before_test_cases_time, _t1)})")
 
-            _after_test_cases_line = self.assertlines(b'[scenario.#65.exec-times]')[-1]  # type: bytes
+            _after_test_cases_line = self.assertline(b'[scenario.#65.exec-times] Execution times:')  # type: bytes
             _match = self.assertregex(rb'^(%s) - ' % self.tobytes(scenario.datetime.ISO8601_REGEX), _after_test_cases_line)
             _after_test_cases_t0 = scenario.datetime.fromiso8601(self.tostr(_match.group(1)))  # type: float
             _after_test_cases_time = self.assertisnotnone(self.subprocess.time.end) - _after_test_cases_t0
             self.evidence(f"After test cases: {_after_test_cases_time} ({ratio(_after_test_cases_time, _t1)})")
 
         if self.ACTION("Evaluate the total time lost."):
-            self.evidence(f"sub-process execution times vs t1: {_t1 - sum(_run_times)} ({ratio(_t1 - sum(_run_times), _t1)})")
-            self.evidence(f"t2 vs sub-process execution times: {sum(_run_times) - _t2} ({ratio(sum(_run_times) - _t2, sum(_run_times))})")
+            self.evidence(f"sub-process execution times vs t1: {_t1 - _run_time} ({ratio(_t1 - _run_time, _t1)})")
+            self.evidence(f"t2 vs sub-process execution times: {_run_time - _t2} ({ratio(_run_time - _t2, _run_time)})")
             self.evidence(f"t2 vs t1 (total): {_t1 - _t2} ({ratio(_t1 - _t2, _t1)})")
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import scenario.test
+
+# Steps:
+from steps.common import ExecScenario
+from .steps.interrupted import CheckInterruptedJsonReport
+
+
+class JsonReport070(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="JSON report of an interrupted scenario",
+            objective="Check the JSON report is written step by step, and remains readable when the scenario execution is interrupted abruptly.",
+            features=[scenario.test.features.SCENARIO_REPORT],
+        )
+
+        self.addstep(ExecScenario(scenario.test.paths.INTERRUPTED_SCENARIO, generate_report=True, expected_return_code=scenario.ErrorCode.INTERNAL_ERROR))
+        self.addstep(CheckInterruptedJsonReport(ExecScenario.getinstance()))
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import scenario.test
+
+# Related steps:
+from .reportfile import JsonReportFileVerificationStep
+
+
+class CheckCompactJsonReport(JsonReportFileVerificationStep):
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Compact JSON report")
+
+        _json_doc = b""  # type: bytes
+        if self.ACTION("Read the JSON report file as raw bytes."):
+            _json_doc = self.report_path.read_bytes()
+
+        if self.RESULT("The JSON report has no line separators, nor indentation."):
+            self.assertnotin(
+                b"\n", _json_doc,
+                evidence="Line separators",
+            )
+            self.assertnotin(
+                b'": ', _json_doc,
+                evidence="Key separators",
+            )
+        if self.RESULT("The JSON report is a valid JSON document."):
+            self.assertisinstance(
+                json.loads(_json_doc), dict,
+                evidence="JSON data",
+            )
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import typing
+
+import scenario
+if typing.TYPE_CHECKING:
+    from scenario.typing import JSONDict
+import scenario.test
+
+# Related steps:
+from .reportfile import JsonReportFileVerificationStep
+
+
+class CheckInterruptedJsonReport(JsonReportFileVerificationStep):
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Interrupted JSON report")
+
+        _json = {}  # type: JSONDict
+        if self.ACTION("Read the JSON report file as raw JSON data."):
+            _json = json.loads(self.report_path.read_bytes())
+
+        if self.RESULT("The JSON report gives the scenario name and attributes."):
+            self.assertequal(
+                _json["attributes"].get("TITLE"), "Interrupted scenario",
+                evidence="Scenario title",
+            )
+        if self.RESULT("The JSON report gives the first step only, which has finished before the interruption."):
+            self.assertlen(
+                _json["steps"], 1,
+                evidence="Number of steps",
+            )
+            self.assertequal(
+                _json["steps"][0]["description"], "Step before the interruption",
+                evidence="Step description",
+            )
+            self.assertlen(
+                _json["steps"][0]["executions"], 1,
+                evidence="Number of step executions",
+            )
+        if self.RESULT("The JSON report gives no final status."):
+            self.assertnotin(
+                "status", _json,
+                evidence="Status",
+            )
+
+        _scenario_definition = None  # type: typing.Optional[scenario.Scenario]
+        if self.ACTION("Read the JSON report file with `scenario.report.readjsonreport()`."):
+            _scenario_definition = scenario.report.readjsonreport(self.report_path)
+
+        if self.RESULT("The JSON report could be read."):
+            self.assertisnotnone(
+                _scenario_definition,
+                evidence="Scenario data",
+            )
+        if self.RESULT("The scenario execution is described as failed, due to the incomplete report."):
+            assert _scenario_definition and _scenario_definition.execution
+            self.assertequal(
+                _scenario_definition.execution.status, scenario.ExecutionStatus.FAIL,
+                evidence="Status",
+            )
+            self.assertlen(
+                _scenario_definition.execution.errors, 1,
+                evidence="Number of errors",
+            )
+            self.assertstartswith(
+                _scenario_definition.execution.errors[0].message, "Incomplete JSON report",
+                evidence="Error message",
+            )
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import typing
+
+import scenario
+if typing.TYPE_CHECKING:
+    from scenario.typing import JSONDict
+import scenario.test
+
+# Related steps:
+from .reportfile import JsonReportFileVerificationStep
+
+
+class CheckJsonReportMetrics(JsonReportFileVerificationStep):
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Execution metrics")
+
+        _json = {}  # type: JSONDict
+        if self.ACTION("Read the JSON report file."):
+            _json = json.loads(self.report_path.read_bytes())
+
+        if self.RESULT("Each step execution gives its execution metrics."):
+            for _json_step in _json["steps"]:  # type: JSONDict
+                for _json_step_execution in _json_step.get("executions", []):  # type: JSONDict
+                    self._checkmetrics(_json_step_execution, f"{_json_step['location']} #{_json_step_execution['number']}")
+
+        if self.RESULT("Each action / expected result execution gives its execution metrics."):
+            for _json_step in _json["steps"]:  # Type already declared above.
+                for _json_action_result in _json_step.get("actions-results", []):  # type: JSONDict
+                    for _json_action_result_execution in _json_action_result["executions"]:  # type: JSONDict
+                        self._checkmetrics(_json_action_result_execution, f"{_json_action_result['type']} {_json_action_result['description']!r}")
+
+    def _checkmetrics(
+            self,
+            json_execution,  # type: JSONDict
+            desc,  # type: str
+    ):  # type: (...) -> None
+        self.assertin("metrics", json_execution, evidence=f"{desc} metrics")
+        for _field in ("wall", "cpu"):  # type: str
+            self.assertisinstance(json_execution["metrics"][_field], float, evidence=f"{desc} {_field}")
+            self.assertgreaterequal(json_execution["metrics"][_field], 0.0, evidence=f"{desc} {_field}")
+        for _field in ("memory-peak", "memory-net", "gc-collections"):  # Type already declared above.
+            self.assertisinstance(json_execution["metrics"][_field], int, evidence=f"{desc} {_field}")
+        self.assertgreaterequal(json_execution["metrics"]["memory-peak"], 0, evidence=f"{desc} memory-peak")
+        self.assertgreaterequal(json_execution["metrics"]["gc-collections"], 0, evidence=f"{desc} gc-collections")
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+import scenario
+import scenario.test
+
+# Steps:
+from steps.common import ExecScenario
+from steps.common import LogVerificationStep
+
+
+class Logging220(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Long text logging",
+            objective=(
+                "Check that long texts are formatted as with the '%' operator, "
+                "displayed on several lines, and limited to the maximum number of lines given."
+            ),
+            features=[scenario.test.features.LOGGING],
+        )
+
+        self.addstep(ExecScenario(
+            scenario.test.paths.LOGGER_SCENARIO,
+            # Explicitely disable log date/time and colors for verification purposes in `CheckLongTextLogging`.
+            config_values={scenario.ConfigKey.LOG_DATETIME: False, scenario.ConfigKey.LOG_COLOR_ENABLED: False},
+        ))
+        self.addstep(CheckLongTextLogging(ExecScenario.getinstance()))
+
+
+class CheckLongTextLogging(LogVerificationStep):
+
+    def step(self):  # type: (...) -> None
+        self.STEP("Long text logging")
+
+        if self.RESULT("'%%' and '%(name)s' format specifiers are formatted with the mapping given, on two lines."):
+            self.assertregex(r"^ *INFO +Long text mapping 100% line$", self.assertline("Long text mapping 100"), evidence=True)
+            self.assertregex(r"^ *INFO +Long text mapping \[ mapping\] line$", self.assertline("Long text mapping ["), evidence=True)
+
+        if self.RESULT("Positional and width format specifiers are formatted with the arguments given, on two lines."):
+            self.assertregex(r"^ *INFO +Long text positional \[  abc\|42    \|%\|3\.14\] line$", self.assertline("Long text positional [ "), evidence=True)
+            self.assertregex(r"^ *INFO +Long text positional \[end\] line$", self.assertline("Long text positional [end"), evidence=True)
+
+        if self.RESULT("Without arguments, '%%' format specifiers are formatted as well, on two lines."):
+            self.assertregex(r"^ *INFO +Long text without arguments 100% line$", self.assertline("Long text without arguments 100"), evidence=True)
+            self.assertregex(r"^ *INFO +Long text without arguments \[end\] line$", self.assertline("Long text without arguments ["), evidence=True)
+
+        _lines = []  # type: typing.List[str]
+        if self.RESULT("The JSON dump is displayed on 3 lines, followed by a '...' line."):
+            _lines = self.toanystr(self.subprocess.stdout, str).splitlines()
+            _first_line_index = _lines.index(self.assertline("Long text JSON dump: {"))  # type: int
+            self.assertregex(r"^ *INFO +  \"long-text-item-1\": 1,$", _lines[_first_line_index + 1], evidence=True)
+            self.assertregex(r"^ *INFO +  \"long-text-item-2\": 2,$", _lines[_first_line_index + 2], evidence=True)
+            self.assertregex(r"^ *INFO +\.\.\.$", _lines[_first_line_index + 3], evidence=True)
+
+        if self.RESULT("The JSON dump lines after the 3 first lines are not displayed."):
+            for _index in range(3, 6):  # type: int
+                self.assertnoline(f"long-text-item-{_index}", evidence=True)
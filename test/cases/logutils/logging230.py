@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import typing
+
+import scenario
+import scenario.test
+from scenario.logfilehandler import LogFileHandler
+
+
+class Logging230(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Size-capped log file",
+            objective=(
+                "Check that once the beginning of a size-capped log file is full, "
+                "the next log lines are retained for the end of the log, even when shorter lines could still fit in the beginning."
+            ),
+            features=[scenario.test.features.LOGGING],
+        )
+
+        self.log_path = self.mktmppath(suffix=".log")  # type: scenario.Path
+
+    def step001(self):  # type: (...) -> None
+        self.STEP("Log file writing")
+
+        if self.ACTION(f"Create a log file handler on {self.getpathdesc(self.log_path)}, with a maximum size of 20 bytes, and a tail size of 8 bytes."):
+            _handler = LogFileHandler(self.log_path, max_size=20, tail_size=8)  # type: LogFileHandler
+            _handler.setFormatter(logging.Formatter("%(message)s"))
+        for _msg in ["aaaa", "bbbb", "cccccc", "d", "e", "f", "g"]:  # type: str
+            if self.ACTION(f"Log {_msg!r}."):
+                _handler.emit(logging.makeLogRecord({"msg": _msg}))
+        if self.ACTION("Close the log file handler."):
+            _handler.close()
+
+    def step002(self):  # type: (...) -> None
+        self.STEP("Log file content")
+
+        _lines = []  # type: typing.List[str]
+        if self.ACTION(f"Read {self.getpathdesc(self.log_path)}."):
+            _lines = self.log_path.read_text(encoding="utf-8").splitlines()
+            self.evidence(f"Lines: {_lines!r}")
+
+        if self.RESULT("The log file starts with 'aaaa' and 'bbbb', that fit in the beginning of the log."):
+            self.assertequal(
+                _lines[:2], ["aaaa", "bbbb"],
+                evidence="Beginning of the log",
+            )
+        if self.RESULT("Then, a line tells that 'cccccc' has been skipped."):
+            self.assertequal(
+                _lines[2], "[... 1 line(s), 7 byte(s) skipped ...]",
+                evidence="Skip marker",
+            )
+        if self.RESULT("Eventually, the log file ends with 'd', 'e', 'f' and 'g', in that order."):
+            self.assertequal(
+                _lines[3:], ["d", "e", "f", "g"],
+                evidence="End of the log",
+            )
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import typing
+
+import scenario.test
+
+
+class SubProcess001(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Sub-process output capture",
+            objective="Check that `scenario.SubProcess` dispatches output lines by batches, "
+                      "that outputs beyond the output limit are truncated in memory, but spilled to a file in full, "
+                      "and that lines beyond the output limit are dispatched as partial lines.",
+            features=[],  # No specific feature.
+        )
+
+        self.subprocess = scenario.SubProcess(
+            sys.executable, "-c", "import sys; sys.stdout.write(''.join(f'line {_i}\\n' for _i in range(10000))); sys.stderr.write('error')",
+        )  # type: scenario.SubProcess
+        self.lines = []  # type: typing.List[bytes]
+        self.long_line_subprocess = scenario.SubProcess(
+            sys.executable, "-c", "import sys; sys.stdout.write('x' * 200000)",
+        )  # type: scenario.SubProcess
+        self.long_line_parts = []  # type: typing.List[bytes]
+
+    def step001(self):  # type: (...) -> None
+        self.STEP("Execution")
+
+        if self.ACTION(f"Execute {self.subprocess}, with an output limit of 1000 bytes, and a batch handler on stdout lines."):
+            self.subprocess.setoutputlimit(1000).onstdoutlines(self.lines.extend).run()
+            self.evidence(f"Return code: {self.subprocess.returncode!r}")
+            self.evidence(f"Stdout size: {self.subprocess.stdout_buffer.size} bytes")
+
+        if self.RESULT("The sub-process succeeded."):
+            self.assertequal(
+                self.subprocess.returncode, 0,
+                evidence="Return code",
+            )
+        if self.RESULT("The batch handler received the 10000 lines, without end-of-line characters."):
+            self.assertlen(
+                self.lines, 10000,
+                evidence="Number of lines",
+            )
+            self.assertequal(
+                self.lines[-1], b'line 9999',
+                evidence="Last line",
+            )
+
+    def step002(self):  # type: (...) -> None
+        self.STEP("Output limit")
+
+        if self.RESULT("The stdout output kept in memory is truncated, with its head and tail only."):
+            self.asserttrue(
+                self.subprocess.stdout_buffer.truncated,
+                evidence="Truncated",
+            )
+            self.assertless(
+                len(self.subprocess.stdout), 1100,
+                evidence="Stdout length",
+            )
+            self.asserttrue(
+                self.subprocess.stdout.startswith(b'line 0\n'),
+                evidence="Stdout head",
+            )
+            self.asserttrue(
+                self.subprocess.stdout.endswith(b'line 9999\n'),
+                evidence="Stdout tail",
+            )
+        if self.RESULT("The full stdout stream has been spilled to a file."):
+            assert self.subprocess.stdout_buffer.path
+            with open(self.subprocess.stdout_buffer.path, "rb") as _file:  # type: typing.BinaryIO
+                self.assertlen(
+                    _file.read().splitlines(), 10000,
+                    evidence="Number of lines in the spill file",
+                )
+        if self.RESULT("The stderr output is kept in memory as is."):
+            self.assertequal(
+                self.subprocess.stderr, b'error',
+                evidence="Stderr",
+            )
+
+        if self.doexecute() and self.subprocess.stdout_buffer.path:
+            os.remove(self.subprocess.stdout_buffer.path)
+
+    def step003(self):  # type: (...) -> None
+        self.STEP("Long line")
+
+        if self.ACTION(f"Execute {self.long_line_subprocess}, with an output limit of 1000 bytes, and a batch handler on stdout lines."):
+            self.long_line_subprocess.setoutputlimit(1000).onstdoutlines(self.long_line_parts.extend).run()
+            self.evidence(f"Return code: {self.long_line_subprocess.returncode!r}")
+            self.evidence(f"Line parts: {[len(_part) for _part in self.long_line_parts]}")
+
+        if self.RESULT("The 200000-byte line without end-of-line character has been dispatched as several partial lines."):
+            self.assertgreater(
+                len(self.long_line_parts), 1,
+                evidence="Number of partial lines",
+            )
+            self.assertequal(
+                b''.join(self.long_line_parts), b'x' * 200000,
+                evidence="Partial lines joined",
+            )
+
+        if self.doexecute() and self.long_line_subprocess.stdout_buffer.path:
+            os.remove(self.long_line_subprocess.stdout_buffer.path)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import typing
+
+import scenario.test
+
+
+class SubProcess002(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Concurrent sub-processes",
+            objective="Check that the outputs of concurrent `scenario.SubProcess` instances are captured separately and in full.",
+            features=[],  # No specific feature.
+        )
+
+        self.subprocesses = []  # type: typing.List[scenario.SubProcess]
+        for _index in range(20):  # type: int
+            self.subprocesses.append(scenario.SubProcess(
+                sys.executable, "-c", f"import sys; [print(f'{_index}-{{_i}}') for _i in range(1000)]; sys.stderr.write('error {_index}')",
+            ))
+
+    def step001(self):  # type: (...) -> None
+        self.STEP("Execution")
+
+        if self.ACTION(f"Launch {len(self.subprocesses)} sub-processes asynchronously, then wait for them to terminate."):
+            for _subprocess in self.subprocesses:  # type: scenario.SubProcess
+                _subprocess.runasync()
+            for _subprocess in self.subprocesses:  # Type already declared above.
+                _subprocess.wait()
+
+        for _index, _subprocess in enumerate(self.subprocesses):  # type: int, scenario.SubProcess
+            if self.RESULT(f"Sub-process #{_index + 1} succeeded, with its own 1000 stdout lines and stderr message."):
+                self.assertequal(
+                    _subprocess.returncode, 0,
+                    evidence="Return code",
+                )
+                self.assertequal(
+                    _subprocess.stdout.splitlines(), [f"{_index}-{_i}".encode() for _i in range(1000)],
+                    evidence="Stdout lines",
+                )
+                self.assertequal(
+                    _subprocess.stderr, f"error {_index}".encode(),
+                    evidence="Stderr",
+                )
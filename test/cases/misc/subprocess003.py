@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import sys
+import typing
+
+import scenario.test
+
+
+class SubProcess003(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="asyncio sub-processes",
+            objective="Check that `scenario.SubProcess.arun()` drives concurrent sub-processes from an asyncio event loop, "
+                      "with the same outputs, return codes and time statistics as `scenario.SubProcess.run()`.",
+            features=[],  # No specific feature.
+        )
+
+        self.subprocesses = []  # type: typing.List[scenario.SubProcess]
+        for _index in range(10):  # type: int
+            self.subprocesses.append(scenario.SubProcess(
+                sys.executable, "-c", f"import os, sys; print(os.environ['INDEX']); sys.exit({_index})",
+            ).setenv(INDEX=str(_index)))
+        self.lines = []  # type: typing.List[bytes]
+        self.subprocesses[0].onstdoutline(self.lines.append)
+
+        self.timeout_subprocess = scenario.SubProcess(
+            sys.executable, "-c", "import sys, time; sys.stdout.write('partial'); sys.stdout.flush(); time.sleep(60.0)",
+        )  # type: scenario.SubProcess
+        self.timeout_lines = []  # type: typing.List[bytes]
+        self.timeout_subprocess.onstdoutline(self.timeout_lines.append)
+
+    def step001(self):  # type: (...) -> None
+        self.STEP("Execution")
+
+        if self.ACTION(f"Run {len(self.subprocesses)} sub-processes concurrently with `arun()`, from an asyncio event loop."):
+            async def _runall():  # type: (...) -> None
+                await asyncio.gather(*[_subprocess.arun(timeout=60.0) for _subprocess in self.subprocesses])
+            # Note: `asyncio.run()` available from Python 3.7 only.
+            _loop = asyncio.new_event_loop()  # type: asyncio.AbstractEventLoop
+            try:
+                _loop.run_until_complete(_runall())
+            finally:
+                _loop.close()
+
+        for _index, _subprocess in enumerate(self.subprocesses):  # type: int, scenario.SubProcess
+            if self.RESULT(f"Sub-process #{_index + 1} terminated with return code {_index}, and printed {_index!r}."):
+                self.assertequal(
+                    _subprocess.returncode, _index,
+                    evidence="Return code",
+                )
+                self.assertequal(
+                    _subprocess.stdout.strip(), str(_index).encode(),
+                    evidence="Stdout",
+                )
+                self.assertisnotnone(
+                    _subprocess.time.elapsed,
+                    evidence="Elapsed time",
+                )
+        if self.RESULT("The stdout line handler of the first sub-process has been called."):
+            self.assertequal(
+                self.lines, [b'0'],
+                evidence="Lines",
+            )
+
+    def step002(self):  # type: (...) -> None
+        self.STEP("Timeout")
+
+        if self.ACTION("Run a sub-process that prints a line without end-of-line character, then sleeps for 60 seconds, "
+                       "with `arun()` and a timeout of 2 seconds."):
+            _loop = asyncio.new_event_loop()  # type: asyncio.AbstractEventLoop
+            try:
+                _loop.run_until_complete(self.timeout_subprocess.arun(timeout=2.0))
+            finally:
+                _loop.close()
+
+        if self.RESULT("The sub-process has no return code."):
+            self.assertisnone(
+                self.timeout_subprocess.returncode,
+                evidence="Return code",
+            )
+        if self.RESULT("The pending line has been delivered to the stdout line handler."):
+            self.assertequal(
+                self.timeout_lines, [b'partial'],
+                evidence="Lines",
+            )
+        if self.RESULT("The sub-process elapsed time is available."):
+            self.assertisnotnone(
+                self.timeout_subprocess.time.elapsed,
+                evidence="Elapsed time",
+            )
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+import scenario.test
+
+
+class SubProcess004(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Sub-process batches",
+            objective="Check that `scenario.SubProcessBatch` executes sub-processes with a concurrency limit, "
+                      "gives their results in submission order, and stops launching sub-processes on failures in fail-fast mode.",
+            features=[],  # No specific feature.
+        )
+
+    def step001(self):  # type: (...) -> None
+        self.STEP("Concurrency limit")
+
+        _batch = scenario.SubProcessBatch(max_concurrency=3)  # type: scenario.SubProcessBatch
+        for _index in range(8):  # type: int
+            _batch.submit(scenario.SubProcess(sys.executable, "-c", f"import sys; print({_index}); sys.exit({_index % 2})"))
+        if self.ACTION(f"Execute a {_batch}, 3 at most at the same time."):
+            _batch.setlogger(self).run()
+            self.evidence(_batch.summary())
+
+        if self.RESULT("The return codes are given in submission order."):
+            self.assertequal(
+                _batch.returncodes, [0, 1, 0, 1, 0, 1, 0, 1],
+                evidence="Return codes",
+            )
+        if self.RESULT("The outputs are given in submission order."):
+            self.assertequal(
+                [_subprocess.stdout.strip() for _subprocess in _batch.subprocesses], [str(_index).encode() for _index in range(8)],
+                evidence="Outputs",
+            )
+        if self.RESULT("4 sub-processes succeeded, 4 failed, none was skipped."):
+            self.assertlen(
+                _batch.succeeded, 4,
+                evidence="Succeeded",
+            )
+            self.assertlen(
+                _batch.failed, 4,
+                evidence="Failed",
+            )
+            self.assertlen(
+                _batch.skipped, 0,
+                evidence="Skipped",
+            )
+
+    def step002(self):  # type: (...) -> None
+        self.STEP("Fail-fast mode")
+
+        _batch = scenario.SubProcessBatch(max_concurrency=1, fail_fast=True)  # type: scenario.SubProcessBatch
+        for _index in range(5):  # type: int
+            _batch.submit(scenario.SubProcess(sys.executable, "-c", f"import sys; sys.exit({int(_index == 1)})"))
+        if self.ACTION(f"Execute a {_batch} in fail-fast mode, one at a time, the second one failing."):
+            _batch.setlogger(self).run()
+            self.evidence(_batch.summary())
+
+        if self.RESULT("The sub-processes following the failed one have been skipped."):
+            self.assertequal(
+                _batch.returncodes, [0, 1, None, None, None],
+                evidence="Return codes",
+            )
+            self.assertlen(
+                _batch.skipped, 3,
+                evidence="Skipped",
+            )
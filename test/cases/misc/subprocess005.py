@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import time
+import typing
+
+import scenario.test
+
+
+class SubProcess005(scenario.test.TestCase):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.test.TestCase.__init__(
+            self,
+            title="Sub-process line handlers",
+            objective="Check that `scenario.SubProcess` line handlers may kill their own sub-process, "
+                      "and that a slow line handler does not hold the other sub-processes.",
+            features=[],  # No specific feature.
+        )
+
+        self.killed_subprocess = scenario.SubProcess(
+            sys.executable, "-c", "import time; print('ready', flush=True); time.sleep(30)",
+        ).exitonerror(False)  # type: scenario.SubProcess
+        self.slow_subprocess = scenario.SubProcess(
+            sys.executable, "-c", "print('line 1', flush=True); print('line 2', flush=True)",
+        )  # type: scenario.SubProcess
+        self.fast_subprocess = scenario.SubProcess(
+            sys.executable, "-c", "print('fast')",
+        )  # type: scenario.SubProcess
+
+    def step001(self):  # type: (...) -> None
+        self.STEP("Sub-process killed from a line handler")
+
+        _elapsed = 0.0  # type: float
+        if self.ACTION(f"Execute {self.killed_subprocess} with a 10-second timeout, and a stdout line handler that kills it."):
+            def _kill(line):  # type: (bytes) -> None
+                self.killed_subprocess.kill()
+            self.killed_subprocess.onstdoutline(_kill)
+            _t0 = time.monotonic()  # type: float
+            self.killed_subprocess.run(timeout=10.0)
+            _elapsed = time.monotonic() - _t0
+            self.evidence(f"Return code: {self.killed_subprocess.returncode!r}")
+            self.evidence(f"Elapsed: {_elapsed:.3f} seconds")
+
+        if self.RESULT("The sub-process terminated before the timeout, with a failure return code."):
+            self.assertless(
+                _elapsed, 10.0,
+                evidence="Elapsed time",
+            )
+            self.assertnotequal(
+                self.killed_subprocess.returncode, 0,
+                evidence="Return code",
+            )
+
+    def step002(self):  # type: (...) -> None
+        self.STEP("Slow line handler")
+
+        _lines = []  # type: typing.List[bytes]
+        _fast_lines = []  # type: typing.List[bytes]
+        _elapsed = 0.0  # type: float
+        if self.ACTION(f"Launch {self.slow_subprocess} asynchronously, with a stdout line handler that takes 1 second for each line."):
+            def _slowappend(line):  # type: (bytes) -> None
+                time.sleep(1.0)
+                _lines.append(line)
+            self.slow_subprocess.onstdoutline(_slowappend)
+            self.slow_subprocess.runasync()
+        if self.ACTION(f"Meanwhile, execute {self.fast_subprocess}, with a stdout line handler as well."):
+            self.fast_subprocess.onstdoutline(_fast_lines.append)
+            _t0 = time.monotonic()  # type: float
+            self.fast_subprocess.run()
+            _elapsed = time.monotonic() - _t0
+            self.evidence(f"Elapsed: {_elapsed:.3f} seconds")
+        if self.ACTION(f"Wait for {self.slow_subprocess} to terminate."):
+            self.slow_subprocess.wait()
+
+        if self.RESULT(f"{self.fast_subprocess} terminated without waiting for the slow line handler."):
+            self.assertless(
+                _elapsed, 1.0,
+                evidence="Elapsed time",
+            )
+            self.assertequal(
+                self.fast_subprocess.stdout.splitlines(), [b'fast'],
+                evidence="Stdout lines",
+            )
+            self.assertequal(
+                _fast_lines, [b'fast'],
+                evidence="Fast line handler",
+            )
+        if self.RESULT("The slow line handler received all the lines."):
+            self.assertequal(
+                _lines, [b'line 1', b'line 2'],
+                evidence="Lines",
+            )
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import scenario
+
+
+class InterruptedScenario(scenario.Scenario):
+
+    def __init__(self):  # type: (...) -> None
+        scenario.Scenario.__init__(self)
+
+        self.setattribute("TITLE", "Interrupted scenario")
+
+    def step010(self):  # type: (...) -> None
+        self.STEP("Step before the interruption")
+
+        if self.ACTION("Do nothing special."):
+            self.evidence("Nothing special")
+
+    def step020(self):  # type: (...) -> None
+        self.STEP("Interruption")
+
+        if self.ACTION("Terminate the process abruptly."):
+            os._exit(int(scenario.ErrorCode.INTERNAL_ERROR))
+
+    def step030(self):  # type: (...) -> None
+        self.STEP("Step after the interruption")
+
+        if self.ACTION("Do nothing special."):
+            self.evidence("Nothing special")
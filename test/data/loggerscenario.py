@@ -52,3 +52,30 @@ class LoggerScenario(scenario.Scenario):
             self.sample_logger.info(f"'{LoggerScenario.LOGGER_DEBUG_CLASS}' logger info line")
         if self.ACTION(f"Generate a debug line with the '{LoggerScenario.LOGGER_DEBUG_CLASS}' logger."):
             self.sample_logger.debug(f"'{LoggerScenario.LOGGER_DEBUG_CLASS}' logger debug line")
+
+    def step130(self):  # type: (...) -> None
+        self.STEP("Long text logging")
+
+        if self.ACTION("Generate a long text with '%%' and '%(name)s' format specifiers with the main logger."):
+            scenario.logging.info(
+                "Long text mapping %(percent)d%% line\nLong text mapping [%(name)8s] line",
+                {"percent": 100, "name": "mapping"},
+                extra=scenario.logging.longtext(max_lines=None),
+            )
+        if self.ACTION("Generate a long text with positional and width format specifiers with the main logger."):
+            scenario.logging.info(
+                "Long text positional [%5s|%-6d|%%|%.2f] line\nLong text positional [%s] line",
+                "abc", 42, 3.14159, "end",
+                extra=scenario.logging.longtext(max_lines=None),
+            )
+        if self.ACTION("Generate a long text with a '%%' format specifier, but without arguments, with the main logger."):
+            scenario.logging.info(
+                "Long text without arguments 100%% line\nLong text without arguments [end] line",
+                extra=scenario.logging.longtext(max_lines=None),
+            )
+        if self.ACTION("Generate a long text with a JSON dump over several lines, limited to 3 lines, with the main logger."):
+            scenario.logging.info(
+                "Long text JSON dump: %s",
+                scenario.debug.jsondump({f"long-text-item-{_index}": _index for _index in range(1, 6)}, indent=2),
+                extra=scenario.logging.longtext(max_lines=3),
+            )
@@ -381,9 +381,9 @@ def scenarioexpectations(
                 _scenario_expectations.addattribute("TITLE", "Logger scenario sample")
             if _reqs.stats():
                 if doc_only:
-                    _scenario_expectations.setstats(steps=2, actions=8, results=0)
+                    _scenario_expectations.setstats(steps=3, actions=12, results=0)
                 else:
-                    _scenario_expectations.setstats(steps=(2, 2), actions=(8, 8), results=(0, 0))
+                    _scenario_expectations.setstats(steps=(3, 3), actions=(12, 12), results=(0, 0))
         _loggerscenario()
 
     elif script_path.samefile(paths.LOGGING_INDENTATION_SCENARIO):
@@ -519,7 +519,7 @@ def testsuiteexpectations(
 
     if test_suite_path.samefile(paths.TEST_DATA_TEST_SUITE):
         for _script_path in paths.DATA_PATH.glob("*.py"):  # type: scenario.Path
-            if _script_path == paths.WAITING_SCENARIO:
+            if _script_path in (paths.WAITING_SCENARIO, paths.INTERRUPTED_SCENARIO):
                 continue
             _test_suite_expectations.test_case_expectations.append(scenarioexpectations(
                 _script_path,
@@ -36,6 +36,7 @@ CONFIG_DB_SCENARIO = DATA_PATH / "configdbscenario.py"  # type: scenario.Path
 FAILING_SCENARIO = DATA_PATH / "failingscenario.py"  # type: scenario.Path
 GOTO_SCENARIO = DATA_PATH / "gotoscenario.py"  # type: scenario.Path
 INHERITING_SCENARIO = DATA_PATH / "inheritingscenario.py"  # type: scenario.Path
+INTERRUPTED_SCENARIO = DATA_PATH / "interruptedscenario.py"  # type: scenario.Path
 KNOWN_ISSUE_DETAILS_SCENARIO = DATA_PATH / "knownissuedetailsscenario.py"  # type: scenario.Path
 KNOWN_ISSUES_SCENARIO = DATA_PATH / "knownissuesscenario.py"  # type: scenario.Path
 LOGGER_SCENARIO = DATA_PATH / "loggerscenario.py"  # type: scenario.Path
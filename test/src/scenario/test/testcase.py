@@ -98,6 +98,8 @@ class TestCase(scenario.Scenario):
         # Local constants.
         _NON_RELEVANT_SUFFIXES = (
             ".pyc",
+            # Configuration cache files.
+            ".pickle",
         )  # type: typing.Tuple[str, ...]
 
         # Inner functions.
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2020-2023 Alexis Royer <https://github.com/alxroyer/scenario>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pathlib
+import sys
+import time
+import typing
+
+# Path management.
+MAIN_PATH = pathlib.Path(__file__).parents[1]  # type: pathlib.Path
+sys.path.append(str(MAIN_PATH / "src"))
+sys.path.append(str(MAIN_PATH / "tools" / "src"))
+
+# `scenario` imports.
+import scenario  # noqa: E402  ## Module level import not at top of file
+import scenario.tools  # noqa: E402  ## Module level import not at top of file
+
+from scenario.jsonutils import JsonSerializer, OrjsonSerializer, StdJsonSerializer  # noqa: E402  ## Module level import not at top of file
+
+
+class BenchJson:
+
+    class Args(scenario.Args):
+        def __init__(self):  # type: (...) -> None
+            scenario.Args.__init__(self, class_debugging=False)
+
+            self.setdescription("JSON serializers benchmark: write / read throughput on JSON reports.")
+
+            self.iterations = 5  # type: int
+            self.addarg("Iterations", "iterations", int).define(
+                "--iterations", metavar="COUNT",
+                action="store", type=int, default=5,
+                help="Number of times each JSON report is written and read. 5 by default.",
+            )
+
+            self.paths = []  # type: typing.List[scenario.Path]
+            self.addarg("JSON report paths", "paths", scenario.Path).define(
+                metavar="PATH", nargs="+",
+                action="store", type=str, default=[],
+                help="JSON report files, or directories to search JSON report files in.",
+            )
+
+    def run(self):  # type: (...) -> None
+        # Command line arguments.
+        scenario.Args.setinstance(BenchJson.Args())
+        if not scenario.Args.getinstance().parse(sys.argv[1:]):
+            sys.exit(int(scenario.Args.getinstance().error_code))
+        _args = BenchJson.Args.getinstance()  # type: BenchJson.Args
+
+        # Load the JSON reports.
+        _docs = []  # type: typing.List[bytes]
+        for _path in _args.paths:  # type: scenario.Path
+            for _json_path in (_path.glob("**/*.json") if _path.is_dir() else [_path]):  # type: scenario.Path
+                _docs.append(_json_path.read_bytes())
+        if not _docs:
+            scenario.logging.error("No JSON report found")
+            sys.exit(int(scenario.ErrorCode.ARGUMENTS_ERROR))
+        _json_data = [StdJsonSerializer().loads(_doc) for _doc in _docs]  # type: typing.List[typing.Any]
+        scenario.logging.info(f"{len(_docs)} JSON report(s), {sum(len(_doc) for _doc in _docs)} bytes, {_args.iterations} iteration(s)")
+
+        # Serializers available.
+        _serializers = [StdJsonSerializer()]  # type: typing.List[JsonSerializer]
+        try:
+            _serializers.append(OrjsonSerializer())
+        except ImportError as _err:
+            scenario.logging.warning(f"{_err}, benchmarking the standard library only")
+
+        # Benchmark.
+        for _serializer in _serializers:  # type: JsonSerializer
+            for _compact in (False, True):  # type: bool
+                _size = 0  # type: int
+                _t0 = time.perf_counter()  # type: float
+                for _ in range(_args.iterations):
+                    _written = [_serializer.dumps(_data, compact=_compact) for _data in _json_data]  # type: typing.List[bytes]
+                    _size += sum(len(_doc) for _doc in _written)
+                _write_time = time.perf_counter() - _t0  # type: float
+
+                _t0 = time.perf_counter()
+                for _ in range(_args.iterations):
+                    for _doc in _written:  # type: bytes
+                        _serializer.loads(_doc)
+                _read_time = time.perf_counter() - _t0  # type: float
+
+                scenario.logging.info(
+                    f"{_serializer.name:>6} {'compact' if _compact else 'indent':>7}: "
+                    f"size {_size // _args.iterations:>10} bytes, "
+                    f"write {_size / _write_time / 1e6:7.1f} MB/s ({len(_docs) * _args.iterations / _write_time:7.0f} reports/s), "
+                    f"read {_size / _read_time / 1e6:7.1f} MB/s ({len(_docs) * _args.iterations / _read_time:7.0f} reports/s)"
+                )
+
+
+if __name__ == "__main__":
+    BenchJson().run()
@@ -57,14 +57,15 @@ class UpdateTestData:
         _test_data = TestData(scenario.test.paths.CONFIG_DB_SCENARIO, {
             "set": "ConfigDbScenario.step000",
         })  # type: TestData
-        updatefile(
-            scenario.tools.paths.TEST_CASES_PATH / "configdb" / "configdb020.py", _test_data,
-            lambda file_updater, line: file_updater.matchmodifyline(
-                rb'^(.* )\d+(,.* {2}# location: CONFIG_DB_SCENARIO/set)$', line,
-                filter_match=None, location_key=lambda match: "set",
-                new_line=lambda match, location: b'%s%d%s' % (match.group(1), location.line, match.group(2)),
-            ),
-        )
+        for _test_case in ("configdb020.py", "configdb025.py"):  # type: str
+            updatefile(
+                scenario.tools.paths.TEST_CASES_PATH / "configdb" / _test_case, _test_data,
+                lambda file_updater, line: file_updater.matchmodifyline(
+                    rb'^(.* )\d+(,.* {2}# location: CONFIG_DB_SCENARIO/set)$', line,
+                    filter_match=None, location_key=lambda match: "set",
+                    new_line=lambda match, location: b'%s%d%s' % (match.group(1), location.line, match.group(2)),
+                ),
+            )
 
     def _updatefailingscenario(self):  # type: (...) -> None
         _test_data = TestData(scenario.test.paths.FAILING_SCENARIO, {